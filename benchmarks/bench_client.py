@@ -0,0 +1,239 @@
+"""Benchmark of the clients against the local mock AccuWeather server.
+
+Measures the requests per second and the p50/p99 latency of location lookups
+and weather requests, sequentially and with `fetch_many`, the cost of parsing
+each model, and the memory held per location. With zero server latency the
+numbers are dominated by the client overhead.
+
+The server runs in this process by default, so it competes with the client
+for the GIL; start it separately with
+`python -m accuweather_client.testing.server` and pass `--server-url` for
+cleaner throughput numbers. `--processes` adds a run of
+`fetch_many_processes` with that many worker processes, which includes the
+start-up of the workers.
+
+Usage:
+    python benchmarks/bench_client.py [--locations 200] [--concurrency 16]
+        [--latency 0.0] [--error-rate 0.0] [--processes 0]
+        [--server-url URL] [--json]
+"""
+
+import argparse
+import gc
+import json
+import math
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from bench_parsing import CASES, best_of
+
+from accuweather_client.clients import (
+    WeatherClient,
+    fetch_many,
+    fetch_many_processes,
+    get_location_model,
+)
+from accuweather_client.http import Transport
+from accuweather_client.testing import MockAccuWeatherServer
+
+TOKEN = "a" * 32
+ENDPOINT_METHODS = (
+    "get_5day_forecast",
+    "get_hourly_forecast_12h",
+    "get_current_conditions",
+)
+
+
+def percentile(values: List[float], percentile: float) -> float:
+    """Returns a percentile of a sorted list by nearest rank."""
+    index = math.ceil(percentile / 100 * len(values)) - 1
+    return values[min(max(index, 0), len(values) - 1)]
+
+
+def summarize(timings: List[float], elapsed: float) -> Dict[str, float]:
+    """Returns the throughput and latency summary of a run."""
+    timings = sorted(timings)
+    return {
+        "requests": len(timings),
+        "req_per_s": len(timings) / elapsed,
+        "p50_ms": percentile(timings, 50) * 1000,
+        "p99_ms": percentile(timings, 99) * 1000,
+    }
+
+
+def timed(calls: List[Callable[[], object]]) -> Dict[str, float]:
+    """Runs calls one after the other, timing each."""
+    timings = []
+    start = time.perf_counter()
+    for call in calls:
+        call_start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - call_start)
+    return summarize(timings, time.perf_counter() - start)
+
+
+def bench_location_lookups(url: str, count: int, transport: Transport):
+    return timed(
+        [
+            lambda i=i: get_location_model(
+                token=TOKEN,
+                city=f"city {i}",
+                api_root=url,
+                transport=transport,
+            )
+            for i in range(count)
+        ]
+    )
+
+
+def bench_weather_sequential(url: str, count: int, transport: Transport):
+    clients = [
+        WeatherClient(
+            token=TOKEN,
+            location_key=str(100000 + i),
+            base_url=url,
+            transport=transport,
+        )
+        for i in range(count)
+    ]
+    return timed(
+        [
+            getattr(client, method)
+            for client in clients
+            for method in ENDPOINT_METHODS
+        ]
+    )
+
+
+def bench_fetch_many(url: str, count: int, concurrency: int):
+    timings = []
+    start = time.perf_counter()
+    for result in fetch_many(
+        ({"city": f"city {i}"} for i in range(count)),
+        TOKEN,
+        base_url=url,
+        max_concurrency=concurrency,
+    ):
+        timings.extend(result.timings.values())
+    return summarize(timings, time.perf_counter() - start)
+
+
+def bench_fetch_many_processes(
+    url: str, count: int, concurrency: int, processes: int
+):
+    timings = []
+    start = time.perf_counter()
+    for result in fetch_many_processes(
+        ({"city": f"city {i}"} for i in range(count)),
+        TOKEN,
+        base_url=url,
+        processes=processes,
+        threads=max(concurrency // processes, 1),
+    ):
+        timings.extend(result.timings.values())
+    return summarize(timings, time.perf_counter() - start)
+
+
+def bench_parsing(number: int) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for name, (content, standard, fast) in CASES.items():
+        results[name] = {
+            "standard_us": best_of(
+                lambda: standard(json.loads(content)), number
+            ),
+            "fast_us": best_of(lambda: fast(content), number),
+        }
+    return results
+
+
+def bench_memory(url: str, count: int, transport: Transport) -> Dict:
+    """Measures the memory held per location by a client and its models."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    held = []
+    for i in range(count):
+        client = WeatherClient(
+            token=TOKEN, city=f"city {i}", base_url=url, transport=transport
+        )
+        held.append(
+            (client, *(getattr(client, m)() for m in ENDPOINT_METHODS))
+        )
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return {"bytes_per_location": (after - before) / count}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--locations", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--number", type=int, default=500)
+    parser.add_argument("--processes", type=int, default=0)
+    parser.add_argument("--server-url")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    server = None
+    url = args.server_url
+    if url is None:
+        server = MockAccuWeatherServer(
+            latency=args.latency, error_rate=args.error_rate, seed=0
+        ).start()
+        url = server.url
+    results = {}
+    try:
+        with Transport(pool_maxsize=args.concurrency) as transport:
+            results["location lookups"] = bench_location_lookups(
+                url, args.locations, transport
+            )
+            results["weather sequential"] = bench_weather_sequential(
+                url, args.locations, transport
+            )
+            results["fetch_many"] = bench_fetch_many(
+                url, args.locations, args.concurrency
+            )
+            if args.processes:
+                results["fetch_many processes"] = bench_fetch_many_processes(
+                    url, args.locations, args.concurrency, args.processes
+                )
+            memory = bench_memory(url, args.locations, transport)
+        parsing = bench_parsing(args.number)
+    finally:
+        if server is not None:
+            server.stop()
+
+    if args.json:
+        print(
+            json.dumps(
+                {"requests": results, "parsing": parsing, "memory": memory},
+                indent=2,
+            )
+        )
+        return
+    print(f"{'run':<22}{'requests':>9}{'req/s':>10}{'p50':>10}{'p99':>10}")
+    for name, summary in results.items():
+        print(
+            f"{name:<22}{summary['requests']:>9}{summary['req_per_s']:>10.0f}"
+            f"{summary['p50_ms']:>8.2f}ms{summary['p99_ms']:>8.2f}ms"
+        )
+    print()
+    print(f"{'model parsing':<22}{'standard':>12}{'fast':>12}")
+    for name, timing in parsing.items():
+        print(
+            f"{name:<22}{timing['standard_us']:>10.1f}us"
+            f"{timing['fast_us']:>10.1f}us"
+        )
+    print()
+    print(
+        f"memory per location (client and 3 models): "
+        f"{memory['bytes_per_location'] / 1024:.1f} KiB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Benchmark of the time it takes to import accuweather_client.
+
+Every run imports the package in a fresh interpreter, after its required
+dependencies pydantic and requests, so the time of the package itself is
+measured apart from theirs. The script exits with a non-zero status when the
+median import time of the package exceeds its budget, or when one of the
+optional heavy dependencies is imported eagerly, so it can guard against
+import-time regressions. `tests/test_import_time.py` runs it with the
+default budget.
+
+The budget is relative to the import time of the dependencies, which keeps
+it meaningful on slower and faster machines. The package takes about 2.3
+times as long as pydantic and requests to import.
+
+Usage:
+    python benchmarks/bench_import.py [--runs 10] [--max-ratio 2.8]
+        [--budget-ms 400]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+# Optional dependencies that must only be imported when they are used
+LAZY_MODULES = ["pandas", "numpy", "pyarrow", "httpx"]
+
+# Modules of the package that must import without the optional dependencies
+CORE_MODULES = [
+    "accuweather_client.clients",
+    "accuweather_client.models",
+    "accuweather_client.cache",
+    "accuweather_client.http",
+    "accuweather_client.cli",
+]
+
+PROBE = f"""
+import importlib, json, sys, time
+start = time.perf_counter()
+import pydantic, requests
+dependencies = time.perf_counter() - start
+start = time.perf_counter()
+import accuweather_client
+package = time.perf_counter() - start
+for name in {CORE_MODULES!r}:
+    importlib.import_module(name)
+print(json.dumps({{
+    "dependencies_ms": dependencies * 1000,
+    "package_ms": package * 1000,
+    "eager": [name for name in {LAZY_MODULES!r} if name in sys.modules],
+}}))
+"""
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument(
+        "--max-ratio",
+        type=float,
+        default=2.8,
+        help="budget of the package relative to its dependencies",
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        help="absolute budget of the package in milliseconds",
+    )
+    args = parser.parse_args(argv)
+
+    results = [
+        json.loads(
+            subprocess.run(
+                [sys.executable, "-c", PROBE],
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout
+        )
+        for _ in range(args.runs)
+    ]
+    package = statistics.median(result["package_ms"] for result in results)
+    dependencies = statistics.median(
+        result["dependencies_ms"] for result in results
+    )
+    # Per run, so that a slow or fast interpreter start affects both times
+    ratio = statistics.median(
+        result["package_ms"] / result["dependencies_ms"] for result in results
+    )
+    print(
+        f"import accuweather_client: median {package:.1f}ms on top of "
+        f"{dependencies:.1f}ms for pydantic and requests, ratio "
+        f"{ratio:.2f} over {args.runs} runs (budget {args.max_ratio:.2f})"
+    )
+
+    failed = False
+    eager = sorted({name for result in results for name in result["eager"]})
+    if eager:
+        print(f"FAIL: imported eagerly: {', '.join(eager)}")
+        failed = True
+    if ratio > args.max_ratio:
+        print(
+            "FAIL: import time relative to the dependencies exceeds the budget"
+        )
+        failed = True
+    if args.budget_ms is not None and package > args.budget_ms:
+        print("FAIL: median import time exceeds the budget")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
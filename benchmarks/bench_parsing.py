@@ -0,0 +1,98 @@
+"""Benchmark of the standard and the fast parsing paths of the models.
+
+The standard path decodes a response body with `json.loads` and validates the
+resulting dictionaries, the fast path validates the raw bytes directly. The
+projected case parses only two fields of each hour. Current conditions are
+measured as the typed observations of `get_current_observations`, since
+`CurrentConditionsModel` keeps the raw dictionaries on both paths.
+
+Usage:
+    python benchmarks/bench_parsing.py [--number 2000]
+"""
+
+import argparse
+import json
+import timeit
+
+from accuweather_client.models import (
+    ForecastModel5Days,
+    HourlyForecastModel,
+    LocationModel,
+    project,
+)
+from accuweather_client.models.weather import CURRENT_OBSERVATIONS
+from accuweather_client.testing import (
+    current_conditions,
+    daily_forecast,
+    hourly_forecast,
+    location_search,
+)
+
+CASES = {
+    "location search": (
+        json.dumps(location_search()).encode(),
+        lambda data: LocationModel(response=data),
+        LocationModel.from_json,
+    ),
+    "daily 5 days": (
+        json.dumps(daily_forecast(5)).encode(),
+        ForecastModel5Days.from_api_response,
+        ForecastModel5Days.from_json,
+    ),
+    "hourly 12 hours": (
+        json.dumps(hourly_forecast(12)).encode(),
+        lambda data: HourlyForecastModel(output=data),
+        HourlyForecastModel.from_json,
+    ),
+    "current observations": (
+        json.dumps(current_conditions()).encode(),
+        CURRENT_OBSERVATIONS.validate_python,
+        CURRENT_OBSERVATIONS.validate_json,
+    ),
+}
+
+# Hourly temperatures only, see `accuweather_client.models.project`
+HourlyTemperatures = project(
+    HourlyForecastModel,
+    ["output.epoch_date_time", "output.temperature.value"],
+)
+CASES["hourly projected"] = (
+    CASES["hourly 12 hours"][0],
+    HourlyTemperatures.from_api_response,
+    HourlyTemperatures.from_json,
+)
+
+
+def best_of(funcs, number: int, repeat: int = 5) -> list:
+    """Returns the best time per call of each function in microseconds. The
+    functions take turns, so that warm-up and drifts of the clock speed
+    affect all of them alike."""
+    times = [[] for _ in funcs]
+    for _ in range(repeat):
+        for func, samples in zip(funcs, times):
+            samples.append(timeit.timeit(func, number=number))
+    return [min(samples) / number * 1e6 for samples in times]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(
+        f"{'payload':<20}{'bytes':>8}{'standard':>12}{'fast':>12}{'speedup':>9}"
+    )
+    for name, (content, standard, fast) in CASES.items():
+        assert standard(json.loads(content)) == fast(content)
+        standard_us, fast_us = best_of(
+            [lambda: standard(json.loads(content)), lambda: fast(content)],
+            args.number,
+        )
+        print(
+            f"{name:<20}{len(content):>8}{standard_us:>10.1f}us"
+            f"{fast_us:>10.1f}us{standard_us / fast_us:>8.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
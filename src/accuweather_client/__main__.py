@@ -0,0 +1,5 @@
+import sys
+
+from accuweather_client.cli import main
+
+sys.exit(main())
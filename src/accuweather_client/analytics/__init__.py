@@ -0,0 +1,3 @@
+from .derived import convert_speed, convert_temperature  # noqa: F401
+from .derived import heat_index, wind_chill  # noqa: F401
+from .forecasts import ForecastBatch  # noqa: F401
@@ -0,0 +1,166 @@
+"""
+derived.py
+
+This module converts units and derives weather quantities on NumPy arrays,
+one value per row of many forecasts at once. Units are identified by the
+`UnitType` codes of the AccuWeather API, e.g. 17 for °C and 18 for °F.
+
+Functions:
+    - convert_temperature: Converts temperatures between °C and °F.
+    - convert_speed: Converts speeds between km/h, mi/h, m/s and knots.
+    - heat_index: Computes the heat index of the US National Weather
+      Service.
+    - wind_chill: Computes the wind chill of the US National Weather Service.
+"""
+
+from typing import Any
+
+from accuweather_client.models.columns import require_numpy
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+# UnitType codes of the API
+CELSIUS = 17
+FAHRENHEIT = 18
+KILOMETERS_PER_HOUR = 7
+KNOTS = 8
+MILES_PER_HOUR = 9
+METERS_PER_SECOND = 10
+
+# Kilometers per hour per unit of each speed UnitType
+SPEED_FACTORS = {
+    KILOMETERS_PER_HOUR: 1.0,
+    KNOTS: 1.852,
+    MILES_PER_HOUR: 1.609344,
+    METERS_PER_SECOND: 3.6,
+}
+
+
+def convert_temperature(
+    values: Any, unit_types: Any, to_unit_type: int
+) -> "np.ndarray":
+    """
+    Converts temperatures between °C and °F.
+
+    Args:
+        values (array-like): The temperatures.
+        unit_types (array-like): The UnitType of each temperature, or one
+        UnitType for all of them.
+        to_unit_type (int): The UnitType to convert to, 17 or 18.
+
+    Returns:
+        np.ndarray: The converted temperatures as floats.
+
+    Raises:
+        ValueError: If a UnitType is not a temperature unit.
+    """
+    require_numpy("the analytics")
+    values = np.asarray(values, dtype=np.float64)
+    unit_types = np.broadcast_to(np.asarray(unit_types), values.shape)
+    if (
+        to_unit_type not in (CELSIUS, FAHRENHEIT)
+        or not np.isin(unit_types, (CELSIUS, FAHRENHEIT, -1)).all()
+    ):
+        raise ValueError("Temperatures convert between °C (17) and °F (18).")
+    if to_unit_type == CELSIUS:
+        return np.where(
+            unit_types == FAHRENHEIT, (values - 32.0) * 5.0 / 9.0, values
+        )
+    return np.where(unit_types == CELSIUS, values * 9.0 / 5.0 + 32.0, values)
+
+
+def convert_speed(
+    values: Any, unit_types: Any, to_unit_type: int
+) -> "np.ndarray":
+    """
+    Converts speeds between km/h (7), knots (8), mi/h (9) and m/s (10).
+
+    Args:
+        values (array-like): The speeds.
+        unit_types (array-like): The UnitType of each speed, or one UnitType
+        for all of them.
+        to_unit_type (int): The UnitType to convert to.
+
+    Returns:
+        np.ndarray: The converted speeds as floats.
+
+    Raises:
+        ValueError: If a UnitType is not a speed unit.
+    """
+    require_numpy("the analytics")
+    values = np.asarray(values, dtype=np.float64)
+    unit_types = np.broadcast_to(np.asarray(unit_types), values.shape)
+    if (
+        to_unit_type not in SPEED_FACTORS
+        or not np.isin(unit_types, (*SPEED_FACTORS, -1)).all()
+    ):
+        raise ValueError(
+            f"Speeds convert between the UnitTypes {sorted(SPEED_FACTORS)}."
+        )
+    factors = np.ones(values.shape)
+    for unit_type, factor in SPEED_FACTORS.items():
+        factors[unit_types == unit_type] = factor
+    return values * factors / SPEED_FACTORS[to_unit_type]
+
+
+def heat_index(temperature: Any, relative_humidity: Any) -> "np.ndarray":
+    """
+    Computes the heat index of the US National Weather Service: the
+    Rothfusz regression with its low and high humidity adjustments, and
+    Steadman's simple formula below 80 °F.
+
+    Args:
+        temperature (array-like): The air temperatures in °F.
+        relative_humidity (array-like): The relative humidities in percent.
+
+    Returns:
+        np.ndarray: The heat indices in °F.
+    """
+    require_numpy("the analytics")
+    t = np.asarray(temperature, dtype=np.float64)
+    rh = np.asarray(relative_humidity, dtype=np.float64)
+    simple = 0.5 * (t + 61.0 + (t - 68.0) * 1.2 + rh * 0.094)
+    regression = (
+        -42.379
+        + 2.04901523 * t
+        + 10.14333127 * rh
+        - 0.22475541 * t * rh
+        - 6.83783e-3 * t * t
+        - 5.481717e-2 * rh * rh
+        + 1.22874e-3 * t * t * rh
+        + 8.5282e-4 * t * rh * rh
+        - 1.99e-6 * t * t * rh * rh
+    )
+    dry = (rh < 13.0) & (t >= 80.0) & (t <= 112.0)
+    regression[dry] -= ((13.0 - rh[dry]) / 4.0) * np.sqrt(
+        (17.0 - np.abs(t[dry] - 95.0)) / 17.0
+    )
+    humid = (rh > 85.0) & (t >= 80.0) & (t <= 87.0)
+    regression[humid] += ((rh[humid] - 85.0) / 10.0) * (
+        (87.0 - t[humid]) / 5.0
+    )
+    return np.where((simple + t) / 2.0 >= 80.0, regression, simple)
+
+
+def wind_chill(temperature: Any, wind_speed: Any) -> "np.ndarray":
+    """
+    Computes the wind chill of the US National Weather Service. Outside of
+    its range, above 50 °F or below 3 mi/h of wind, the wind chill is the
+    air temperature.
+
+    Args:
+        temperature (array-like): The air temperatures in °F.
+        wind_speed (array-like): The wind speeds in mi/h.
+
+    Returns:
+        np.ndarray: The wind chills in °F.
+    """
+    require_numpy("the analytics")
+    t = np.asarray(temperature, dtype=np.float64)
+    v = np.asarray(wind_speed, dtype=np.float64)
+    power = np.power(np.maximum(v, 0.0), 0.16)
+    chill = 35.74 + 0.6215 * t - 35.75 * power + 0.4275 * t * power
+    return np.where((t <= 50.0) & (v >= 3.0), chill, t)
@@ -0,0 +1,484 @@
+"""
+forecasts.py
+
+This module analyses the daily or hourly forecasts of many locations at once.
+A `ForecastBatch` holds one NumPy column per forecast field with a row per
+location and forecast day or hour, read straight from the forecast models or
+from the raw API payloads without building a model per row. Threshold
+alerts, rollups per country or administrative area, unit conversion and
+derived fields are computed on whole columns. The numeric columns are those
+of `accuweather_client.models.columns`.
+
+The module requires the optional `numpy` dependency, which is installed with
+`pip install accuweather_client[numpy]`. `to_pandas` requires pandas.
+
+Example:
+    batch = ForecastBatch.from_models(
+        "daily", {key: result.results["daily"] for ...}, locations
+    )
+    alerts = batch.alert(
+        {"temperature_max": (">", 30), "day_precipitation_probability":
+         (">", 60)},
+        index=1,
+    )
+    batch.rollup(["temperature_max"], by="administrative_area")
+
+Classes:
+    - ForecastBatch: Columns of the forecasts of many locations.
+"""
+
+import json
+import operator
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple
+
+from accuweather_client.analytics.derived import (
+    CELSIUS,
+    FAHRENHEIT,
+    KILOMETERS_PER_HOUR,
+    MILES_PER_HOUR,
+    convert_speed,
+    convert_temperature,
+    heat_index,
+    wind_chill,
+)
+from accuweather_client.models import LocationModelItem
+from accuweather_client.models.columns import (
+    COLUMNS,
+    NUMPY_TYPES,
+    ROW_MODELS,
+    column_values,
+    missing_value,
+    require_numpy,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+# Analytics hold the integer measurements as doubles too, so that missing
+# values are NaN
+ANALYTICS_TYPES: Dict[str, str] = {**NUMPY_TYPES, "int16": "<f8"}
+
+# The value columns converted with the unit column of their row
+UNIT_COLUMNS = {
+    "daily": {
+        "temperature_unit_type": ("temperature_min", "temperature_max"),
+        "wind_speed_unit_type": (
+            "day_wind_speed",
+            "day_wind_gust_speed",
+            "night_wind_speed",
+            "night_wind_gust_speed",
+        ),
+    },
+    "hourly": {
+        "temperature_unit_type": (
+            "temperature",
+            "real_feel_temperature",
+            "real_feel_temperature_shade",
+            "wet_bulb_temperature",
+            "dew_point",
+        ),
+        "wind_speed_unit_type": ("wind_speed", "wind_gust_speed"),
+    },
+}
+
+OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+# Field names of the columns added from the locations
+REGIONS = ("country", "administrative_area")
+
+
+def _rows_of(kind: str, forecast: Any) -> Sequence[Any]:
+    """Returns the rows of a model, projection or decoded payload."""
+    if isinstance(forecast, (bytes, str)):
+        forecast = json.loads(forecast)
+    if isinstance(forecast, list):
+        return forecast
+    if isinstance(forecast, dict):
+        return forecast.get("DailyForecasts") or forecast.get("output") or []
+    return forecast.daily_forecasts if kind == "daily" else forecast.output
+
+
+class ForecastBatch:
+    """
+    Columns of the daily or hourly forecasts of many locations, one row per
+    location and forecast day or hour.
+
+    Besides the forecast fields, the column "location_key" holds the
+    location of each row and "index" the position of the row in its
+    forecast, e.g. 1 for tomorrow in daily forecasts. Batches built with
+    locations have "country" and "administrative_area" columns, the latter
+    prefixed with the country, e.g. "AU-NSW". Missing values are NaN for
+    floats and -1 for integers.
+
+    Attributes:
+        kind (str): "daily" or "hourly".
+        columns (Dict[str, np.ndarray]): The values per column.
+    """
+
+    __slots__ = ("kind", "columns")
+
+    def __init__(self, kind: str, columns: Dict[str, "np.ndarray"]) -> None:
+        require_numpy("the analytics")
+        if kind not in COLUMNS:
+            raise ValueError(
+                f"Unknown forecast kind {kind!r}, use daily or hourly."
+            )
+        self.kind = kind
+        self.columns = columns
+
+    @classmethod
+    def _build(
+        cls,
+        kind: str,
+        forecasts: Mapping[str, Any],
+        locations: Optional[Mapping[str, LocationModelItem]],
+        payload: bool,
+    ) -> "ForecastBatch":
+        require_numpy("the analytics")
+        if kind not in COLUMNS:
+            raise ValueError(
+                f"Unknown forecast kind {kind!r}, use daily or hourly."
+            )
+        keys = list(forecasts)
+        per_location = [_rows_of(kind, forecasts[key]) for key in keys]
+        counts = np.array([len(rows) for rows in per_location], dtype=np.int64)
+        rows = [row for location_rows in per_location for row in location_rows]
+        columns: Dict[str, np.ndarray] = {
+            "location_key": np.repeat(np.array(keys, dtype=object), counts),
+            "index": (
+                np.arange(len(rows))
+                - np.repeat(np.cumsum(counts) - counts, counts)
+            ).astype(np.int16),
+        }
+        for column in COLUMNS[kind]:
+            dtype = ANALYTICS_TYPES.get(column.type)
+            if dtype is None:
+                continue
+            values = column_values(
+                rows, ROW_MODELS[kind], column.path, payload
+            )
+            missing = missing_value(dtype)
+            columns[column.name] = np.array(
+                [missing if value is None else value for value in values],
+                dtype=dtype,
+            )
+        if locations is not None:
+            regions = [_regions(locations.get(key)) for key in keys]
+            for i, region in enumerate(REGIONS):
+                values = np.array(
+                    [names[i] for names in regions], dtype=object
+                )
+                columns[region] = np.repeat(values, counts)
+        return cls(kind, columns)
+
+    @classmethod
+    def from_models(
+        cls,
+        kind: str,
+        forecasts: Mapping[str, Any],
+        locations: Optional[Mapping[str, LocationModelItem]] = None,
+    ) -> "ForecastBatch":
+        """
+        Builds the columns of forecast models.
+
+        Args:
+            kind (str): "daily" or "hourly".
+            forecasts (Mapping[str, Any]): The `ForecastModel5Days` or
+            `HourlyForecastModel` per location key, or projections of them.
+            Fields that were not selected are missing values.
+            locations (Optional[Mapping[str, LocationModelItem]]): The
+            location per location key, for the region columns.
+
+        Returns:
+            ForecastBatch: The columns.
+
+        Raises:
+            ValueError: If the kind is unknown.
+        """
+        return cls._build(kind, forecasts, locations, payload=False)
+
+    @classmethod
+    def from_payloads(
+        cls,
+        kind: str,
+        payloads: Mapping[str, Any],
+        locations: Optional[Mapping[str, LocationModelItem]] = None,
+    ) -> "ForecastBatch":
+        """
+        Builds the columns of raw API payloads, without validating them
+        into models first.
+
+        Args:
+            kind (str): "daily" or "hourly".
+            payloads (Mapping[str, Any]): The JSON body per location key, as
+            bytes, text or decoded JSON.
+            locations (Optional[Mapping[str, LocationModelItem]]): The
+            location per location key, for the region columns.
+
+        Returns:
+            ForecastBatch: The columns.
+
+        Raises:
+            ValueError: If the kind is unknown.
+        """
+        return cls._build(kind, payloads, locations, payload=True)
+
+    def __len__(self) -> int:
+        return len(self.columns["location_key"])
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.columns
+
+    def __getitem__(self, name: str) -> "np.ndarray":
+        return self.columns[name]
+
+    def select(self, mask: Any) -> "ForecastBatch":
+        """
+        Returns the rows selected by a boolean mask or an index array.
+
+        Args:
+            mask (array-like): The rows to keep, e.g.
+            `batch["temperature"] > 30`.
+
+        Returns:
+            ForecastBatch: The selected rows.
+        """
+        return ForecastBatch(
+            self.kind,
+            {name: column[mask] for name, column in self.columns.items()},
+        )
+
+    def at(self, index: int) -> "ForecastBatch":
+        """
+        Returns the rows at a position of their forecast, e.g. 1 for the
+        forecast of tomorrow in daily forecasts.
+
+        Args:
+            index (int): The position of the day or hour.
+
+        Returns:
+            ForecastBatch: The selected rows, one per location.
+        """
+        return self.select(self.columns["index"] == index)
+
+    def alert(
+        self,
+        rules: Mapping[str, Tuple[str, float]],
+        index: Optional[int] = None,
+    ) -> "np.ndarray":
+        """
+        Returns the locations with a row that meets all threshold rules.
+
+        Args:
+            rules (Mapping[str, Tuple[str, float]]): The comparison operator,
+            one of >, >=, <, <=, == and !=, and the threshold per column,
+            e.g. {"temperature_max": (">", 30)}. Missing values never meet
+            a rule.
+            index (Optional[int]): Only checks the rows at this position of
+            their forecast, e.g. 1 for tomorrow.
+
+        Returns:
+            np.ndarray: The location keys, sorted.
+
+        Raises:
+            ValueError: If an operator is unknown.
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if index is not None:
+            mask &= self.columns["index"] == index
+        for name, (symbol, threshold) in rules.items():
+            compare = OPERATORS.get(symbol)
+            if compare is None:
+                raise ValueError(
+                    f"Unknown operator {symbol!r}, choose from "
+                    f"{list(OPERATORS)}."
+                )
+            mask &= compare(self.columns[name], threshold)
+        return np.unique(self.columns["location_key"][mask].astype(str))
+
+    def rollup(
+        self,
+        columns: Sequence[str],
+        by: str = "country",
+        stats: Sequence[str] = ("min", "max", "mean"),
+    ) -> Dict[str, "np.ndarray"]:
+        """
+        Aggregates columns per group, ignoring missing values.
+
+        Args:
+            columns (Sequence[str]): The columns to aggregate.
+            by (str): The column to group by, e.g. "country",
+            "administrative_area", "location_key" or "index".
+            stats (Sequence[str]): Any of "min", "max" and "mean".
+
+        Returns:
+            Dict[str, np.ndarray]: The groups under `by`, their number of
+            rows under "count", and a column per aggregated column and
+            statistic, e.g. "temperature_max_mean". Pass it to
+            `pandas.DataFrame` for a table.
+
+        Raises:
+            ValueError: If a statistic is unknown.
+            KeyError: If the batch has no column `by`, e.g. because it was
+            built without locations.
+        """
+        unknown = set(stats) - {"min", "max", "mean"}
+        if unknown:
+            raise ValueError(
+                f"Unknown statistics {sorted(unknown)}, choose from "
+                "min, max and mean."
+            )
+        groups, inverse = np.unique(self.columns[by], return_inverse=True)
+        order = np.argsort(inverse, kind="stable")
+        starts = np.searchsorted(inverse[order], np.arange(len(groups)))
+        result = {
+            by: groups,
+            "count": np.bincount(inverse, minlength=len(groups)),
+        }
+        if not len(groups):
+            for name in columns:
+                for stat in stats:
+                    result[f"{name}_{stat}"] = np.empty(0)
+            return result
+        for name in columns:
+            values = self.columns[name][order].astype(np.float64)
+            present = ~np.isnan(values)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                if "min" in stats:
+                    result[f"{name}_min"] = np.fmin.reduceat(values, starts)
+                if "max" in stats:
+                    result[f"{name}_max"] = np.fmax.reduceat(values, starts)
+                if "mean" in stats:
+                    result[f"{name}_mean"] = np.add.reduceat(
+                        np.where(present, values, 0.0), starts
+                    ) / np.add.reduceat(present, starts)
+        return result
+
+    def to_units(self, metric: bool = True) -> "ForecastBatch":
+        """
+        Converts the temperatures and speeds of all rows to one unit
+        system: °C and km/h, or °F and mi/h.
+
+        Args:
+            metric (bool): Whether to convert to metric units.
+
+        Returns:
+            ForecastBatch: The converted rows.
+        """
+        targets = {
+            "temperature_unit_type": (
+                convert_temperature,
+                CELSIUS if metric else FAHRENHEIT,
+            ),
+            "wind_speed_unit_type": (
+                convert_speed,
+                KILOMETERS_PER_HOUR if metric else MILES_PER_HOUR,
+            ),
+        }
+        columns = dict(self.columns)
+        for unit_column, names in UNIT_COLUMNS[self.kind].items():
+            convert, unit_type = targets[unit_column]
+            for name in names:
+                columns[name] = convert(
+                    columns[name], columns[unit_column], unit_type
+                )
+            columns[unit_column] = np.where(
+                columns[unit_column] == -1, -1, unit_type
+            ).astype(np.int8)
+        return ForecastBatch(self.kind, columns)
+
+    def _fahrenheit(self, name: str) -> "np.ndarray":
+        return convert_temperature(
+            self.columns[name],
+            self.columns["temperature_unit_type"],
+            FAHRENHEIT,
+        )
+
+    def _in_row_units(self, values: "np.ndarray") -> "np.ndarray":
+        """Converts °F values back to the temperature unit of each row."""
+        return np.where(
+            self.columns["temperature_unit_type"] == CELSIUS,
+            convert_temperature(values, FAHRENHEIT, CELSIUS),
+            values,
+        )
+
+    def with_heat_index(self) -> "ForecastBatch":
+        """
+        Adds the "heat_index" column of hourly forecasts, in the
+        temperature unit of each row.
+
+        Returns:
+            ForecastBatch: The rows with the derived column.
+
+        Raises:
+            ValueError: If the batch has no relative humidity, i.e. daily
+            forecasts.
+        """
+        if "relative_humidity" not in self.columns:
+            raise ValueError("The heat index needs hourly forecasts.")
+        values = heat_index(
+            self._fahrenheit("temperature"), self.columns["relative_humidity"]
+        )
+        return ForecastBatch(
+            self.kind,
+            {**self.columns, "heat_index": self._in_row_units(values)},
+        )
+
+    def with_wind_chill(self) -> "ForecastBatch":
+        """
+        Adds the "wind_chill" column of hourly forecasts, in the
+        temperature unit of each row.
+
+        Returns:
+            ForecastBatch: The rows with the derived column.
+
+        Raises:
+            ValueError: If the batch is not of hourly forecasts.
+        """
+        if self.kind != "hourly":
+            raise ValueError("The wind chill needs hourly forecasts.")
+        values = wind_chill(
+            self._fahrenheit("temperature"),
+            convert_speed(
+                self.columns["wind_speed"],
+                self.columns["wind_speed_unit_type"],
+                MILES_PER_HOUR,
+            ),
+        )
+        return ForecastBatch(
+            self.kind,
+            {**self.columns, "wind_chill": self._in_row_units(values)},
+        )
+
+    def to_pandas(self) -> "pd.DataFrame":  # noqa: F821
+        """
+        Converts the columns to a pandas DataFrame.
+
+        Returns:
+            pd.DataFrame: One column per batch column.
+        """
+        try:
+            import pandas as pd
+        except ImportError as e:
+            raise ImportError(
+                "pandas is required to export the batch to a DataFrame."
+            ) from e
+        return pd.DataFrame(self.columns)
+
+
+def _regions(location: Optional[LocationModelItem]) -> Tuple[str, str]:
+    """Returns the country and administrative area of a location."""
+    if location is None:
+        return "", ""
+    country = location.Country.ID
+    return country, f"{country}-{location.AdministrativeArea.ID}"
@@ -0,0 +1,7 @@
+from .location import LocationCache, LRULocationCache  # noqa: F401
+from .location import SQLiteLocationCache, TieredLocationCache  # noqa: F401
+from .location import location_cache_key  # noqa: F401
+from .response import CacheEntry, ResponseCache  # noqa: F401
+from .response import ResponseCacheBackend, MemoryResponseBackend  # noqa: F401
+from .response import SQLiteResponseBackend  # noqa: F401
+from .geo import GeoIndex  # noqa: F401
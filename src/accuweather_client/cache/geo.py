@@ -0,0 +1,277 @@
+"""
+geo.py
+
+This module provides an in-memory spatial index of resolved AccuWeather
+locations. Coordinates close to a location that was resolved before are
+answered from the index, so only coordinates far from every known location
+reach the geoposition search of the API.
+
+The index is a grid of cells of a few kilometres keyed by their row and
+column; distances to the locations of the neighbouring cells are computed
+with NumPy, which is imported on first query.
+
+Classes:
+    - GeoIndex: Nearest-known-location index over latitude and longitude.
+"""
+
+import math
+import threading
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+from accuweather_client.models import LocationModelItem
+
+if TYPE_CHECKING:
+    import numpy as np
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "numpy is required for the geo index, install it with "
+            "`pip install accuweather-client[numpy]`."
+        ) from e
+    return numpy
+
+
+class GeoIndex:
+    """
+    Nearest-known-location index over latitude and longitude.
+
+    Attributes:
+        radius_km (float): The maximum distance in kilometres between a
+        query and the location it is answered with.
+        cell_size (float): The size of the grid cells in degrees.
+        stats (Dict[str, int]): The number of hits and misses.
+    """
+
+    def __init__(
+        self, radius_km: float = 10.0, cell_size: Optional[float] = None
+    ) -> None:
+        if radius_km <= 0:
+            raise ValueError("radius_km must be positive.")
+        self.radius_km = radius_km
+        self.cell_size = cell_size or max(radius_km / KM_PER_DEGREE, 0.01)
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0}
+        self._columns = math.ceil(360 / self.cell_size)
+        self._cells: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        self._items: List[LocationModelItem] = []
+        self._rows_by_key: Dict[str, int] = {}
+        self._latitudes: List[float] = []
+        self._longitudes: List[float] = []
+        self._coordinates: Optional["np.ndarray"] = None
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @classmethod
+    def from_items(
+        cls, items: Iterable[LocationModelItem], **kwargs
+    ) -> "GeoIndex":
+        """
+        Builds an index from resolved locations.
+
+        Args:
+            items (Iterable[LocationModelItem]): The locations.
+            **kwargs: Keyword arguments passed to the constructor.
+
+        Returns:
+            GeoIndex: The index.
+        """
+        index = cls(**kwargs)
+        for item in items:
+            index.add(item)
+        return index
+
+    def _cell(self, lat: float, lon: float) -> Tuple[int, int]:
+        row = math.floor((lat + 90) / self.cell_size)
+        column = math.floor((lon + 180) / self.cell_size) % self._columns
+        return row, column
+
+    def add(self, item: LocationModelItem) -> None:
+        """
+        Adds a location to the index, replacing an earlier location with
+        the same key.
+
+        Args:
+            item (LocationModelItem): The location.
+        """
+        lat = item.GeoPosition.Latitude
+        lon = item.GeoPosition.Longitude
+        with self._lock:
+            row = self._rows_by_key.get(item.Key)
+            if row is not None:
+                if (self._latitudes[row], self._longitudes[row]) == (lat, lon):
+                    self._items[row] = item
+                    return
+                old = self._cell(self._latitudes[row], self._longitudes[row])
+                self._cells[old].remove(row)
+                self._items[row] = item
+                self._latitudes[row] = lat
+                self._longitudes[row] = lon
+            else:
+                row = len(self._items)
+                self._rows_by_key[item.Key] = row
+                self._items.append(item)
+                self._latitudes.append(lat)
+                self._longitudes.append(lon)
+            self._cells[self._cell(lat, lon)].append(row)
+            self._coordinates = None
+
+    def _coordinates_array(self) -> "np.ndarray":
+        """Returns the latitudes and longitudes in radians, shape (n, 2)."""
+        np = _numpy()
+        with self._lock:
+            if self._coordinates is None or len(self._coordinates) != len(
+                self._items
+            ):
+                self._coordinates = np.radians(
+                    np.column_stack(
+                        [
+                            np.asarray(self._latitudes, dtype=np.float64),
+                            np.asarray(self._longitudes, dtype=np.float64),
+                        ]
+                    )
+                )
+            return self._coordinates
+
+    def _candidates(self, lat: float, lon: float) -> List[int]:
+        """Returns the rows of the cells within the radius of a point."""
+        span_rows = math.ceil(self.radius_km / KM_PER_DEGREE / self.cell_size)
+        row, column = self._cell(lat, lon)
+        # The same candidates serve every point of the cell
+        edge = max(
+            abs(row * self.cell_size - 90),
+            abs((row + 1) * self.cell_size - 90),
+        )
+        max_lat = min(edge + span_rows * self.cell_size, 90.0)
+        cos_lat = math.cos(math.radians(max_lat))
+        if cos_lat * self.cell_size * self._columns <= 2 * (
+            self.radius_km / KM_PER_DEGREE
+        ):
+            columns = range(self._columns)
+        else:
+            span_columns = math.ceil(
+                self.radius_km / (KM_PER_DEGREE * cos_lat) / self.cell_size
+            )
+            columns = {
+                (column + offset) % self._columns
+                for offset in range(-span_columns, span_columns + 1)
+            }
+        rows: List[int] = []
+        for cell_row in range(row - span_rows, row + span_rows + 1):
+            for cell_column in columns:
+                rows.extend(self._cells.get((cell_row, cell_column), ()))
+        return rows
+
+    def _nearest_rows(
+        self, lats: "np.ndarray", lons: "np.ndarray", candidates: List[int]
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Returns the nearest candidate row and its distance in kilometres for
+        each point, with -1 for points that have no candidate in the radius.
+        """
+        np = _numpy()
+        if not candidates:
+            return (
+                np.full(len(lats), -1, dtype=np.int64),
+                np.full(len(lats), np.inf),
+            )
+        rows = np.asarray(candidates, dtype=np.int64)
+        coordinates = self._coordinates_array()[rows]
+        lat1 = np.radians(lats)[:, None]
+        lon1 = np.radians(lons)[:, None]
+        lat2 = coordinates[None, :, 0]
+        lon2 = coordinates[None, :, 1]
+        # Haversine distance between every point and every candidate
+        a = (
+            np.sin((lat2 - lat1) / 2) ** 2
+            + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+        )
+        distances = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
+        nearest = distances.argmin(axis=1)
+        best = distances[np.arange(len(lats)), nearest]
+        result = np.where(best <= self.radius_km, rows[nearest], -1)
+        return result, best
+
+    def nearest(
+        self, lat: float, lon: float
+    ) -> Optional[Tuple[LocationModelItem, float]]:
+        """
+        Returns the known location nearest to a point within the radius.
+
+        Args:
+            lat (float): The latitude of the point.
+            lon (float): The longitude of the point.
+
+        Returns:
+            Optional[Tuple[LocationModelItem, float]]: The location and its
+            distance in kilometres, or None when no known location is within
+            the radius.
+        """
+        np = _numpy()
+        with self._lock:
+            candidates = self._candidates(lat, lon)
+            rows, distances = self._nearest_rows(
+                np.array([lat], dtype=np.float64),
+                np.array([lon], dtype=np.float64),
+                candidates,
+            )
+            row = int(rows[0])
+            if row < 0:
+                self.stats["misses"] += 1
+                return None
+            self.stats["hits"] += 1
+            return self._items[row], float(distances[0])
+
+    def lookup_many(
+        self, lats: Iterable[float], lons: Iterable[float]
+    ) -> List[Optional[str]]:
+        """
+        Returns the location key nearest to each point within the radius.
+        Points are grouped by grid cell, so millions of points around a few
+        thousand locations cost one distance matrix per cell.
+
+        Args:
+            lats (Iterable[float]): The latitudes of the points.
+            lons (Iterable[float]): The longitudes of the points.
+
+        Returns:
+            List[Optional[str]]: The location key per point, None on a miss.
+        """
+        np = _numpy()
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        result = np.full(len(lats), -1, dtype=np.int64)
+        cell_rows = np.floor((lats + 90) / self.cell_size).astype(np.int64)
+        cell_columns = (
+            np.floor((lons + 180) / self.cell_size).astype(np.int64)
+            % self._columns
+        )
+        cells = cell_rows * self._columns + cell_columns
+        order = np.argsort(cells, kind="stable")
+        boundaries = np.flatnonzero(np.diff(cells[order])) + 1
+        with self._lock:
+            for members in np.split(order, boundaries):
+                if not len(members):
+                    continue
+                first = members[0]
+                candidates = self._candidates(
+                    float(lats[first]), float(lons[first])
+                )
+                result[members], _ = self._nearest_rows(
+                    lats[members], lons[members], candidates
+                )
+            hits = int((result >= 0).sum())
+            self.stats["hits"] += hits
+            self.stats["misses"] += len(result) - hits
+            return [
+                self._items[row].Key if row >= 0 else None
+                for row in result.tolist()
+            ]
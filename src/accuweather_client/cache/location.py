@@ -0,0 +1,299 @@
+"""
+location.py
+
+This module provides pluggable caches for AccuWeather location lookups.
+Location keys hardly ever change, so a cached lookup saves both latency and
+API quota every time a client is created for a location that has been seen
+before.
+
+Classes:
+    - LocationCache: Abstract base class for location caches.
+    - LRULocationCache: In-process cache with least-recently-used eviction.
+    - SQLiteLocationCache: On-disk cache backed by SQLite, shared between
+      processes.
+    - TieredLocationCache: Combines an in-process tier with an on-disk tier.
+
+Functions:
+    - location_cache_key: Builds a normalized cache key for a location query.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Mapping, Optional
+
+
+def _normalize(text: str) -> str:
+    """Lower-cases a query string and collapses its whitespace."""
+    return " ".join(text.casefold().split())
+
+
+def location_cache_key(
+    city: str | None = None,
+    country: str | None = None,
+    poi: str | None = None,
+    lat: float | None = None,
+    lon: float | None = None,
+    precision: int = 2,
+    params: Optional[Mapping[str, str]] = None,
+) -> str:
+    """
+    Builds a normalized cache key for a location query.
+
+    City, country and POI names are case-folded and stripped of redundant
+    whitespace. Coordinates are rounded to `precision` decimals, so nearby
+    points share a single entry. The query parameters that shape the
+    response, e.g. `details` and `language`, are appended, so lookups with
+    different options do not share an entry. The API key is left out.
+
+    Args:
+        city (str, optional): The city name of the query.
+        country (str, optional): The country name of the query.
+        poi (str, optional): The Point of Interest of the query.
+        lat (float, optional): The latitude of the query.
+        lon (float, optional): The longitude of the query.
+        precision (int): The number of decimals coordinates are rounded to.
+        params (Mapping[str, str], optional): The query parameters of the
+        location request.
+
+    Returns:
+        str: The cache key.
+
+    Raises:
+        ValueError: If the arguments do not describe a location query.
+    """
+    if city:
+        key = f"city:{_normalize(city)}"
+        if country:
+            key = f"{key}|{_normalize(country)}"
+    elif poi:
+        key = f"poi:{_normalize(poi)}"
+    elif lat is not None and lon is not None:
+        key = f"geo:{lat:.{precision}f},{lon:.{precision}f}"
+    else:
+        raise ValueError(
+            'A "city", a "poi" or a "lat lon" combination is required.'
+        )
+    if not params:
+        return key
+    query = "&".join(
+        f"{name}={value}"
+        for name, value in sorted(params.items())
+        if name != "apikey"
+    )
+    return f"{key}?{query}"
+
+
+class LocationCache(ABC):
+    """
+    Abstract base class for location caches.
+
+    A cache maps a key built by `location_cache_key` to the JSON payload of
+    the matching location response.
+
+    Attributes:
+        geo_precision (int): The number of decimals coordinates are rounded
+        to when building cache keys.
+    """
+
+    geo_precision: int = 2
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Returns the cached payload for a key.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[Any]: The cached payload, or None on a miss.
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        """
+        Stores a payload under a key.
+
+        Args:
+            key (str): The cache key.
+            value (Any): The JSON payload of the location response.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Removes all entries from the cache."""
+
+
+class LRULocationCache(LocationCache):
+    """
+    In-process location cache with least-recently-used eviction.
+
+    Attributes:
+        maxsize (int): The maximum number of entries kept in memory.
+        ttl (Optional[float]): The time to live of an entry in seconds, or
+        None to keep entries until they are evicted.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[float] = None,
+        geo_precision: int = 2,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.geo_precision = geo_precision
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        expires_at = time.time() + self.ttl if self.ttl else float("inf")
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteLocationCache(LocationCache):
+    """
+    On-disk location cache backed by SQLite.
+
+    The database can be shared by several processes. Every thread uses its
+    own connection.
+
+    Attributes:
+        path (str): The path of the SQLite database file.
+        ttl (float): The time to live of an entry in seconds.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float = 30 * 24 * 3600,
+        geo_precision: int = 2,
+    ) -> None:
+        self.path = path
+        self.ttl = ttl
+        self.geo_precision = geo_precision
+        self._local = threading.local()
+        with self._connection() as conn:
+            # Readers in other processes do not block the writer and vice
+            # versa, the setting is stored in the database file
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS location_cache ("
+                "key TEXT PRIMARY KEY, payload TEXT NOT NULL, "
+                "expires_at REAL NOT NULL)"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        """Returns the SQLite connection of the calling thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[Any]:
+        row = (
+            self._connection()
+            .execute(
+                "SELECT payload, expires_at FROM location_cache "
+                "WHERE key = ?",
+                (key,),
+            )
+            .fetchone()
+        )
+        if row is None or row[1] < time.time():
+            return None
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO location_cache "
+                "(key, payload, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value), time.time() + self.ttl),
+            )
+
+    def clear(self) -> None:
+        with self._connection() as conn:
+            conn.execute("DELETE FROM location_cache")
+
+    def purge_expired(self) -> int:
+        """
+        Deletes expired entries from the database.
+
+        Returns:
+            int: The number of deleted entries.
+        """
+        with self._connection() as conn:
+            cursor = conn.execute(
+                "DELETE FROM location_cache WHERE expires_at < ?",
+                (time.time(),),
+            )
+        return cursor.rowcount
+
+
+class TieredLocationCache(LocationCache):
+    """
+    Location cache that combines an in-process tier with an on-disk tier.
+
+    Lookups check the memory tier first. Hits on the disk tier are promoted
+    to the memory tier.
+
+    Attributes:
+        memory (LocationCache): The in-process tier.
+        disk (Optional[LocationCache]): The on-disk tier.
+    """
+
+    def __init__(
+        self,
+        memory: Optional[LocationCache] = None,
+        disk: Optional[LocationCache] = None,
+    ) -> None:
+        self.memory = memory if memory is not None else LRULocationCache()
+        self.disk = disk
+        self.geo_precision = self.memory.geo_precision
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self.memory.get(key)
+        if value is None and self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None:
+                self.memory.set(key, value)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self.memory.set(key, value)
+        if self.disk is not None:
+            self.disk.set(key, value)
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
@@ -0,0 +1,590 @@
+"""
+response.py
+
+This module provides a cache for AccuWeather API responses. Entries expire
+after a time to live that matches how often the data behind an endpoint
+changes, unless the response carries its own `Cache-Control` or `Expires`
+header. Expired entries with an `ETag` or `Last-Modified` header are
+revalidated with a conditional request, and concurrent callers for the same
+entry share a single in-flight request. Optionally, stale entries are served
+while the API is failing or the circuit breaker is open.
+
+Classes:
+    - CacheEntry: A cached response body with its validators and expiry.
+    - ResponseCacheBackend: Abstract base class for storage backends.
+    - MemoryResponseBackend: In-process backend with least-recently-used
+      eviction.
+    - SQLiteResponseBackend: On-disk backend backed by SQLite.
+    - ResponseCache: Cache that sits in front of the API requests.
+"""
+
+import asyncio
+import re
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict
+from concurrent.futures import Future
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, Mapping
+from typing import Optional, Tuple
+
+from pydantic import BaseModel
+from requests import Response
+from requests.exceptions import HTTPError, RequestException
+
+if TYPE_CHECKING:
+    from accuweather_client.instrumentation import Instrumentation
+
+# Time to live in seconds per endpoint prefix, matched on the longest prefix
+DEFAULT_TTLS: Dict[str, float] = {
+    "currentconditions/": 10 * 60,
+    "forecasts/v1/hourly/": 30 * 60,
+    "forecasts/v1/daily/": 60 * 60,
+}
+
+MAX_AGE_REGEX = re.compile(r"max-age=(\d+)")
+
+# Names of the `stats` counters of the lookup outcomes that differ from them
+STATS_KEYS = {"hit": "hits", "miss": "misses"}
+
+
+class CacheEntry(BaseModel):
+    """
+    A cached response body.
+
+    Attributes:
+        body (bytes): The raw response body.
+        expires_at (float): The UNIX time after which the entry is stale.
+        etag (Optional[str]): The `ETag` header of the response.
+        last_modified (Optional[str]): The `Last-Modified` header of the
+        response.
+        cache_control (Optional[str]): The `Cache-Control` header of the
+        response, reused when a revalidation does not send a new one.
+        expires (Optional[str]): The `Expires` header of the response,
+        reused when a revalidation does not send a new one.
+    """
+
+    body: bytes
+    expires_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    cache_control: Optional[str] = None
+    expires: Optional[str] = None
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether the entry can be served without contacting the API."""
+        return self.expires_at > time.time()
+
+
+class ResponseCacheBackend(ABC):
+    """Abstract base class for the storage of a response cache."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        Returns the entry stored under a key, fresh or stale.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[CacheEntry]: The entry, or None on a miss.
+        """
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """
+        Stores an entry under a key.
+
+        Args:
+            key (str): The cache key.
+            entry (CacheEntry): The entry to store.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Removes all entries."""
+
+
+class MemoryResponseBackend(ResponseCacheBackend):
+    """
+    In-process response cache backend with least-recently-used eviction.
+
+    Attributes:
+        maxsize (int): The maximum number of entries kept in memory.
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteResponseBackend(ResponseCacheBackend):
+    """
+    On-disk response cache backend backed by SQLite.
+
+    The database can be shared by several processes. Every thread uses its
+    own connection.
+
+    Attributes:
+        path (str): The path of the SQLite database file.
+        max_stale (float): How long in seconds stale entries are kept for
+        revalidation before `purge_expired` deletes them.
+    """
+
+    def __init__(self, path: str, max_stale: float = 24 * 3600) -> None:
+        self.path = path
+        self.max_stale = max_stale
+        self._local = threading.local()
+        with self._connection() as conn:
+            # Readers in other processes do not block the writer and vice
+            # versa, the setting is stored in the database file
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS response_cache ("
+                "key TEXT PRIMARY KEY, body BLOB NOT NULL, "
+                "expires_at REAL NOT NULL, etag TEXT, last_modified TEXT, "
+                "cache_control TEXT, expires TEXT)"
+            )
+            # Databases created before the freshness headers were stored
+            columns = {
+                row[1]
+                for row in conn.execute("PRAGMA table_info(response_cache)")
+            }
+            for column in ("cache_control", "expires"):
+                if column not in columns:
+                    conn.execute(
+                        f"ALTER TABLE response_cache ADD COLUMN {column} TEXT"
+                    )
+
+    def _connection(self) -> sqlite3.Connection:
+        """Returns the SQLite connection of the calling thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        row = (
+            self._connection()
+            .execute(
+                "SELECT body, expires_at, etag, last_modified, "
+                "cache_control, expires FROM response_cache WHERE key = ?",
+                (key,),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+        return CacheEntry(
+            body=row[0],
+            expires_at=row[1],
+            etag=row[2],
+            last_modified=row[3],
+            cache_control=row[4],
+            expires=row[5],
+        )
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO response_cache "
+                "(key, body, expires_at, etag, last_modified, "
+                "cache_control, expires) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    entry.body,
+                    entry.expires_at,
+                    entry.etag,
+                    entry.last_modified,
+                    entry.cache_control,
+                    entry.expires,
+                ),
+            )
+
+    def clear(self) -> None:
+        with self._connection() as conn:
+            conn.execute("DELETE FROM response_cache")
+
+    def purge_expired(self) -> int:
+        """
+        Deletes entries that have been stale for longer than `max_stale`.
+
+        Returns:
+            int: The number of deleted entries.
+        """
+        with self._connection() as conn:
+            cursor = conn.execute(
+                "DELETE FROM response_cache WHERE expires_at < ?",
+                (time.time() - self.max_stale,),
+            )
+        return cursor.rowcount
+
+
+class ResponseCache:
+    """
+    Cache in front of the AccuWeather API requests.
+
+    Attributes:
+        backend (ResponseCacheBackend): The storage of the cache.
+        ttls (Dict[str, float]): The time to live in seconds per endpoint
+        prefix.
+        default_ttl (float): The time to live of endpoints without a prefix
+        in `ttls`.
+        respect_headers (bool): Whether `Cache-Control` and `Expires` headers
+        of a response override the time to live of its endpoint.
+        serve_stale (bool): Whether a stale entry is returned instead of
+        raising when refreshing it fails for reasons other than a client
+        error, e.g. a server error, a timeout or an open circuit.
+        stats (Counter): The number of hits, misses, revalidations,
+        coalesced requests and stale entries served.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[ResponseCacheBackend] = None,
+        ttls: Optional[Mapping[str, float]] = None,
+        default_ttl: float = 5 * 60,
+        respect_headers: bool = True,
+        serve_stale: bool = False,
+    ) -> None:
+        self.backend = (
+            backend if backend is not None else MemoryResponseBackend()
+        )
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.respect_headers = respect_headers
+        self.serve_stale = serve_stale
+        self.stats: Counter = Counter()
+        self._in_flight: Dict[str, Future] = {}
+        self._async_in_flight: Dict[Tuple[int, str], asyncio.Future] = {}
+        self._lock = threading.Lock()
+
+    def ttl_for(self, endpoint: str) -> float:
+        """
+        Returns the time to live of an endpoint.
+
+        Args:
+            endpoint (str): The API endpoint, e.g. "currentconditions/v1/".
+
+        Returns:
+            float: The time to live in seconds.
+        """
+        matches = [
+            prefix for prefix in self.ttls if endpoint.startswith(prefix)
+        ]
+        if not matches:
+            return self.default_ttl
+        return self.ttls[max(matches, key=len)]
+
+    @staticmethod
+    def make_key(
+        endpoint: str, location_key: str, params: Mapping[str, str]
+    ) -> str:
+        """
+        Builds the cache key of a request. The API key is left out, so all
+        tokens share the cached responses.
+
+        Args:
+            endpoint (str): The API endpoint.
+            location_key (str): The location key of the request.
+            params (Mapping[str, str]): The query parameters of the request.
+
+        Returns:
+            str: The cache key.
+        """
+        query = "&".join(
+            f"{name}={value}"
+            for name, value in sorted(params.items())
+            if name != "apikey"
+        )
+        return f"{endpoint}{location_key}?{query}"
+
+    def _expires_at(
+        self,
+        endpoint: str,
+        cache_control: Optional[str],
+        expires: Optional[str],
+    ) -> float:
+        """Computes the expiry of a response from its `Cache-Control` and
+        `Expires` headers or its endpoint."""
+        now = time.time()
+        if self.respect_headers:
+            cache_control = cache_control or ""
+            if "no-cache" in cache_control:
+                return now
+            max_age = MAX_AGE_REGEX.search(cache_control)
+            if max_age:
+                return now + int(max_age.group(1))
+            if expires:
+                try:
+                    return parsedate_to_datetime(expires).timestamp()
+                except (TypeError, ValueError):
+                    return now
+        return now + self.ttl_for(endpoint)
+
+    def _is_storable(self, response: Response) -> bool:
+        """Whether the headers of a response allow it to be stored."""
+        return not (
+            self.respect_headers
+            and "no-store" in response.headers.get("Cache-Control", "")
+        )
+
+    def fetch(
+        self,
+        endpoint: str,
+        location_key: str,
+        params: Mapping[str, str],
+        send: Callable[[Dict[str, str]], Response],
+        instrumentation: Optional["Instrumentation"] = None,
+    ) -> bytes:
+        """
+        Returns the response body of a request from the cache, revalidating
+        or fetching it when it is stale or missing.
+
+        Args:
+            endpoint (str): The API endpoint.
+            location_key (str): The location key of the request.
+            params (Mapping[str, str]): The query parameters of the request.
+            send (Callable[[Dict[str, str]], Response]): Sends the request
+            with the given extra headers and returns the response.
+            instrumentation (Instrumentation, optional): Receives a
+            `CacheEvent` with the outcome of the lookup.
+
+        Returns:
+            bytes: The response body.
+
+        Raises:
+            RequestException: If the request fails.
+        """
+        key = self.make_key(endpoint, location_key, params)
+        body, outcome = self._fetch(key, endpoint, send)
+        self._record(key, outcome, instrumentation)
+        return body
+
+    async def afetch(
+        self,
+        endpoint: str,
+        location_key: str,
+        params: Mapping[str, str],
+        send: Callable[[Dict[str, str]], Awaitable[Response]],
+        instrumentation: Optional["Instrumentation"] = None,
+    ) -> bytes:
+        """
+        Returns the response body of a request from the cache, like `fetch`,
+        for async clients. Concurrent callers on one event loop share a
+        single in-flight request.
+
+        Args:
+            endpoint (str): The API endpoint.
+            location_key (str): The location key of the request.
+            params (Mapping[str, str]): The query parameters of the request.
+            send (Callable[[Dict[str, str]], Awaitable[Response]]): Sends the
+            request with the given extra headers and returns the response.
+            instrumentation (Instrumentation, optional): Receives a
+            `CacheEvent` with the outcome of the lookup.
+
+        Returns:
+            bytes: The response body.
+
+        Raises:
+            RequestException: If the request fails.
+        """
+        key = self.make_key(endpoint, location_key, params)
+        body, outcome = await self._afetch(key, endpoint, send)
+        self._record(key, outcome, instrumentation)
+        return body
+
+    def _record(
+        self,
+        key: str,
+        outcome: str,
+        instrumentation: Optional["Instrumentation"],
+    ) -> None:
+        """Counts the outcome of a lookup and emits it."""
+        self.stats[STATS_KEYS.get(outcome, outcome)] += 1
+        if instrumentation is not None:
+            from accuweather_client.instrumentation import CacheEvent
+
+            instrumentation.emit(
+                CacheEvent(cache="response", key=key, outcome=outcome)
+            )
+
+    def _fetch(
+        self,
+        key: str,
+        endpoint: str,
+        send: Callable[[Dict[str, str]], Response],
+    ) -> Tuple[bytes, str]:
+        """Returns the body of an entry and the outcome of the lookup."""
+        entry = self.backend.get(key)
+        if entry is not None and entry.is_fresh:
+            return entry.body, "hit"
+        with self._lock:
+            in_flight = self._in_flight.get(key)
+            if in_flight is None:
+                in_flight = self._in_flight[key] = Future()
+                leader = True
+            else:
+                leader = False
+        if not leader:
+            return in_flight.result(), "coalesced"
+        try:
+            # Another caller may have refreshed the entry in the meantime
+            entry = self.backend.get(key)
+            if entry is not None and entry.is_fresh:
+                body, outcome = entry.body, "hit"
+            else:
+                body, outcome = self._refresh_or_stale(
+                    key, endpoint, entry, send
+                )
+            in_flight.set_result(body)
+            return body, outcome
+        except BaseException as e:
+            in_flight.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    async def _afetch(
+        self,
+        key: str,
+        endpoint: str,
+        send: Callable[[Dict[str, str]], Awaitable[Response]],
+    ) -> Tuple[bytes, str]:
+        """Returns the body of an entry and the outcome of the lookup."""
+        entry = self.backend.get(key)
+        if entry is not None and entry.is_fresh:
+            return entry.body, "hit"
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        in_flight = self._async_in_flight.get(flight_key)
+        if in_flight is not None:
+            return await asyncio.shield(in_flight), "coalesced"
+        in_flight = self._async_in_flight[flight_key] = loop.create_future()
+        try:
+            try:
+                response = await send(self._validators(entry))
+                body, outcome = self._store(key, endpoint, entry, response)
+            except RequestException as e:
+                body, outcome = self._stale(e, entry)
+            in_flight.set_result(body)
+            return body, outcome
+        except asyncio.CancelledError:
+            in_flight.cancel()
+            raise
+        except BaseException as e:
+            in_flight.set_exception(e)
+            # Marks the error as retrieved when no other caller waits for it
+            in_flight.exception()
+            raise
+        finally:
+            del self._async_in_flight[flight_key]
+
+    def _refresh_or_stale(
+        self,
+        key: str,
+        endpoint: str,
+        entry: Optional[CacheEntry],
+        send: Callable[[Dict[str, str]], Response],
+    ) -> Tuple[bytes, str]:
+        """Refreshes an entry, falling back to the stale entry on failure."""
+        try:
+            response = send(self._validators(entry))
+            return self._store(key, endpoint, entry, response)
+        except RequestException as e:
+            return self._stale(e, entry)
+
+    def _stale(
+        self, error: RequestException, entry: Optional[CacheEntry]
+    ) -> Tuple[bytes, str]:
+        """Returns the stale entry after a failed refresh, or raises the
+        error when it may not be served."""
+        if not self.serve_stale or entry is None:
+            raise error
+        status = (
+            error.response.status_code if error.response is not None else 0
+        )
+        client_error = 400 <= status < 500 and status != 429
+        if isinstance(error, HTTPError) and client_error:
+            raise error
+        return entry.body, "stale"
+
+    @staticmethod
+    def _validators(entry: Optional[CacheEntry]) -> Dict[str, str]:
+        """Returns the headers of a conditional request for an entry."""
+        headers = {}
+        if entry is not None and entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry is not None and entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def _store(
+        self,
+        key: str,
+        endpoint: str,
+        entry: Optional[CacheEntry],
+        response: Response,
+    ) -> Tuple[bytes, str]:
+        """Stores the response of a fetch or a revalidation of an entry."""
+        if response.status_code == 304 and entry is not None:
+            outcome = "revalidated"
+            # A 304 only carries the headers that changed, the others keep
+            # the values of the stored response
+            cache_control = response.headers.get(
+                "Cache-Control", entry.cache_control
+            )
+            expires = response.headers.get("Expires", entry.expires)
+            entry = entry.model_copy(
+                update={
+                    "expires_at": self._expires_at(
+                        endpoint, cache_control, expires
+                    ),
+                    "cache_control": cache_control,
+                    "expires": expires,
+                }
+            )
+        else:
+            response.raise_for_status()
+            outcome = "miss"
+            cache_control = response.headers.get("Cache-Control")
+            expires = response.headers.get("Expires")
+            entry = CacheEntry(
+                body=response.content,
+                expires_at=self._expires_at(endpoint, cache_control, expires),
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                cache_control=cache_control,
+                expires=expires,
+            )
+        if self._is_storable(response):
+            self.backend.set(key, entry)
+        return entry.body, outcome
@@ -0,0 +1,362 @@
+"""
+cli.py
+
+This module provides the `accuweather` command-line tool. The `fetch` command
+pulls forecasts for every location of a CSV or JSONL file concurrently over
+one pooled HTTP transport and shared caches, streams the results as they
+arrive, and reports the latency and throughput per endpoint at the end.
+
+Example:
+    accuweather fetch --locations cities.csv --endpoints daily,hourly \\
+        --concurrency 16 --format jsonl --output forecasts.jsonl
+
+Functions:
+    - build_parser: Builds the argument parser of the tool.
+    - main: Runs the tool.
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from accuweather_client.cache import (
+    LRULocationCache,
+    MemoryResponseBackend,
+    ResponseCache,
+    SQLiteLocationCache,
+    SQLiteResponseBackend,
+)
+from accuweather_client.clients import fetch_many, read_location_queries
+from accuweather_client.clients.batch import ENDPOINTS
+from accuweather_client.clients.location import API_ROOT, with_https
+from accuweather_client.http import Transport
+from accuweather_client.models import BatchResult
+
+# Endpoints that can be written to Parquet, see `accuweather_client.export`
+PARQUET_ENDPOINTS = {"daily", "hourly"}
+
+
+def _location_query(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Converts a row of the locations file to `WeatherClient` arguments,
+    raising a ValueError or TypeError for malformed values."""
+    query = {
+        column: row[column]
+        for column in ("city", "country", "poi", "location_key")
+        if row.get(column) not in (None, "")
+    }
+    for column in ("lat", "lon"):
+        if row.get(column) not in (None, ""):
+            query[column] = float(row[column])
+    if row.get("priority") not in (None, ""):
+        query["priority"] = int(row["priority"])
+    return query
+
+
+def _location_queries(
+    rows: Iterable[Dict[str, Any]], invalid: List[BatchResult]
+) -> Iterator[Dict[str, Any]]:
+    """Yields the queries of the rows, adding a failed result to `invalid`
+    for every malformed row instead of aborting the batch."""
+    for row in rows:
+        try:
+            yield _location_query(row)
+        except (TypeError, ValueError) as e:
+            invalid.append(BatchResult(query=row, errors={"location": e}))
+
+
+def _with_invalid(
+    results: Iterable[BatchResult], invalid: List[BatchResult]
+) -> Iterator[BatchResult]:
+    """Interleaves the failed results of malformed rows, which are found
+    while the batch consumes the queries, with the results of the batch."""
+    for result in results:
+        while invalid:
+            yield invalid.pop(0)
+        yield result
+    while invalid:
+        yield invalid.pop(0)
+
+
+def _percentile(values: List[float], percentile: float) -> float:
+    """Returns a percentile of a sorted, non-empty list by nearest rank."""
+    index = math.ceil(percentile / 100 * len(values)) - 1
+    return values[min(max(index, 0), len(values) - 1)]
+
+
+class _Report:
+    """Collects the timings and errors of a run per endpoint."""
+
+    def __init__(self, endpoints: Sequence[str]) -> None:
+        self.names = ["location", *endpoints]
+        self.timings: Dict[str, List[float]] = {
+            name: [] for name in self.names
+        }
+        self.errors: Dict[str, int] = dict.fromkeys(self.names, 0)
+        self.locations = 0
+        self.start = time.perf_counter()
+
+    def add(self, result: BatchResult) -> None:
+        self.locations += 1
+        for name, elapsed in result.timings.items():
+            self.timings[name].append(elapsed)
+        for name in result.errors:
+            self.errors[name] += 1
+
+    def write(self, file: IO[str]) -> None:
+        elapsed = time.perf_counter() - self.start
+        file.write(
+            f"{self.locations} locations in {elapsed:.2f}s "
+            f"({self.locations / elapsed if elapsed else 0:.1f} locations/s)\n"
+        )
+        file.write(
+            f"{'endpoint':<10}{'ok':>8}{'errors':>8}{'req/s':>9}"
+            f"{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+            f"{'max ms':>10}\n"
+        )
+        for name in self.names:
+            timings = sorted(self.timings[name])
+            line = (
+                f"{name:<10}{len(timings):>8}{self.errors[name]:>8}"
+                f"{len(timings) / elapsed if elapsed else 0:>9.1f}"
+            )
+            if timings:
+                line += "".join(
+                    f"{value * 1000:>10.1f}"
+                    for value in (
+                        sum(timings) / len(timings),
+                        _percentile(timings, 50),
+                        _percentile(timings, 95),
+                        _percentile(timings, 99),
+                        timings[-1],
+                    )
+                )
+            file.write(line + "\n")
+
+
+def _jsonl_line(result: BatchResult) -> str:
+    """Serializes the result of a location to a line of JSON."""
+    return json.dumps(
+        {
+            "query": result.query,
+            "location_key": result.location_key,
+            "results": {
+                name: model.model_dump(mode="json")
+                for name, model in result.results.items()
+            },
+            "errors": {name: str(e) for name, e in result.errors.items()},
+        }
+    )
+
+
+def fetch(args: argparse.Namespace) -> int:
+    """
+    Runs the `fetch` command.
+
+    Args:
+        args (argparse.Namespace): The parsed arguments.
+
+    Returns:
+        int: The exit status, 1 when any request failed.
+    """
+    token = args.token or os.getenv("API_TOKEN")
+    if not token:
+        sys.stderr.write(
+            "An API token is required, pass --token or set API_TOKEN.\n"
+        )
+        return 2
+    if args.cache_dir:
+        os.makedirs(args.cache_dir, exist_ok=True)
+        location_cache = SQLiteLocationCache(
+            os.path.join(args.cache_dir, "locations.sqlite")
+        )
+        backend = SQLiteResponseBackend(
+            os.path.join(args.cache_dir, "responses.sqlite")
+        )
+    else:
+        location_cache = LRULocationCache()
+        backend = MemoryResponseBackend()
+    invalid: List[BatchResult] = []
+    queries = _location_queries(
+        read_location_queries(args.locations, args.input_format), invalid
+    )
+    report = _Report(args.endpoints)
+    failed = False
+    with Transport(
+        pool_maxsize=args.concurrency,
+        connect_timeout=args.connect_timeout,
+        read_timeout=args.read_timeout,
+    ) as transport:
+        results = _with_invalid(
+            fetch_many(
+                queries,
+                token,
+                endpoints=args.endpoints,
+                max_concurrency=args.concurrency,
+                location_cache=location_cache,
+                response_cache=ResponseCache(backend),
+                transport=transport,
+                base_url=with_https(args.base_url, args.https),
+            ),
+            invalid,
+        )
+        if args.format == "jsonl":
+            output = (
+                open(args.output, "w", encoding="utf-8")
+                if args.output and args.output != "-"
+                else sys.stdout
+            )
+            try:
+                for result in results:
+                    report.add(result)
+                    failed = failed or not result.ok
+                    output.write(_jsonl_line(result) + "\n")
+                    output.flush()
+            finally:
+                if output is not sys.stdout:
+                    output.close()
+        else:
+            from accuweather_client.export import ForecastTableWriter
+
+            os.makedirs(args.output, exist_ok=True)
+            writers = {
+                name: ForecastTableWriter(
+                    os.path.join(args.output, f"{name}.parquet"), kind=name
+                )
+                for name in args.endpoints
+            }
+            try:
+                for result in results:
+                    report.add(result)
+                    failed = failed or not result.ok
+                    for name, forecast in result.results.items():
+                        writers[name].write(result.location_key, forecast)
+            finally:
+                for writer in writers.values():
+                    writer.close()
+    if not args.quiet:
+        report.write(sys.stderr)
+    return 1 if failed else 0
+
+
+def _endpoints(value: str) -> List[str]:
+    """Parses a comma-separated list of endpoints."""
+    endpoints = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = set(endpoints) - set(ENDPOINTS)
+    if not endpoints or unknown:
+        raise argparse.ArgumentTypeError(
+            f"choose endpoints from {', '.join(sorted(ENDPOINTS))}"
+        )
+    return endpoints
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Builds the argument parser of the `accuweather` tool.
+
+    Returns:
+        argparse.ArgumentParser: The parser.
+    """
+    parser = argparse.ArgumentParser(
+        prog="accuweather", description="AccuWeather API client."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    fetch_parser = commands.add_parser(
+        "fetch",
+        help="Fetch forecasts for many locations.",
+        description=(
+            "Fetch forecasts for the locations of a CSV or JSONL file with "
+            "city/country, poi, lat/lon or location_key columns."
+        ),
+    )
+    fetch_parser.add_argument(
+        "--locations", required=True, help="CSV or JSONL file of locations."
+    )
+    fetch_parser.add_argument(
+        "--input-format",
+        choices=("csv", "jsonl"),
+        help="Format of the locations file, guessed from its extension.",
+    )
+    fetch_parser.add_argument(
+        "--endpoints",
+        type=_endpoints,
+        default=list(ENDPOINTS),
+        help="Comma-separated endpoints (default: daily,hourly,current).",
+    )
+    fetch_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Maximum number of requests in flight (default: 8).",
+    )
+    fetch_parser.add_argument(
+        "--format",
+        choices=("jsonl", "parquet"),
+        default="jsonl",
+        help="Output format (default: jsonl).",
+    )
+    fetch_parser.add_argument(
+        "--output",
+        help=(
+            "Output file for jsonl, stdout by default; output directory "
+            "for parquet, one file per endpoint."
+        ),
+    )
+    fetch_parser.add_argument(
+        "--token", help="API token, defaults to the API_TOKEN variable."
+    )
+    fetch_parser.add_argument(
+        "--base-url",
+        default=API_ROOT,
+        help=f"Base URL of the API, e.g. of a mock server (default: {API_ROOT}).",
+    )
+    fetch_parser.add_argument(
+        "--https", action="store_true", help="Send the requests over HTTPS."
+    )
+    fetch_parser.add_argument(
+        "--cache-dir",
+        help="Directory of SQLite caches shared between runs.",
+    )
+    fetch_parser.add_argument(
+        "--connect-timeout", type=float, default=3.05, help="In seconds."
+    )
+    fetch_parser.add_argument(
+        "--read-timeout", type=float, default=10.0, help="In seconds."
+    )
+    fetch_parser.add_argument(
+        "--quiet", action="store_true", help="Do not print the report."
+    )
+    fetch_parser.set_defaults(handler=fetch)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Runs the `accuweather` tool.
+
+    Args:
+        argv (Sequence[str], optional): The arguments, `sys.argv` by default.
+
+    Returns:
+        int: The exit status.
+    """
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "fetch" and args.format == "parquet":
+        if not args.output:
+            parser.error("--output is required with --format parquet")
+        if not set(args.endpoints) <= PARQUET_ENDPOINTS:
+            parser.error(
+                "--format parquet supports the daily and hourly endpoints"
+            )
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,2 +1,10 @@
 from .location import LocationBaseClient, get_location_model  # noqa: F401
 from .weather import WeatherClient  # noqa: F401
+from .async_location import async_get_location_model  # noqa: F401
+from .async_location import close_async_http_client  # noqa: F401
+from .async_weather import AsyncWeatherClient  # noqa: F401
+from .batch import fetch_current_conditions, fetch_many  # noqa: F401
+from .bulk import read_location_queries, resolve_locations  # noqa: F401
+from .bulk import resolve_location_file  # noqa: F401
+from .multiprocess import fetch_many_processes  # noqa: F401
+from .refresh import BackgroundRefresher  # noqa: F401
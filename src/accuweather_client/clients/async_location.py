@@ -0,0 +1,399 @@
+"""
+async_location.py
+
+This module provides asyncio-native lookups against the AccuWeather location
+API. Requests go through a single `httpx.AsyncClient`, so all async clients in
+a process share one connection pool.
+
+The module requires the optional `httpx` dependency, which is installed with
+`pip install accuweather_client[async]`.
+
+Functions:
+    - get_async_http_client: Returns the shared async HTTP client.
+    - close_async_http_client: Closes the shared async HTTP client.
+    - acquire_rate_limit: Waits for the rate limiter of a token.
+    - async_get: Sends a GET request, emitting its timing when instrumented.
+    - async_request: Sends a GET request with the rate limiter, retries and
+      circuit breaker of the sync transport.
+    - async_warm_up: Opens pooled connections of an async client ahead of
+      the first requests.
+    - async_get_location_model: Awaitable factory that initializes the correct
+      location client and resolves its location.
+"""
+
+import asyncio
+import socket
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional
+from urllib.parse import urlsplit
+
+from requests import Response
+from requests.exceptions import ConnectionError, RequestException, Timeout
+from requests.structures import CaseInsensitiveDict
+
+from accuweather_client.clients.location import (
+    LocationBaseClient,
+    get_location_model,
+)
+from accuweather_client.http import (
+    CircuitBreaker,
+    RetryPolicy,
+    WarmupReport,
+    get_rate_limiter,
+)
+from accuweather_client.http.resilience import retry_after
+from accuweather_client.instrumentation import Instrumentation, RequestEvent
+
+if TYPE_CHECKING:
+    import httpx
+
+_shared_http_client: Optional[Any] = None
+
+
+def get_async_http_client() -> "httpx.AsyncClient":
+    """
+    Returns the async HTTP client shared by all async clients, creating it on
+    first use.
+
+    Returns:
+        httpx.AsyncClient: The shared async HTTP client.
+
+    Raises:
+        ImportError: If httpx is not installed.
+    """
+    global _shared_http_client
+    try:
+        import httpx
+    except ImportError as e:
+        raise ImportError(
+            "The async clients require httpx, install it with "
+            '"pip install accuweather_client[async]".'
+        ) from e
+    if _shared_http_client is None or _shared_http_client.is_closed:
+        _shared_http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=100, max_keepalive_connections=20
+            )
+        )
+    return _shared_http_client
+
+
+async def close_async_http_client() -> None:
+    """Closes the shared async HTTP client and its pooled connections."""
+    global _shared_http_client
+    if _shared_http_client is not None:
+        await _shared_http_client.aclose()
+        _shared_http_client = None
+
+
+async def acquire_rate_limit(token: str, priority: int = 0) -> None:
+    """
+    Waits for the rate limiter of a token, if one is registered, without
+    blocking the event loop.
+
+    Args:
+        token (str): The API token of the request.
+        priority (int): The priority of the request.
+
+    Raises:
+        RateLimitError: If the rate limiter rejects the request.
+    """
+    limiter = get_rate_limiter(token)
+    if limiter is not None:
+        await asyncio.to_thread(limiter.acquire, priority)
+
+
+async def async_get(
+    http_client: "httpx.AsyncClient",
+    url: str,
+    params: Dict[str, str],
+    instrumentation: Optional[Instrumentation] = None,
+    endpoint: Optional[str] = None,
+    headers: Optional[Dict[str, str]] = None,
+) -> "httpx.Response":
+    """
+    Sends a GET request. With instrumentation, the connect and time to first
+    byte phases are taken from the trace extension of httpx and emitted as a
+    `RequestEvent`.
+
+    Args:
+        http_client (httpx.AsyncClient): The client sending the request.
+        url (str): The URL of the request, which may carry a query already.
+        params (Dict[str, str]): The query parameters added to the query of
+        the URL.
+        instrumentation (Instrumentation, optional): Receives the event.
+        endpoint (str, optional): The endpoint label of the event, defaults
+        to the URL.
+        headers (Dict[str, str], optional): Extra headers of the request.
+
+    Returns:
+        httpx.Response: The response.
+    """
+    import httpx
+
+    # httpx replaces the query of the URL with `params`, the location
+    # searches carry theirs in the URL
+    request_url = httpx.URL(url).copy_merge_params(params)
+    if instrumentation is None:
+        return await http_client.get(request_url, headers=headers)
+    marks: Dict[str, float] = {}
+
+    async def trace(name: str, info: Dict[str, Any]) -> None:
+        marks[name.split(".", 1)[-1]] = time.perf_counter()
+
+    start = time.perf_counter()
+    event = RequestEvent(endpoint=endpoint or url)
+    try:
+        response = await http_client.get(
+            request_url, headers=headers, extensions={"trace": trace}
+        )
+    except Exception as e:
+        event.error = repr(e)
+        raise
+    else:
+        event.status = response.status_code
+        event.bytes_received = len(response.content)
+    finally:
+        event.total = time.perf_counter() - start
+        if "connect_tcp.started" in marks:
+            event.reused_connection = False
+            connected = marks.get(
+                "start_tls.complete", marks.get("connect_tcp.complete", start)
+            )
+            event.connect = connected - marks["connect_tcp.started"]
+        headers = marks.get("receive_response_headers.complete")
+        if headers is not None:
+            event.ttfb = headers - start
+            event.download = (
+                marks.get("receive_response_body.complete", headers) - headers
+            )
+        instrumentation.emit(event)
+    return response
+
+
+def _as_requests_response(response: "httpx.Response") -> Response:
+    """Converts a read httpx response into a requests response."""
+    converted = Response()
+    converted.status_code = response.status_code
+    converted.reason = response.reason_phrase
+    converted.headers = CaseInsensitiveDict(response.headers)
+    converted.url = str(response.url)
+    converted.encoding = response.encoding
+    converted._content = response.content
+    return converted
+
+
+async def async_request(
+    http_client: "httpx.AsyncClient",
+    url: str,
+    params: Dict[str, str],
+    priority: int = 0,
+    retry: Optional[RetryPolicy] = None,
+    circuit_breaker: Optional[CircuitBreaker] = None,
+    instrumentation: Optional[Instrumentation] = None,
+    endpoint: Optional[str] = None,
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """
+    Sends a GET request the way `Transport.request` does: every attempt
+    waits for the rate limiter of the API key, connection errors, timeouts
+    and retryable status codes are retried according to the retry policy,
+    and the circuit breaker counts the outcomes. The response is returned as
+    a `requests.Response` and httpx errors are raised as their requests
+    counterparts, so responses and errors of both clients are handled
+    alike.
+
+    Args:
+        http_client (httpx.AsyncClient): The client sending the request.
+        url (str): The URL of the request.
+        params (Dict[str, str]): The query parameters.
+        priority (int): The priority of the request for the rate limiter.
+        retry (RetryPolicy, optional): The retry policy, two retries with
+        backoff by default.
+        circuit_breaker (CircuitBreaker, optional): The circuit breaker
+        guarding the API, if any.
+        instrumentation (Instrumentation, optional): Receives a
+        `RequestEvent` per attempt.
+        endpoint (str, optional): The endpoint label of the events.
+        headers (Dict[str, str], optional): Extra headers of the request.
+
+    Returns:
+        Response: The response of the last attempt.
+
+    Raises:
+        RateLimitError: If the rate limiter rejects the request.
+        CircuitOpenError: If the circuit breaker rejects the request.
+        RequestException: If the last attempt fails to connect or times
+        out, or the request fails otherwise.
+    """
+    import httpx
+
+    retry = retry if retry is not None else RetryPolicy()
+    limiter = get_rate_limiter(params.get("apikey"))
+    attempt = 0
+    while True:
+        if circuit_breaker is not None:
+            circuit_breaker.before_request()
+        response = error = None
+        try:
+            if limiter is not None:
+                await asyncio.to_thread(limiter.acquire, priority)
+            response = _as_requests_response(
+                await async_get(
+                    http_client,
+                    url,
+                    params,
+                    instrumentation,
+                    endpoint,
+                    headers,
+                )
+            )
+        except httpx.TimeoutException as e:
+            error = Timeout(str(e))
+            error.__cause__ = e
+        except httpx.TransportError as e:
+            error = ConnectionError(str(e))
+            error.__cause__ = e
+        except (httpx.HTTPError, RequestException) as e:
+            if circuit_breaker is not None:
+                circuit_breaker.release()
+            if isinstance(e, RequestException):
+                raise
+            raise RequestException(str(e)) from e
+        if limiter is not None and response is not None:
+            if response.status_code == 429:
+                limiter.pause(retry_after(response, default=1.0))
+        if circuit_breaker is not None:
+            if error is not None or response.status_code >= 500:
+                circuit_breaker.record_failure()
+            else:
+                circuit_breaker.record_success()
+        if attempt >= retry.max_retries or (
+            not retry.is_retryable("GET", response, error)
+        ):
+            if error is not None:
+                raise error
+            return response
+        await asyncio.sleep(retry.backoff(attempt, response))
+        attempt += 1
+
+
+async def async_warm_up(
+    http_client: "httpx.AsyncClient", url: str, connections: int = 1
+) -> WarmupReport:
+    """
+    Resolves the host of a URL and opens pooled connections of an async
+    client to it, like `Transport.warm_up`. httpx opens connections only for
+    requests, so each connection is opened by a concurrent GET of the URL
+    itself, which carries no API key and counts against no quota. Idle
+    connections that are already open are reused for these requests and
+    count towards the number.
+
+    Args:
+        http_client (httpx.AsyncClient): The client whose pool is warmed up.
+        url (str): A URL of the host, e.g. the `base_url` of a client.
+        connections (int): The number of connections to keep open.
+
+    Returns:
+        WarmupReport: The cost of the warm-up.
+
+    Raises:
+        OSError: If the host cannot be resolved.
+    """
+    start = time.perf_counter()
+    report = WarmupReport(url=url)
+    parts = urlsplit(url)
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+    addresses = await asyncio.get_running_loop().getaddrinfo(
+        parts.hostname, port, type=socket.SOCK_STREAM
+    )
+    report.dns = time.perf_counter() - start
+    report.addresses = sorted({address[4][0] for address in addresses})
+
+    async def open_connection() -> Optional[float]:
+        marks: Dict[str, float] = {}
+
+        async def trace(name: str, info: Dict[str, Any]) -> None:
+            marks[name.split(".", 1)[-1]] = time.perf_counter()
+
+        await http_client.get(url, extensions={"trace": trace})
+        if "connect_tcp.started" not in marks:
+            return None
+        connected = marks.get(
+            "start_tls.complete", marks.get("connect_tcp.complete")
+        )
+        return connected - marks["connect_tcp.started"]
+
+    results = await asyncio.gather(
+        *(open_connection() for _ in range(connections)),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            report.errors.append(f"{type(result).__name__}: {result}")
+        elif result is None:
+            report.reused += 1
+        else:
+            report.connect.append(result)
+    report.connections = len(report.connect)
+    report.total = time.perf_counter() - start
+    return report
+
+
+async def async_get_location_model(
+    city: str | None = None,
+    poi: str | None = None,
+    lat: float | None = None,
+    lon: float | None = None,
+    http_client: Optional["httpx.AsyncClient"] = None,
+    retry: Optional[RetryPolicy] = None,
+    circuit_breaker: Optional[CircuitBreaker] = None,
+    **kwargs,
+) -> LocationBaseClient:
+    """
+    Awaitable factory that initializes the correct location client and
+    resolves its location without blocking the event loop.
+
+    Args:
+        city (str, optional): The city name for which to fetch location data.
+        poi (str, optional): The Point of Interest for which to fetch location
+        data.
+        lat (float, optional): The latitude for which to fetch location data.
+        lon (float, optional): The longitude for which to fetch location data.
+        http_client (httpx.AsyncClient, optional): The client used for the
+        request, defaults to the shared client.
+        retry (RetryPolicy, optional): The retry policy of the lookup, two
+        retries with backoff by default.
+        circuit_breaker (CircuitBreaker, optional): The circuit breaker
+        guarding the API, if any.
+        **kwargs: Additional keyword arguments passed to the client classes.
+
+    Returns:
+        LocationBaseClient: A location client with the location attribute
+        set.
+
+    Raises:
+        ValueError: If the parameters do not describe a location, or if the
+        location data could not be fetched.
+    """
+    location_client = get_location_model(
+        city=city, poi=poi, lat=lat, lon=lon, lazy=True, **kwargs
+    )
+    if location_client.load_cached_location() is not None:
+        return location_client
+    try:
+        response = await async_request(
+            http_client or get_async_http_client(),
+            location_client.query_url,
+            location_client.query_params,
+            priority=location_client.priority,
+            retry=retry,
+            circuit_breaker=circuit_breaker,
+            instrumentation=location_client.instrumentation,
+            endpoint=location_client.endpoint,
+        )
+        response.raise_for_status()
+        location_client.set_location_from_response(response.content)
+    except Exception as e:
+        raise ValueError(f"Failed to fetch location data: {e}") from e
+    return location_client
@@ -0,0 +1,199 @@
+"""
+async_weather.py
+
+This module provides an asyncio-native API client for the AccuWeather API. It
+returns the same models as `WeatherClient`, but never blocks the event loop,
+so many locations can be queried concurrently from a single thread. Both
+clients share their options, requests and parsing through
+`WeatherBaseClient` and differ only in how requests are sent.
+
+Example:
+    client = await AsyncWeatherClient.create(token="your_api_key", city="Oslo")
+    forecast = await client.get_5day_forecast()
+
+Classes:
+    - AsyncWeatherClient: Async API client for fetching current conditions and
+      forecasts.
+"""
+
+import asyncio
+from typing import Any, Dict, Optional
+
+from pydantic import Field, PrivateAttr
+from requests.exceptions import RequestException
+
+from accuweather_client.clients.async_location import (
+    async_get_location_model,
+    async_request,
+    async_warm_up,
+    get_async_http_client,
+)
+from accuweather_client.clients.weather import WeatherBaseClient, _Call
+from accuweather_client.http import CircuitBreaker, RetryPolicy, WarmupReport
+from accuweather_client.models import LocationModelItem
+
+
+class AsyncWeatherClient(WeatherBaseClient):
+    """
+    Async AccuWeather API client for retrieving forecasts and current weather
+    conditions. Its request methods are those of `WeatherBaseClient` and
+    return awaitables of the same results, e.g.
+    `await client.get_hourly_forecast(72)`.
+
+    Construction never touches the network. Use the awaitable `create`
+    factory to build a client and resolve its location in one go.
+
+    Besides the options of `WeatherBaseClient`:
+
+    Attributes:
+        retry (RetryPolicy): The retry policy of the requests, `RetryPolicy(max_retries=0)` disables retries.
+        circuit_breaker (Optional[CircuitBreaker]): The circuit breaker guarding the API, if any. It can be shared with the transport of sync clients.
+    """
+
+    retry: RetryPolicy = Field(default_factory=RetryPolicy)
+    circuit_breaker: Optional[CircuitBreaker] = None
+    _http_client: Any = PrivateAttr(default=None)
+    _location_lock: asyncio.Lock = PrivateAttr(default_factory=asyncio.Lock)
+
+    @classmethod
+    async def create(
+        cls, http_client: Any = None, **kwargs
+    ) -> "AsyncWeatherClient":
+        """
+        Creates a client and resolves its location, unless a location key is
+        provided.
+
+        Args:
+            http_client (httpx.AsyncClient, optional): The client used for
+            requests, defaults to the shared client.
+            **kwargs: The fields of the client.
+
+        Returns:
+            AsyncWeatherClient: The client with its location resolved.
+        """
+        client = cls(**kwargs)
+        client._http_client = http_client
+        await client.resolve_location()
+        return client
+
+    @property
+    def http_client(self) -> Any:
+        """The async HTTP client used for requests."""
+        return self._http_client or get_async_http_client()
+
+    async def warm_up(self, connections: int = 2) -> WarmupReport:
+        """
+        Resolves the API host and opens pooled connections to it ahead of the
+        first requests, including the TLS handshakes of HTTPS clients.
+
+        Args:
+            connections (int): The number of connections to keep open.
+
+        Returns:
+            WarmupReport: The cost of the name resolution and of each
+            connection.
+
+        Raises:
+            OSError: If the API host cannot be resolved.
+        """
+        return await async_warm_up(
+            self.http_client, self.base_url, connections
+        )
+
+    async def resolve_location(self) -> Optional[LocationModelItem]:
+        """
+        Resolves the location and location key from the location inputs.
+        Concurrent calls share one lookup.
+
+        Returns:
+            Optional[LocationModelItem]: The resolved location, or None for
+            clients that were created from a location key.
+
+        Raises:
+            ValueError: If the location inputs are invalid or the location
+            could not be fetched.
+        """
+        if self.location_key is not None:
+            return self.location
+        async with self._location_lock:
+            if self.location_key is None:
+                location_client = await async_get_location_model(
+                    token=self.token,
+                    city=self.city,
+                    country=self.country,
+                    poi=self.poi,
+                    lat=self.lat,
+                    lon=self.lon,
+                    cache=self.location_cache,
+                    geo_index=self.geo_index,
+                    api_root=self.base_url,
+                    fast_parse=self.fast_parse,
+                    priority=self.priority,
+                    instrumentation=self.instrumentation,
+                    details=self.details,
+                    language=self.language,
+                    http_client=self.http_client,
+                    retry=self.retry,
+                    circuit_breaker=self.circuit_breaker,
+                )
+                self.location_client = location_client
+                self.location = location_client.location.get_location_item()
+                self.location_key = self.location.Key
+        return self.location
+
+    async def _request_content(
+        self, endpoint: str, params: Optional[Dict[str, str]] = None
+    ) -> bytes:
+        """
+        Helper method to make API requests to the AccuWeather API, served
+        from the response cache when one is set.
+
+        Args:
+            endpoint (str): The API endpoint to query.
+            params (Optional[Dict[str, str]]): The query parameters, those of
+            the client options by default.
+
+        Returns:
+            bytes: The raw JSON body of the response.
+
+        Raises:
+            RequestException: If the API request fails.
+        """
+        await self.resolve_location()
+        url = self.base_url + endpoint + str(self.location_key)
+        params = params or self.request_params()
+
+        def send(headers: Optional[Dict[str, str]] = None):
+            return async_request(
+                self.http_client,
+                url,
+                params,
+                priority=self.priority,
+                retry=self.retry,
+                circuit_breaker=self.circuit_breaker,
+                instrumentation=self.instrumentation,
+                endpoint=endpoint,
+                headers=headers,
+            )
+
+        try:
+            if self.response_cache is not None:
+                return await self.response_cache.afetch(
+                    endpoint,
+                    str(self.location_key),
+                    params,
+                    send,
+                    instrumentation=self.instrumentation,
+                )
+            response = await send()
+            response.raise_for_status()
+            return response.content
+        except RequestException as e:
+            raise RequestException(
+                f"Failed to retrieve data from {url}"
+            ) from e
+
+    async def _perform(self, call: _Call) -> Any:
+        return call.parse(
+            await self._request_content(call.endpoint, call.params)
+        )
@@ -0,0 +1,312 @@
+"""
+batch.py
+
+This module fetches forecasts for many locations at once. Location lookups and
+endpoint requests run concurrently on a bounded thread pool and share one
+pooled HTTP transport.
+
+Example:
+    for result in fetch_many(
+        [{"city": "oslo"}, {"poi": "Eiffel tower"}], token="your_api_key"
+    ):
+        print(result.location_key, result.results, result.errors)
+
+Functions:
+    - fetch_many: Fetches several endpoints for many locations concurrently
+      and yields the results per location as they complete.
+    - fetch_current_conditions: Fetches the current conditions of many
+      location keys into columns.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor
+from concurrent.futures import wait
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, Optional
+from typing import Sequence
+
+from accuweather_client.cache import GeoIndex, LocationCache, LRULocationCache
+from accuweather_client.cache import ResponseCache
+from accuweather_client.clients.weather import WeatherClient
+from accuweather_client.http import Transport
+from accuweather_client.instrumentation import Instrumentation
+from accuweather_client.models import BatchResult, CurrentConditionsRecord
+
+if TYPE_CHECKING:
+    from accuweather_client.models.compact import CurrentConditionsColumns
+
+ENDPOINTS: Dict[str, str] = {
+    "daily": "get_5day_forecast",
+    "hourly": "get_hourly_forecast_12h",
+    "current": "get_current_conditions",
+}
+
+
+def _resolve(
+    token: str,
+    query: Dict[str, Any],
+    location_cache: LocationCache,
+    geo_index: Optional[GeoIndex],
+    response_cache: Optional[ResponseCache],
+    transport: Transport,
+    base_url: str,
+) -> tuple[WeatherClient, float]:
+    """Creates a weather client for a query, resolving its location."""
+    start = time.perf_counter()
+    client = WeatherClient(
+        **{
+            "token": token,
+            "base_url": base_url,
+            "location_cache": location_cache,
+            "geo_index": geo_index,
+            "response_cache": response_cache,
+            "transport": transport,
+            # A query may override the options of the batch
+            **query,
+        }
+    )
+    return client, time.perf_counter() - start
+
+
+def _timed_call(client: WeatherClient, endpoint: str) -> tuple[Any, float]:
+    """Calls the client method of an endpoint and measures its duration."""
+    start = time.perf_counter()
+    value = getattr(client, ENDPOINTS[endpoint])()
+    return value, time.perf_counter() - start
+
+
+def fetch_many(
+    locations: Iterable[Dict[str, Any]],
+    token: str,
+    endpoints: Sequence[str] = ("daily", "hourly", "current"),
+    max_concurrency: int = 8,
+    location_cache: Optional[LocationCache] = None,
+    response_cache: Optional[ResponseCache] = None,
+    transport: Optional[Transport] = None,
+    geo_index: Optional[GeoIndex] = None,
+    base_url: str = "http://dataservice.accuweather.com/",
+) -> Iterator[BatchResult]:
+    """
+    Fetches several endpoints for many locations concurrently.
+
+    Each location is resolved first, after which its endpoint requests are
+    scheduled on the same thread pool. Results are yielded per location as
+    soon as all of its requests have finished, so the order of the results
+    may differ from the order of `locations`. Failures are reported on the
+    result of the affected location and never abort the batch.
+
+    Args:
+        locations (Iterable[Dict[str, Any]]): Location queries with the
+        keyword arguments of `WeatherClient`, e.g. {"city": "oslo"}. The
+        iterable is consumed lazily.
+        token (str): API token for authenticating requests.
+        endpoints (Sequence[str]): The endpoints to fetch, any of "daily",
+        "hourly" and "current".
+        max_concurrency (int): The maximum number of requests in flight.
+        location_cache (LocationCache, optional): The cache for location
+        lookups, defaults to an in-memory cache for the batch.
+        response_cache (ResponseCache, optional): The cache for the endpoint
+        responses.
+        transport (Transport, optional): The transport for all requests,
+        defaults to a transport with a pool of `max_concurrency` connections
+        that is closed when the batch is done.
+        geo_index (GeoIndex, optional): The spatial index that answers
+        coordinate queries near an already resolved location.
+        base_url (str): The base URL of the API.
+
+    Returns:
+        Iterator[BatchResult]: The outcome per location.
+
+    Raises:
+        ValueError: If an unknown endpoint is requested.
+    """
+    unknown = set(endpoints) - set(ENDPOINTS)
+    if unknown:
+        raise ValueError(
+            f"Unknown endpoints {sorted(unknown)}, "
+            f"choose from {sorted(ENDPOINTS)}."
+        )
+    if location_cache is None:
+        location_cache = LRULocationCache()
+    own_transport = transport is None
+    if own_transport:
+        transport = Transport(pool_maxsize=max_concurrency)
+    return _run_batch(
+        iter(locations),
+        token,
+        endpoints,
+        max_concurrency,
+        location_cache,
+        geo_index,
+        response_cache,
+        transport,
+        base_url,
+        close_transport=own_transport,
+    )
+
+
+def _run_batch(
+    queries: Iterator[Dict[str, Any]],
+    token: str,
+    endpoints: Sequence[str],
+    max_concurrency: int,
+    location_cache: LocationCache,
+    geo_index: Optional[GeoIndex],
+    response_cache: Optional[ResponseCache],
+    transport: Transport,
+    base_url: str,
+    close_transport: bool = False,
+) -> Iterator[BatchResult]:
+    """Runs the lookups and endpoint requests of `fetch_many`."""
+    # Maps each future to its result and endpoint, None for the lookup
+    pending: Dict[Future, tuple[BatchResult, Optional[str]]] = {}
+    remaining: Dict[int, int] = {}
+    lookups = 0
+
+    try:
+        with ThreadPoolExecutor(max_concurrency) as executor:
+
+            def submit_lookups() -> None:
+                nonlocal lookups
+                while lookups < 2 * max_concurrency:
+                    query = next(queries, None)
+                    if query is None:
+                        return
+                    future = executor.submit(
+                        _resolve,
+                        token,
+                        query,
+                        location_cache,
+                        geo_index,
+                        response_cache,
+                        transport,
+                        base_url,
+                    )
+                    pending[future] = (BatchResult(query=query), None)
+                    lookups += 1
+
+            submit_lookups()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result, endpoint = pending.pop(future)
+                    if endpoint is None:
+                        lookups -= 1
+                        try:
+                            client, elapsed = future.result()
+                            result.timings["location"] = elapsed
+                        except Exception as e:
+                            result.errors["location"] = e
+                            yield result
+                            continue
+                        result.location = client.location
+                        result.location_key = client.location_key
+                        if not endpoints:
+                            yield result
+                            continue
+                        remaining[id(result)] = len(endpoints)
+                        for name in endpoints:
+                            pending[
+                                executor.submit(_timed_call, client, name)
+                            ] = (
+                                result,
+                                name,
+                            )
+                        continue
+                    try:
+                        value, elapsed = future.result()
+                        result.results[endpoint] = value
+                        result.timings[endpoint] = elapsed
+                    except Exception as e:
+                        result.errors[endpoint] = e
+                    remaining[id(result)] -= 1
+                    if not remaining[id(result)]:
+                        del remaining[id(result)]
+                        yield result
+                submit_lookups()
+    finally:
+        if close_transport:
+            transport.close()
+
+
+def fetch_current_conditions(
+    location_keys: Iterable[str],
+    token: str,
+    max_concurrency: int = 16,
+    metric: bool = True,
+    details: bool = True,
+    language: Optional[str] = None,
+    base_url: str = "http://dataservice.accuweather.com/",
+    response_cache: Optional[ResponseCache] = None,
+    transport: Optional[Transport] = None,
+    instrumentation: Optional[Instrumentation] = None,
+) -> "CurrentConditionsColumns":
+    """
+    Fetches the current conditions of many location keys concurrently and
+    collects them into columns, e.g. one NumPy array of temperatures with a
+    value per location key. Responses are parsed straight into typed
+    observations, no location lookups are made, and duplicate keys are
+    fetched once. Requires the optional `numpy` dependency.
+
+    Args:
+        location_keys (Iterable[str]): The location keys.
+        token (str): API token for authenticating requests.
+        max_concurrency (int): The maximum number of requests in flight.
+        metric (bool): Whether to collect the metric or imperial values.
+        details (bool): Whether to request the full details. Without
+        details, e.g. the wind and humidity columns are NaN.
+        language (Optional[str]): The language of the weather texts.
+        base_url (str): The base URL of the API.
+        response_cache (ResponseCache, optional): The cache for the
+        responses.
+        transport (Transport, optional): The transport for all requests,
+        defaults to a transport with a pool of `max_concurrency` connections
+        that is closed when the batch is done.
+        instrumentation (Optional[Instrumentation]): Receives the request,
+        parse and cache events.
+
+    Returns:
+        CurrentConditionsColumns: A row per location key that was fetched,
+        in input order, and the error of every other key.
+    """
+    from accuweather_client.models.compact import CurrentConditionsColumns
+
+    keys = list(dict.fromkeys(str(key) for key in location_keys))
+    own_transport = transport is None
+    if own_transport:
+        transport = Transport(pool_maxsize=max_concurrency)
+
+    def fetch(location_key: str) -> CurrentConditionsRecord | Exception:
+        try:
+            client = WeatherClient(
+                token=token,
+                location_key=location_key,
+                base_url=base_url,
+                response_cache=response_cache,
+                transport=transport,
+                instrumentation=instrumentation,
+                fast_parse=True,
+                details=details,
+                language=language,
+            )
+            observations = client.get_current_observations()
+            if not observations:
+                raise ValueError("No current conditions were returned.")
+        except Exception as e:
+            return e
+        return CurrentConditionsRecord.from_model(
+            location_key, observations[0], metric
+        )
+
+    records = []
+    errors: Dict[str, str] = {}
+    try:
+        with ThreadPoolExecutor(max_concurrency) as executor:
+            for key, record in zip(keys, executor.map(fetch, keys)):
+                if isinstance(record, Exception):
+                    errors[key] = str(record) or type(record).__name__
+                else:
+                    records.append(record)
+    finally:
+        if own_transport:
+            transport.close()
+    return CurrentConditionsColumns.from_records(records, metric, errors)
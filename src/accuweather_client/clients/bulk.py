@@ -0,0 +1,302 @@
+"""
+bulk.py
+
+This module resolves location keys for large lists of locations read from CSV
+or JSONL files. Rows are read and written as streams, queries are normalized
+so that duplicates are looked up once, and the unique lookups of each chunk
+of rows run concurrently over one pooled HTTP transport. Memory is bounded by
+the chunk size and the size of the memo of resolved queries, not by the
+number of rows.
+
+Example:
+    stats = resolve_location_file(
+        "customers.csv", "customers_keys.jsonl", token="your_api_key"
+    )
+
+Functions:
+    - read_location_queries: Reads location query rows from a CSV or JSONL
+      file.
+    - resolve_locations: Resolves the location of each row of a stream.
+    - resolve_location_file: Resolves the locations of a file into another
+      file.
+"""
+
+import csv
+import json
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import IO, Any, Dict, Iterable, Iterator, Optional, Sequence
+
+from accuweather_client.cache import (
+    GeoIndex,
+    LocationCache,
+    location_cache_key,
+)
+from accuweather_client.clients.location import get_location_model
+from accuweather_client.http import Transport
+from accuweather_client.models import LocationModelItem
+
+QUERY_COLUMNS = ("city", "country", "poi", "lat", "lon")
+
+DEFAULT_FIELDS = (
+    "LocalizedName",
+    "Country.ID",
+    "AdministrativeArea.ID",
+    "GeoPosition.Latitude",
+    "GeoPosition.Longitude",
+)
+
+
+def _format(path: str, format: Optional[str]) -> str:
+    """Returns the file format, guessed from the extension if not given."""
+    format = format or path.rsplit(".", 1)[-1].lower()
+    if format not in ("csv", "jsonl"):
+        raise ValueError(
+            f'Unknown format "{format}", choose from "csv" and "jsonl".'
+        )
+    return format
+
+
+def read_location_queries(
+    path: str, format: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Reads location query rows from a file, one row at a time. Rows have a
+    "city" and optional "country", a "poi", or "lat" and "lon" columns;
+    other columns are passed through.
+
+    Args:
+        path (str): The path of the file.
+        format (str, optional): "csv" or "jsonl", guessed from the extension
+        by default.
+
+    Returns:
+        Iterator[Dict[str, Any]]: The rows of the file.
+
+    Raises:
+        ValueError: If the format is unknown.
+    """
+    format = _format(path, format)
+    with open(path, newline="", encoding="utf-8") as file:
+        if format == "csv":
+            yield from csv.DictReader(file)
+        else:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def _query(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Extracts the location query of a row, converting coordinates."""
+    query = {
+        column: row[column]
+        for column in QUERY_COLUMNS
+        if row.get(column) not in (None, "")
+    }
+    for column in ("lat", "lon"):
+        if column in query:
+            query[column] = float(query[column])
+    return query
+
+
+def _field(item: LocationModelItem, path: str) -> Any:
+    """Returns a field of a location by its dotted path."""
+    value: Any = item
+    for name in path.split("."):
+        value = getattr(value, name, None)
+        if value is None:
+            return None
+    return value
+
+
+def resolve_locations(
+    rows: Iterable[Dict[str, Any]],
+    token: str,
+    fields: Sequence[str] = DEFAULT_FIELDS,
+    max_concurrency: int = 8,
+    chunk_size: int = 10_000,
+    memo_size: int = 100_000,
+    precision: int = 3,
+    location_cache: Optional[LocationCache] = None,
+    geo_index: Optional[GeoIndex] = None,
+    transport: Optional[Transport] = None,
+    api_root: Optional[str] = None,
+    https: bool = False,
+    stats: Optional[Counter] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Resolves the location of each row of a stream.
+
+    Rows are processed in chunks of `chunk_size`. The queries of a chunk are
+    normalized with `location_cache_key`, so rows that differ in case,
+    whitespace or beyond `precision` decimals of their coordinates share a
+    lookup. Queries resolved in earlier chunks are answered from a memo of
+    the last `memo_size` queries, the others are resolved concurrently.
+
+    Args:
+        rows (Iterable[Dict[str, Any]]): The rows, consumed lazily.
+        token (str): API token for authenticating requests.
+        fields (Sequence[str]): Dotted paths of the `LocationModelItem`
+        fields added to each row, e.g. "Country.ID".
+        max_concurrency (int): The maximum number of lookups in flight.
+        chunk_size (int): The number of rows read ahead.
+        memo_size (int): The number of resolved queries remembered.
+        precision (int): The number of decimals coordinates are rounded to.
+        location_cache (LocationCache, optional): A cache for location
+        lookups that outlives the stream, e.g. a `SQLiteLocationCache`. None
+        by default, the memo already answers repeated queries.
+        geo_index (GeoIndex, optional): The spatial index that answers
+        coordinates near an already resolved location.
+        transport (Transport, optional): The transport for all requests,
+        defaults to a transport with a pool of `max_concurrency` connections
+        that is closed when the stream is done.
+        api_root (str, optional): The root URL of the API, e.g. to use a
+        local stand-in server.
+        https (bool): Sends the requests over HTTPS instead of HTTP.
+        stats (Counter, optional): Counts rows, lookups, memo hits and
+        errors.
+
+    Returns:
+        Iterator[Dict[str, Any]]: Each row in input order with a
+        "location_key" column, the requested fields and an "error" column.
+    """
+    own_transport = transport is None
+    if own_transport:
+        transport = Transport(pool_maxsize=max_concurrency)
+    stats = stats if stats is not None else Counter()
+    memo: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+
+    empty = dict.fromkeys(["location_key", *fields])
+
+    def failed(error: Exception) -> Dict[str, Any]:
+        return {**empty, "error": str(error)}
+
+    def lookup(query: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            client = get_location_model(
+                token=token,
+                cache=location_cache,
+                geo_index=geo_index,
+                transport=transport,
+                api_root=api_root,
+                https=https,
+                **query,
+            )
+            item = client.location.get_location_item()
+        except Exception as e:
+            return failed(e)
+        resolved = {"location_key": item.Key}
+        resolved.update({path: _field(item, path) for path in fields})
+        resolved["error"] = None
+        return resolved
+
+    rows = iter(rows)
+    try:
+        with ThreadPoolExecutor(max_concurrency) as executor:
+            while True:
+                chunk = list(islice(rows, chunk_size))
+                if not chunk:
+                    return
+                keys = []
+                known: Dict[str, Dict[str, Any]] = {}
+                unique: Dict[str, Dict[str, Any]] = {}
+                for row in chunk:
+                    try:
+                        query = _query(row)
+                        key = location_cache_key(**query, precision=precision)
+                    except (TypeError, ValueError) as e:
+                        keys.append(e)
+                        continue
+                    keys.append(key)
+                    if key in known or key in unique:
+                        continue
+                    if key in memo:
+                        memo.move_to_end(key)
+                        known[key] = memo[key]
+                        stats["memo_hits"] += 1
+                    else:
+                        unique[key] = query
+                stats["lookups"] += len(unique)
+                for key, resolved in zip(
+                    unique, executor.map(lookup, unique.values())
+                ):
+                    known[key] = resolved
+                    # Failed lookups are retried when the query comes back
+                    if resolved["error"] is None:
+                        memo[key] = resolved
+                        if len(memo) > memo_size:
+                            memo.popitem(last=False)
+                for row, key in zip(chunk, keys):
+                    stats["rows"] += 1
+                    if isinstance(key, Exception):
+                        resolved = failed(key)
+                    else:
+                        resolved = known[key]
+                    if resolved["error"] is not None:
+                        stats["errors"] += 1
+                    yield {**row, **resolved}
+    finally:
+        if own_transport:
+            transport.close()
+
+
+def _writer(file: IO[str], format: str):
+    """Returns a function that writes a row to a CSV or JSONL file."""
+    if format == "jsonl":
+
+        def write(row: Dict[str, Any]) -> None:
+            file.write(json.dumps(row, default=str) + "\n")
+
+        return write
+    writer: Optional[csv.DictWriter] = None
+
+    def write(row: Dict[str, Any]) -> None:
+        nonlocal writer
+        if writer is None:
+            writer = csv.DictWriter(
+                file, fieldnames=list(row), extrasaction="ignore"
+            )
+            writer.writeheader()
+        writer.writerow(row)
+
+    return write
+
+
+def resolve_location_file(
+    source: str,
+    destination: str,
+    token: str,
+    input_format: Optional[str] = None,
+    output_format: Optional[str] = None,
+    **kwargs,
+) -> Counter:
+    """
+    Resolves the locations of a CSV or JSONL file into another CSV or JSONL
+    file, writing each row as soon as its chunk is resolved.
+
+    Args:
+        source (str): The path of the input file.
+        destination (str): The path of the output file.
+        token (str): API token for authenticating requests.
+        input_format (str, optional): "csv" or "jsonl", guessed from the
+        extension of `source` by default.
+        output_format (str, optional): "csv" or "jsonl", guessed from the
+        extension of `destination` by default.
+        **kwargs: Keyword arguments passed to `resolve_locations`.
+
+    Returns:
+        Counter: The number of rows, lookups, memo hits and errors.
+
+    Raises:
+        ValueError: If a format is unknown.
+    """
+    output_format = _format(destination, output_format)
+    rows = read_location_queries(source, input_format)
+    stats = kwargs.pop("stats", None)
+    stats = stats if stats is not None else Counter()
+    with open(destination, "w", newline="", encoding="utf-8") as file:
+        write = _writer(file, output_format)
+        for row in resolve_locations(rows, token, stats=stats, **kwargs):
+            write(row)
+    return stats
@@ -13,33 +13,129 @@ Classes:
     - LocationCityClient: API client for fetching location data by city name.
 
 Functions:
+    - api_params: Builds the query parameters of an API request.
     - get_location_model: Factory function to initialize the correct client
       based on the input parameters.
 """
 
+import json
+import time
+from abc import abstractmethod
 from urllib import parse
 from typing import Any, Dict, Optional
 
-from pydantic import Field, model_validator
-from requests import Session
-
+from pydantic import ConfigDict, Field, model_validator
+
+from accuweather_client.cache import (
+    GeoIndex,
+    LocationCache,
+    location_cache_key,
+)
+from accuweather_client.http import Transport, get_default_transport
+from accuweather_client.instrumentation import (
+    CacheEvent,
+    Instrumentation,
+    ParseEvent,
+)
 from accuweather_client.models import TokenValidation, LocationModel
 
+API_ROOT = "http://dataservice.accuweather.com/"
+
+
+def api_params(
+    token: str,
+    details: bool = True,
+    metric: Optional[bool] = None,
+    language: Optional[str] = None,
+) -> Dict[str, str]:
+    """
+    Builds the query parameters of an API request.
+
+    Args:
+        token (str): The API token.
+        details (bool): Whether the response includes the full details.
+        metric (Optional[bool]): Whether forecasts are in metric units, the
+        API default when None. Ignored by the location and current
+        conditions endpoints.
+        language (Optional[str]): The language of the localized texts, e.g.
+        "de-de", the API default when None.
+
+    Returns:
+        Dict[str, str]: The query parameters.
+    """
+    params = {"apikey": token, "details": "true" if details else "false"}
+    if metric is not None:
+        params["metric"] = "true" if metric else "false"
+    if language:
+        params["language"] = language
+    return params
+
+
+def with_https(url: str, https: bool = True) -> str:
+    """
+    Switches a URL to HTTPS.
+
+    Args:
+        url (str): The URL.
+        https (bool): Whether to switch, the URL is returned as is otherwise.
+
+    Returns:
+        str: The URL with the "https" scheme when `https` is set.
+    """
+    if https and url.startswith("http://"):
+        return "https://" + url.removeprefix("http://")
+    return url
+
 
 class LocationBaseClient(TokenValidation):
     """
     Base API client for interacting with the location API of AccuWeather.
 
     Attributes:
-        session (Session): A requests session used for making HTTP requests.
+        transport (Transport): The pooled HTTP transport used for requests,
+        shared by all clients by default.
         location (Optional[LocationModel]): The location model generated from
         the API response. query_url (Optional[str]): The URL used for making
         the location API request.
+        api_root (Optional[str]): The root URL of the API, replacing
+        "http://dataservice.accuweather.com/" in the endpoint URL, e.g. to
+        use HTTPS or a local stand-in server.
+        cache (Optional[LocationCache]): A cache that is checked before the
+        location API is queried.
+        geo_index (Optional[GeoIndex]): A spatial index that every resolved
+        location is added to; coordinate lookups near a known location are
+        answered from it.
+        lazy (bool): Skips the location lookup on construction; call
+        `fetch_location` to resolve the location later.
+        fast_parse (bool): Validates responses straight from the raw JSON
+        bytes instead of decoding them first.
+        priority (int): The priority of the requests for the rate limiter of
+        the token.
+        instrumentation (Optional[Instrumentation]): Receives the timing of
+        the request and parsing phases and the outcome of cache lookups.
+        details (bool): Requests the `Details` block of the location, with
+        its sources, DMA and radar codes. Without details the response is
+        several times smaller and `Details` is None.
+        language (Optional[str]): The language of the localized names, e.g.
+        "de-de".
+        https (bool): Sends the requests over HTTPS instead of HTTP.
     """
 
-    session: type = Session
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    transport: Transport = Field(default_factory=get_default_transport)
     location: Optional[LocationModel] = None
     query_url: Optional[str] = None
+    api_root: Optional[str] = None
+    cache: Optional[LocationCache] = None
+    geo_index: Optional[GeoIndex] = None
+    lazy: bool = False
+    fast_parse: bool = False
+    priority: int = 0
+    instrumentation: Optional[Instrumentation] = None
+    details: bool = True
+    language: Optional[str] = None
+    https: bool = False
 
     @model_validator(mode="before")
     @classmethod
@@ -68,14 +164,25 @@ class LocationBaseClient(TokenValidation):
             )
         return values
 
+    @abstractmethod
+    def cache_key(self) -> str:
+        """
+        Returns the key under which the location is cached.
+
+        Returns:
+            str: The normalized cache key of the location query.
+        """
+
     @model_validator(mode="after")
     @classmethod
     def create_location_attribute(
         cls, values: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
-        Creates the location attribute by making a request to the AccuWeather
-        API.
+        Creates the location attribute from the cache or, on a cache miss, by
+        making a request to the AccuWeather API. The lookup is skipped for
+        lazy clients and for clients whose location is already set, which
+        happens when pydantic revalidates a client assigned to a field.
 
         Args:
             values (Dict[str, Any]): The dictionary of values passed during
@@ -89,18 +196,170 @@ class LocationBaseClient(TokenValidation):
             ValueError: If the API request fails or if the location data could
             not be fetched.
         """
-        loc_session = cls.model_fields["session"].default()
+        if not values.lazy and values.location is None:
+            values.fetch_location()
+        return values
+
+    @classmethod
+    def endpoint_url(cls, values: Dict[str, Any]) -> str:
+        """
+        Returns the base URL of the endpoint of the client, moved to the
+        `api_root` of the values when one is given and switched to HTTPS
+        when `https` is set.
+
+        Args:
+            values (Dict[str, Any]): The dictionary of values passed during
+            initialization.
+
+        Returns:
+            str: The base URL of the endpoint.
+        """
+        base_url = cls.model_fields["base_url"].default
+        if values.get("api_root"):
+            base_url = values["api_root"] + base_url.removeprefix(API_ROOT)
+        return with_https(base_url, values.get("https", False))
+
+    @property
+    def query_params(self) -> Dict[str, str]:
+        """The query parameters sent with the location API request."""
+        return api_params(
+            self.token, details=self.details, language=self.language
+        )
+
+    def load_cached_location(self) -> Optional[LocationModel]:
+        """
+        Sets the location attribute from the cache, if possible.
+
+        Returns:
+            Optional[LocationModel]: The cached location, or None if there is
+            no cache or the query is not cached.
+        """
+        if self.cache is None:
+            return None
+        key = self.cache_key()
+        cached = self.cache.get(key)
+        self.emit_cache_event("location", key, cached is not None)
+        if cached is None:
+            return None
+        self.location = LocationModel(response=cached)
+        return self.location
+
+    def emit_cache_event(self, cache: str, key: str, hit: bool) -> None:
+        """Emits the outcome of a cache lookup to the instrumentation."""
+        if self.instrumentation is not None:
+            self.instrumentation.emit(
+                CacheEvent(
+                    cache=cache, key=key, outcome="hit" if hit else "miss"
+                )
+            )
+
+    @property
+    def endpoint(self) -> str:
+        """The location API endpoint, e.g. "locations/v1/cities/search"."""
+        return parse.urlsplit(self.query_url).path.lstrip("/")
+
+    def set_location_from_response(self, content: bytes) -> LocationModel:
+        """
+        Sets the location attribute from the raw body of a location API
+        response, on the fast or the standard parsing path, and emits the
+        timing of the parsing.
+
+        Args:
+            content (bytes): The raw JSON body of the response.
+
+        Returns:
+            LocationModel: The location model built from the body.
+        """
+        start = time.perf_counter()
+        if self.fast_parse:
+            decoded = start
+            location = self.set_location_from_json(content)
+        else:
+            payload = json.loads(content)
+            decoded = time.perf_counter()
+            location = self.set_location(payload)
+        if self.instrumentation is not None:
+            self.instrumentation.emit(
+                ParseEvent(
+                    endpoint=self.endpoint,
+                    model="LocationModel",
+                    decode=decoded - start,
+                    validation=time.perf_counter() - decoded,
+                    bytes_parsed=len(content),
+                )
+            )
+        return location
+
+    def set_location(self, payload: Any) -> LocationModel:
+        """
+        Sets the location attribute from the JSON payload of a location API
+        response and stores the payload in the cache.
+
+        Args:
+            payload (Any): The decoded JSON body of the response.
+
+        Returns:
+            LocationModel: The location model built from the payload.
+        """
+        self.location = LocationModel(response=payload)
+        if self.cache is not None and payload:
+            self.cache.set(self.cache_key(), payload)
+        self.index_location()
+        return self.location
+
+    def set_location_from_json(self, content: bytes) -> LocationModel:
+        """
+        Sets the location attribute straight from the raw body of a location
+        API response and stores the location in the cache.
+
+        Args:
+            content (bytes): The raw JSON body of the response.
+
+        Returns:
+            LocationModel: The location model built from the body.
+        """
+        self.location = LocationModel.from_json(content)
+        if self.cache is not None and self.location.response:
+            self.cache.set(
+                self.cache_key(), self.location.model_dump()["response"]
+            )
+        self.index_location()
+        return self.location
+
+    def index_location(self) -> None:
+        """Adds the locations of the location attribute to the geo index."""
+        if self.geo_index is None or self.location is None:
+            return
+        response = self.location.response
+        for item in response if isinstance(response, list) else [response]:
+            self.geo_index.add(item)
+
+    def fetch_location(self) -> LocationModel:
+        """
+        Fetches the location from the cache or the AccuWeather API.
+
+        Returns:
+            LocationModel: The location model.
+
+        Raises:
+            ValueError: If the API request fails or if the location data could
+            not be fetched.
+        """
+        cached = self.load_cached_location()
+        if cached is not None:
+            return cached
         try:
-            response = loc_session.request(
-                method="GET",
-                url=values.query_url,
-                params={"apikey": values.token, "details": "true"},
+            response = self.transport.get(
+                self.query_url,
+                params=self.query_params,
+                priority=self.priority,
+                instrumentation=self.instrumentation,
+                endpoint=self.endpoint,
             )
             response.raise_for_status()
-            values.location = LocationModel(response=response.json())
+            return self.set_location_from_response(response.content)
         except Exception as e:
-            raise ValueError(f"Failed to fetch location data: {e}")
-        return values
+            raise ValueError(f"Failed to fetch location data: {e}") from e
 
 
 class LocationCityClient(LocationBaseClient):
@@ -133,12 +392,17 @@ class LocationCityClient(LocationBaseClient):
             Dict[str, Any]: The dictionary of values with the query URL set.
         """
         if not values.get("country"):
-            url = f"{cls.model_fields['base_url'].default}cities/search?q={values['city']}"
+            url = f"{cls.endpoint_url(values)}cities/search?q={values['city']}"
         else:
-            url = f"{cls.model_fields['base_url'].default}search?q={values['city']}%20{values['country']}"
+            url = f"{cls.endpoint_url(values)}search?q={values['city']}%20{values['country']}"
         values["query_url"] = url
         return values
 
+    def cache_key(self) -> str:
+        return location_cache_key(
+            city=self.city, country=self.country, params=self.query_params
+        )
+
 
 class LocationPOIClient(LocationBaseClient):
     """
@@ -168,12 +432,13 @@ class LocationPOIClient(LocationBaseClient):
         Returns:
             Dict[str, Any]: The dictionary of values with the query URL set.
         """
-        url = cls.model_fields["base_url"].default + parse.quote(
-            values.get("poi")
-        )
+        url = cls.endpoint_url(values) + parse.quote(values.get("poi"))
         values["query_url"] = url
         return values
 
+    def cache_key(self) -> str:
+        return location_cache_key(poi=self.poi, params=self.query_params)
+
 
 class LocationGEOClient(LocationBaseClient):
     """
@@ -214,7 +479,7 @@ class LocationGEOClient(LocationBaseClient):
             Dict[str, Any]: The dictionary of values with the query URL set.
         """
         url = (
-            cls.model_fields["base_url"].default
+            cls.endpoint_url(values)
             + str(values.get("lat"))
             + ","
             + str(values.get("lon"))
@@ -222,6 +487,35 @@ class LocationGEOClient(LocationBaseClient):
         values["query_url"] = url
         return values
 
+    def cache_key(self) -> str:
+        return location_cache_key(
+            lat=self.lat,
+            lon=self.lon,
+            precision=self.cache.geo_precision,
+            params=self.query_params,
+        )
+
+    def load_cached_location(self) -> Optional[LocationModel]:
+        """
+        Sets the location attribute from the cache or, failing that, from
+        the nearest location of the geo index within its radius.
+
+        Returns:
+            Optional[LocationModel]: The known location, or None if neither
+            the cache nor the geo index knows the coordinates.
+        """
+        cached = super().load_cached_location()
+        if cached is not None or self.geo_index is None:
+            return cached
+        nearest = self.geo_index.nearest(self.lat, self.lon)
+        self.emit_cache_event(
+            "geo_index", f"{self.lat},{self.lon}", nearest is not None
+        )
+        if nearest is None:
+            return None
+        self.location = LocationModel.model_construct(response=nearest[0])
+        return self.location
+
 
 def get_location_model(
     city: str | None = None,
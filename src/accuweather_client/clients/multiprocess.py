@@ -0,0 +1,303 @@
+"""
+multiprocess.py
+
+This module fans batch fetches out over a pool of worker processes, so that
+parsing and CPU-heavy post-processing of the results scale with the cores
+instead of being serialized by the GIL. Every worker runs `fetch_many` on
+chunks of locations with its own connection pool, and the workers share the
+location and response caches through SQLite databases in one directory.
+Results are sent back in a compact serialized form, the JSON bytes of each
+model or the value a `transform` computed from it in the worker, instead of
+pickled pydantic trees.
+
+Example:
+    def daily_maximum(endpoint, forecast):
+        return [day.temperature["Maximum"]["Value"]
+                for day in forecast.daily_forecasts]
+
+    for result in fetch_many_processes(
+        cities, token="your_api_key", endpoints=["daily"],
+        processes=4, transform=daily_maximum,
+    ):
+        print(result.location_key, result.results["daily"])
+
+Functions:
+    - fetch_many_processes: Fetches several endpoints for many locations on
+      a pool of worker processes.
+"""
+
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor
+from concurrent.futures import wait
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from typing import Sequence
+
+from pydantic import BaseModel
+
+from accuweather_client.cache import (
+    LRULocationCache,
+    ResponseCache,
+    SQLiteLocationCache,
+    SQLiteResponseBackend,
+    TieredLocationCache,
+)
+from accuweather_client.clients.batch import ENDPOINTS, fetch_many
+from accuweather_client.http import Transport
+from accuweather_client.models import BatchResult, SerializedBatchResult
+
+Transform = Callable[[str, BaseModel], Any]
+
+# Caches and transport of the worker process, set by `_init_worker`
+_worker: Optional[tuple[TieredLocationCache, ResponseCache, Transport]] = None
+
+
+def _open_caches(
+    cache_dir: str,
+) -> tuple[SQLiteLocationCache, SQLiteResponseBackend]:
+    """Opens the SQLite caches of a cache directory, creating them."""
+    return (
+        SQLiteLocationCache(os.path.join(cache_dir, "locations.sqlite")),
+        SQLiteResponseBackend(os.path.join(cache_dir, "responses.sqlite")),
+    )
+
+
+def _init_worker(cache_dir: str, threads: int) -> None:
+    """Opens the shared caches and the connection pool of a worker."""
+    global _worker
+    location_cache, response_backend = _open_caches(cache_dir)
+    _worker = (
+        TieredLocationCache(LRULocationCache(), location_cache),
+        ResponseCache(response_backend),
+        Transport(pool_maxsize=threads),
+    )
+
+
+def _error(error: Exception) -> str:
+    """Formats an error of a worker as its type and message."""
+    return f"{type(error).__name__}: {error}"
+
+
+def _serialize(
+    result: BatchResult, transform: Optional[Transform]
+) -> SerializedBatchResult:
+    """Converts the result of a location to its serialized form."""
+    serialized = SerializedBatchResult(
+        query=result.query,
+        location_key=result.location_key,
+        location=(
+            result.location.model_dump_json().encode()
+            if result.location is not None
+            else None
+        ),
+        errors={name: _error(e) for name, e in result.errors.items()},
+        timings=result.timings,
+    )
+    for name, model in result.results.items():
+        try:
+            serialized.results[name] = (
+                transform(name, model)
+                if transform is not None
+                else model.model_dump_json(
+                    by_alias=True, round_trip=True
+                ).encode()
+            )
+        except Exception as e:
+            serialized.errors[name] = _error(e)
+    return serialized
+
+
+def _fetch_chunk(
+    queries: List[Dict[str, Any]],
+    token: str,
+    endpoints: Sequence[str],
+    threads: int,
+    transform: Optional[Transform],
+    base_url: str,
+) -> List[SerializedBatchResult]:
+    """Fetches a chunk of locations in a worker process."""
+    location_cache, response_cache, transport = _worker
+    return [
+        _serialize(result, transform)
+        for result in fetch_many(
+            queries,
+            token,
+            endpoints=endpoints,
+            max_concurrency=threads,
+            location_cache=location_cache,
+            response_cache=response_cache,
+            transport=transport,
+            base_url=base_url,
+        )
+    ]
+
+
+def _failed_chunk(
+    queries: List[Dict[str, Any]], error: BaseException
+) -> List[SerializedBatchResult]:
+    """Builds the results of a chunk whose worker failed as a whole."""
+    return [
+        SerializedBatchResult(query=query, errors={"location": _error(error)})
+        for query in queries
+    ]
+
+
+def _chunk_results(
+    future: Future, queries: List[Dict[str, Any]]
+) -> List[SerializedBatchResult]:
+    """Returns the results of a finished chunk, failed ones on an error."""
+    try:
+        return future.result()
+    except Exception as e:
+        return _failed_chunk(queries, e)
+
+
+def fetch_many_processes(
+    locations: Iterable[Dict[str, Any]],
+    token: str,
+    endpoints: Sequence[str] = ("daily", "hourly", "current"),
+    processes: Optional[int] = None,
+    threads: int = 8,
+    chunk_size: int = 32,
+    cache_dir: Optional[str] = None,
+    transform: Optional[Transform] = None,
+    start_method: str = "spawn",
+    base_url: str = "http://dataservice.accuweather.com/",
+) -> Iterator[SerializedBatchResult]:
+    """
+    Fetches several endpoints for many locations on a pool of worker
+    processes, each running `fetch_many` with `threads` requests in flight.
+
+    Locations are sent to the workers in chunks as the iterable is consumed,
+    with at most two chunks queued per worker. Results are yielded per chunk
+    as soon as it is done, so their order may differ from the order of
+    `locations`. Failures are reported on the result of the affected location
+    and never abort the batch. When a worker process dies, the locations of
+    the chunks queued on the pool fail with a `BrokenProcessPool` error under
+    "location", and the remaining locations run on a new pool.
+
+    Args:
+        locations (Iterable[Dict[str, Any]]): Location queries with the
+        keyword arguments of `WeatherClient`, e.g. {"city": "oslo"}. They
+        are pickled and must not hold open resources.
+        token (str): API token for authenticating requests.
+        endpoints (Sequence[str]): The endpoints to fetch, any of "daily",
+        "hourly" and "current".
+        processes (int, optional): The number of worker processes, the
+        number of CPUs by default.
+        threads (int): The number of requests in flight per worker.
+        chunk_size (int): The number of locations sent to a worker at once.
+        cache_dir (str, optional): The directory of the SQLite location and
+        response caches shared by the workers, kept between batches. A
+        temporary directory that is removed afterwards by default.
+        transform (Callable[[str, BaseModel], Any], optional): Computes the
+        result of an endpoint from its model in the worker, e.g. an
+        aggregation. Must be picklable, i.e. a module-level function. The
+        models are returned as JSON bytes by default.
+        start_method (str): The multiprocessing start method of the workers.
+        "spawn" does not inherit the threads and sockets of this process.
+        base_url (str): The base URL of the API.
+
+    Returns:
+        Iterator[SerializedBatchResult]: The outcome per location.
+
+    Raises:
+        ValueError: If an unknown endpoint is requested.
+    """
+    unknown = set(endpoints) - set(ENDPOINTS)
+    if unknown:
+        raise ValueError(
+            f"Unknown endpoints {sorted(unknown)}, "
+            f"choose from {sorted(ENDPOINTS)}."
+        )
+    return _run_processes(
+        iter(locations),
+        token,
+        tuple(endpoints),
+        processes or os.cpu_count() or 1,
+        threads,
+        chunk_size,
+        cache_dir,
+        transform,
+        start_method,
+        base_url,
+    )
+
+
+def _run_processes(
+    queries: Iterator[Dict[str, Any]],
+    token: str,
+    endpoints: Sequence[str],
+    processes: int,
+    threads: int,
+    chunk_size: int,
+    cache_dir: Optional[str],
+    transform: Optional[Transform],
+    start_method: str,
+    base_url: str,
+) -> Iterator[SerializedBatchResult]:
+    """Runs the chunks of `fetch_many_processes` on the worker pool, on a
+    new pool after a worker process died."""
+    temporary = None
+    if cache_dir is None:
+        temporary = tempfile.TemporaryDirectory(prefix="accuweather-")
+        cache_dir = temporary.name
+    else:
+        os.makedirs(cache_dir, exist_ok=True)
+    # Creates the databases before the workers open them concurrently
+    _open_caches(cache_dir)
+    # Maps each future to its chunk of queries
+    pending: Dict[Future, List[Dict[str, Any]]] = {}
+    # A chunk that a broken pool rejected before running it
+    carried: List[Dict[str, Any]] = []
+    try:
+        while True:
+            with ProcessPoolExecutor(
+                processes,
+                mp_context=multiprocessing.get_context(start_method),
+                initializer=_init_worker,
+                initargs=(cache_dir, threads),
+            ) as executor:
+                broken = False
+                while not broken:
+                    while len(pending) < 2 * processes:
+                        chunk = carried or list(islice(queries, chunk_size))
+                        carried = []
+                        if not chunk:
+                            break
+                        try:
+                            future = executor.submit(
+                                _fetch_chunk,
+                                chunk,
+                                token,
+                                endpoints,
+                                threads,
+                                transform,
+                                base_url,
+                            )
+                        except BrokenProcessPool:
+                            carried, broken = chunk, True
+                            break
+                        pending[future] = chunk
+                    if broken:
+                        break
+                    if not pending:
+                        return
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        broken = broken or isinstance(
+                            future.exception(), BrokenProcessPool
+                        )
+                        yield from _chunk_results(future, pending.pop(future))
+                # The other chunks of a broken pool fail right away too
+                for future in wait(pending).done:
+                    yield from _chunk_results(future, pending.pop(future))
+    finally:
+        # Drops the queued chunks when the results are no longer consumed
+        for future in pending:
+            future.cancel()
+        if temporary is not None:
+            temporary.cleanup()
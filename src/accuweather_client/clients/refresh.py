@@ -0,0 +1,434 @@
+"""
+refresh.py
+
+This module keeps the forecasts of a hot set of locations warm in the
+background, so that user-facing requests are served from memory instead of
+waiting on the API. Every endpoint of every registered location key is
+refreshed when its data reaches the refresh interval of the endpoint. Reads
+return the last good value immediately, even when it is stale, and trigger a
+revalidation in the background. Refresh times are jittered and dispatched at
+a bounded rate and concurrency, with a lower priority than interactive
+requests, so a large hot set never hits the API quota in bursts.
+
+Example:
+    with BackgroundRefresher(token="your_api_key") as refresher:
+        refresher.add("349727", "22889")
+        conditions = refresher.get("current", "349727")
+
+Classes:
+    - RefreshEntry: The last value of an endpoint of a location.
+    - BackgroundRefresher: Keeps the endpoints of hot locations warm.
+"""
+
+import heapq
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from itertools import count
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from pydantic import BaseModel, ConfigDict
+
+from accuweather_client.cache import ResponseCache
+from accuweather_client.clients.batch import ENDPOINTS
+from accuweather_client.clients.weather import WeatherClient
+from accuweather_client.http import Transport
+from accuweather_client.instrumentation import Instrumentation
+
+# Seconds after which the data of an endpoint is refreshed, see DEFAULT_TTLS
+REFRESH_INTERVALS: Dict[str, float] = {
+    "current": 10 * 60,
+    "hourly": 30 * 60,
+    "daily": 60 * 60,
+}
+
+
+class RefreshEntry(BaseModel):
+    """
+    The last value of an endpoint of a location.
+
+    Attributes:
+        value (Any): The last good model, None before the first success.
+        fetched_at (Optional[float]): The UNIX time of the last success.
+        error (Optional[Exception]): The error of the last refresh, None
+        when it succeeded.
+        failures (int): The number of refreshes that failed in a row.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    value: Any = None
+    fetched_at: Optional[float] = None
+    error: Optional[Exception] = None
+    failures: int = 0
+
+    @property
+    def age(self) -> Optional[float]:
+        """The seconds since the last success, None before it."""
+        if self.fetched_at is None:
+            return None
+        return time.time() - self.fetched_at
+
+
+class _Slot:
+    """Scheduling state of an endpoint of a location."""
+
+    __slots__ = ("entry", "due", "future")
+
+    def __init__(self, due: float) -> None:
+        self.entry = RefreshEntry()
+        self.due = due
+        self.future: Optional[Future] = None
+
+
+class BackgroundRefresher:
+    """
+    Keeps the endpoints of a hot set of location keys warm in the
+    background and serves their last good values.
+
+    Attributes:
+        token (str): API token for authenticating requests.
+        endpoints (Tuple[str, ...]): The refreshed endpoints, any of
+        "current", "hourly" and "daily".
+        intervals (Dict[str, float]): The seconds after which the data of
+        each endpoint is refreshed.
+        jitter (float): The relative random spread of the refresh times,
+        e.g. 0.1 refreshes after 90% to 110% of the interval.
+        warmup (float): The seconds over which the first refreshes of newly
+        added locations are spread.
+        max_rate (Optional[float]): The maximum number of refreshes started
+        per second, unbounded when None.
+        retry_delay (float): The seconds before the first retry of a failed
+        refresh, doubled for every further failure up to the interval.
+        max_concurrency (int): The maximum number of refreshes in flight.
+        priority (int): The rate limiter priority of the refreshes, below
+        the default priority of interactive requests.
+        base_url (str): The base URL of the API.
+        response_cache (Optional[ResponseCache]): The cache for the
+        responses.
+        transport (Optional[Transport]): The transport for all requests,
+        defaults to a transport with a pool of `max_concurrency` connections
+        that is closed on `stop`.
+        instrumentation (Optional[Instrumentation]): Receives the request,
+        parse and cache events.
+        stats (Counter): Counts the refreshes, failures, and the fresh,
+        stale and missing reads.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        endpoints: Sequence[str] = ("current", "hourly"),
+        intervals: Optional[Mapping[str, float]] = None,
+        jitter: float = 0.1,
+        warmup: float = 10.0,
+        max_concurrency: int = 4,
+        max_rate: Optional[float] = None,
+        retry_delay: float = 30.0,
+        priority: int = -1,
+        base_url: str = "http://dataservice.accuweather.com/",
+        response_cache: Optional[ResponseCache] = None,
+        transport: Optional[Transport] = None,
+        instrumentation: Optional[Instrumentation] = None,
+    ) -> None:
+        unknown = set(endpoints) - set(ENDPOINTS)
+        if unknown:
+            raise ValueError(
+                f"Unknown endpoints {sorted(unknown)}, "
+                f"choose from {sorted(ENDPOINTS)}."
+            )
+        self.token = token
+        self.endpoints = tuple(endpoints)
+        self.intervals = {**REFRESH_INTERVALS, **(intervals or {})}
+        self.jitter = jitter
+        self.warmup = warmup
+        self.max_rate = max_rate
+        self.retry_delay = retry_delay
+        self.stats: Counter = Counter()
+        self._client_options = {
+            "token": token,
+            "base_url": base_url,
+            "response_cache": response_cache,
+            "priority": priority,
+            "instrumentation": instrumentation,
+            "fast_parse": True,
+        }
+        self._own_transport = transport is None
+        self._transport = transport or Transport(pool_maxsize=max_concurrency)
+        self._max_concurrency = max_concurrency
+        self._clients: Dict[str, WeatherClient] = {}
+        self._slots: Dict[Tuple[str, str], _Slot] = {}
+        self._heap: List[Tuple[float, int, str, str]] = []
+        self._sequence = count()
+        self._condition = threading.Condition()
+        self._running = False
+        self._in_flight = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "BackgroundRefresher":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def start(self) -> "BackgroundRefresher":
+        """
+        Starts the scheduler thread and the refresh workers.
+
+        Returns:
+            BackgroundRefresher: The refresher itself.
+        """
+        with self._condition:
+            if self._running:
+                return self
+            self._running = True
+            self._executor = ThreadPoolExecutor(
+                self._max_concurrency,
+                thread_name_prefix="accuweather-refresh",
+            )
+            self._thread = threading.Thread(
+                target=self._run, name="accuweather-refresher", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops refreshing and waits for the refreshes in flight."""
+        with self._condition:
+            if not self._running:
+                return
+            self._running = False
+            self._condition.notify_all()
+        self._thread.join()
+        self._executor.shutdown(wait=True)
+        if self._own_transport:
+            self._transport.close()
+
+    def add(self, *location_keys: str) -> None:
+        """
+        Adds location keys to the hot set. Their first refreshes are spread
+        over the warmup period.
+
+        Args:
+            *location_keys (str): The location keys.
+        """
+        now = time.time()
+        with self._condition:
+            for key in map(str, location_keys):
+                for endpoint in self.endpoints:
+                    if (endpoint, key) in self._slots:
+                        continue
+                    due = now + random.uniform(0.0, self.warmup)
+                    self._slots[endpoint, key] = _Slot(due)
+                    self._push(due, endpoint, key)
+            self._condition.notify_all()
+
+    def remove(self, *location_keys: str) -> None:
+        """
+        Removes location keys from the hot set and drops their values.
+
+        Args:
+            *location_keys (str): The location keys.
+        """
+        with self._condition:
+            for key in map(str, location_keys):
+                for endpoint in self.endpoints:
+                    self._slots.pop((endpoint, key), None)
+                self._clients.pop(key, None)
+
+    @property
+    def location_keys(self) -> List[str]:
+        """The location keys of the hot set."""
+        with self._condition:
+            return sorted({key for _, key in self._slots})
+
+    def entry(self, endpoint: str, location_key: str) -> RefreshEntry:
+        """
+        Returns the last value of an endpoint of a location with its age
+        and the error of the last refresh.
+
+        Args:
+            endpoint (str): The endpoint, e.g. "current".
+            location_key (str): The location key.
+
+        Returns:
+            RefreshEntry: The entry.
+
+        Raises:
+            KeyError: If the location or endpoint is not refreshed.
+        """
+        with self._condition:
+            return self._slot(endpoint, location_key).entry.model_copy()
+
+    def get(
+        self,
+        endpoint: str,
+        location_key: str,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        Returns the last good value of an endpoint of a location without
+        waiting on the API. A stale value triggers a refresh in the
+        background. Only before the first successful refresh does the call
+        wait for a refresh.
+
+        Args:
+            endpoint (str): The endpoint, e.g. "current".
+            location_key (str): The location key.
+            timeout (Optional[float]): The seconds to wait for the first
+            value.
+
+        Returns:
+            Any: The model of the endpoint, e.g. `CurrentConditionsModel`.
+
+        Raises:
+            KeyError: If the location or endpoint is not refreshed.
+            TimeoutError: If the first value did not arrive in time.
+            Exception: The error of the first refresh when it failed.
+        """
+        with self._condition:
+            slot = self._slot(endpoint, location_key)
+            entry = slot.entry
+            if entry.fetched_at is not None:
+                stale = entry.age > self.intervals[endpoint]
+                self.stats["stale_reads" if stale else "fresh_reads"] += 1
+                if stale and self._running:
+                    self._revalidate(slot, endpoint, str(location_key))
+                return entry.value
+            self.stats["missing_reads"] += 1
+            future = self._revalidate(slot, endpoint, str(location_key))
+        try:
+            future.result(timeout)
+        except FutureTimeoutError as e:
+            raise TimeoutError(
+                f"No {endpoint} value for {location_key} yet."
+            ) from e
+        entry = self.entry(endpoint, location_key)
+        if entry.fetched_at is None:
+            raise entry.error
+        return entry.value
+
+    def refresh(self, endpoint: str, location_key: str) -> Future:
+        """
+        Refreshes an endpoint of a location now, unless a refresh is
+        already in flight.
+
+        Args:
+            endpoint (str): The endpoint, e.g. "current".
+            location_key (str): The location key.
+
+        Returns:
+            Future: Completes when the refresh is done.
+
+        Raises:
+            KeyError: If the location or endpoint is not refreshed.
+        """
+        with self._condition:
+            slot = self._slot(endpoint, location_key)
+            return self._revalidate(slot, endpoint, str(location_key))
+
+    def _slot(self, endpoint: str, location_key: str) -> _Slot:
+        slot = self._slots.get((endpoint, str(location_key)))
+        if slot is None:
+            raise KeyError(
+                f"{location_key} is not refreshed for {endpoint}, "
+                "add it to the refresher first."
+            )
+        return slot
+
+    def _push(self, due: float, endpoint: str, location_key: str) -> None:
+        heapq.heappush(
+            self._heap, (due, next(self._sequence), endpoint, location_key)
+        )
+
+    def _revalidate(self, slot: _Slot, endpoint: str, key: str) -> Future:
+        """Submits a refresh of a slot, or returns the one in flight. Must
+        be called with the condition held."""
+        if slot.future is not None:
+            return slot.future
+        if not self._running:
+            raise RuntimeError("The refresher is not running, start it.")
+        self._in_flight += 1
+        slot.future = self._executor.submit(self._refresh, endpoint, key)
+        return slot.future
+
+    def _client(self, location_key: str) -> WeatherClient:
+        client = self._clients.get(location_key)
+        if client is None:
+            client = self._clients[location_key] = WeatherClient(
+                location_key=location_key,
+                transport=self._transport,
+                **self._client_options,
+            )
+        return client
+
+    def _refresh(self, endpoint: str, location_key: str) -> None:
+        """Fetches an endpoint of a location and schedules the next
+        refresh of it."""
+        with self._condition:
+            client = self._client(location_key)
+        try:
+            value = getattr(client, ENDPOINTS[endpoint])()
+            error = None
+        except Exception as e:
+            value, error = None, e
+        now = time.time()
+        interval = self.intervals[endpoint]
+        with self._condition:
+            self._in_flight -= 1
+            slot = self._slots.get((endpoint, location_key))
+            if slot is None:
+                self._condition.notify_all()
+                return
+            entry = slot.entry
+            if error is None:
+                self.stats["refreshes"] += 1
+                entry.value, entry.fetched_at = value, now
+                entry.error, entry.failures = None, 0
+                delay = interval
+            else:
+                self.stats["failures"] += 1
+                entry.error = error
+                entry.failures += 1
+                delay = min(
+                    interval, self.retry_delay * 2 ** (entry.failures - 1)
+                )
+            slot.due = now + delay * random.uniform(
+                1.0 - self.jitter, 1.0 + self.jitter
+            )
+            slot.future = None
+            self._push(slot.due, endpoint, location_key)
+            self._condition.notify_all()
+
+    def _run(self) -> None:
+        """Dispatches the due refreshes until the refresher is stopped."""
+        next_start = 0.0
+        with self._condition:
+            while self._running:
+                now = time.time()
+                wait = None
+                while self._heap:
+                    due, _, endpoint, key = self._heap[0]
+                    slot = self._slots.get((endpoint, key))
+                    # Skips removed locations and superseded schedules
+                    if slot is None or slot.due != due:
+                        heapq.heappop(self._heap)
+                        continue
+                    if slot.future is not None:
+                        heapq.heappop(self._heap)
+                        continue
+                    start = max(due, next_start)
+                    if start > now:
+                        wait = start - now
+                        break
+                    if self._in_flight >= self._max_concurrency:
+                        break
+                    heapq.heappop(self._heap)
+                    self._revalidate(slot, endpoint, key)
+                    if self.max_rate:
+                        next_start = max(now, next_start) + 1.0 / self.max_rate
+                self._condition.wait(wait)
@@ -9,52 +9,644 @@ Example:
     forecast = client.get_5day_forecast()
     print(forecast)
 
+    # Other horizons, and an incremental refresh of the 72-hour timeline
+    client.get_daily_forecast(days=15)
+    update = client.refresh_hourly_forecast(hours=72)
+    print(update.added, update.changed)
+
+    # No location lookup on construction
+    client = WeatherClient(token="your_api_key", location_key="349727")
+    client = WeatherClient(token="your_api_key", city="New York", lazy=True)
+
 Classes:
+    - WeatherBaseClient: Options, requests and parsing shared by the sync and
+      async clients.
     - WeatherClient: API client for fetching current conditions and 5-day forecasts.
+
+Functions:
+    - forecast_endpoint: Returns the endpoint of a forecast horizon.
+    - parse_response: Parses a response body into a model, timing the parse.
+    - timeline_parser: Returns a parser of response bodies into timeline rows.
 """
 
-from typing import Any, Dict, Optional
+import json
+import threading
+import time
+from abc import abstractmethod
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+from typing import TypeVar
+from urllib.parse import urlencode
 
-from pydantic import PrivateAttr, model_validator
-from requests import Session
+from pydantic import ConfigDict, Field, PrivateAttr, model_validator
 from requests.exceptions import RequestException
 
+from accuweather_client.cache import GeoIndex, LocationCache, ResponseCache
 from accuweather_client.clients import LocationBaseClient, get_location_model
+from accuweather_client.clients.location import api_params, with_https
+from accuweather_client.http import (
+    Transport,
+    WarmupReport,
+    get_default_transport,
+)
+from accuweather_client.instrumentation import Instrumentation, ParseEvent
 from accuweather_client.models import (
+    CurrentConditionModel,
     CurrentConditionsModel,
     ForecastModel5Days,
     HourlyForecastModel,
     LocationModelItem,
+    Projection,
+    TimelineStore,
+    TimelineUpdate,
     TokenValidation,
+    response_model,
 )
+from accuweather_client.models.timeline import EPOCH_PATHS, rows_of
+from accuweather_client.models.weather import CURRENT_OBSERVATIONS
+
+Model = TypeVar("Model")
+
+# Forecast lengths offered by the API, in days and in hours
+DAILY_HORIZONS = (1, 5, 10, 15)
+HOURLY_HORIZONS = (1, 12, 24, 72, 120)
+FORECAST_MODELS = {"daily": ForecastModel5Days, "hourly": HourlyForecastModel}
 
 
-class WeatherClient(TokenValidation):
+def forecast_endpoint(kind: str, length: int) -> str:
     """
-    AccuWeather API client for retrieving a 5-day weather forecast and current weather conditions.
+    Returns the endpoint of a forecast horizon.
+
+    Args:
+        kind (str): "daily" or "hourly".
+        length (int): The number of days or hours, see `DAILY_HORIZONS` and
+        `HOURLY_HORIZONS`.
+
+    Returns:
+        str: The endpoint, e.g. "forecasts/v1/hourly/72hour/".
+
+    Raises:
+        ValueError: If the API does not offer the horizon.
+    """
+    if kind == "daily" and length in DAILY_HORIZONS:
+        return f"forecasts/v1/daily/{length}day/"
+    if kind == "hourly" and length in HOURLY_HORIZONS:
+        return f"forecasts/v1/hourly/{length}hour/"
+    horizons = DAILY_HORIZONS if kind == "daily" else HOURLY_HORIZONS
+    raise ValueError(
+        f"No {kind} forecast of {length}, choose from "
+        f"{', '.join(map(str, horizons))}."
+    )
+
+
+def parse_response(
+    content: bytes,
+    fast_parse: bool,
+    from_json: Callable[[bytes], Model],
+    from_data: Callable[[Any], Model],
+    instrumentation: Optional[Instrumentation],
+    endpoint: str,
+    model_name: Optional[str] = None,
+) -> Model:
+    """
+    Parses the body of a response with `from_json` on the fast parsing path,
+    or decodes it and validates the data with `from_data`, and emits the
+    timing of both phases when instrumentation is enabled.
+
+    Args:
+        content (bytes): The raw JSON body of the response.
+        fast_parse (bool): Whether to validate the raw bytes directly.
+        from_json (Callable[[bytes], Model]): Builds the model from bytes.
+        from_data (Callable[[Any], Model]): Builds the model from the
+        decoded JSON.
+        instrumentation (Optional[Instrumentation]): Receives the parse
+        event.
+        endpoint (str): The API endpoint of the response.
+        model_name (Optional[str]): The name of the model in the parse
+        event, the class name of the model by default.
+
+    Returns:
+        Model: The model.
+    """
+    start = time.perf_counter()
+    if fast_parse:
+        decoded = start
+        model = from_json(content)
+    else:
+        data = json.loads(content)
+        decoded = time.perf_counter()
+        model = from_data(data)
+    if instrumentation is not None:
+        instrumentation.emit(
+            ParseEvent(
+                endpoint=endpoint,
+                model=model_name or type(model).__name__,
+                decode=decoded - start,
+                validation=time.perf_counter() - decoded,
+                bytes_parsed=len(content),
+            )
+        )
+    return model
+
+
+def timeline_parser(
+    kind: str,
+    endpoint: str,
+    params: Dict[str, str],
+    fields: Optional[Sequence[str]],
+    fast_parse: bool,
+    instrumentation: Optional[Instrumentation],
+) -> tuple[str, Callable[[bytes], Sequence[Any]]]:
+    """
+    Returns the source label of a forecast request and a parser of its
+    response bodies into timeline rows.
+
+    Args:
+        kind (str): "daily" or "hourly".
+        endpoint (str): The API endpoint of the forecast.
+        params (Dict[str, str]): The query parameters of the request.
+        fields (Optional[Sequence[str]]): The fields to parse, all by
+        default. The epoch time is always parsed.
+        fast_parse (bool): Whether to validate the raw bytes directly.
+        instrumentation (Optional[Instrumentation]): Receives the parse
+        events.
+
+    Returns:
+        tuple[str, Callable[[bytes], Sequence[Any]]]: The source and the
+        parser.
+    """
+    query = sorted((k, v) for k, v in params.items() if k != "apikey")
+    if fields:
+        fields = [*fields, EPOCH_PATHS[kind]]
+        query.append(("fields", ",".join(sorted(set(fields)))))
+    model = response_model(
+        FORECAST_MODELS[kind], params["details"] == "true", fields
+    )
+    source = endpoint + "?" + urlencode(query)
+    return source, lambda content: rows_of(
+        kind,
+        parse_response(
+            content,
+            fast_parse,
+            model.from_json,
+            model.from_api_response,
+            instrumentation,
+            endpoint,
+        ),
+    )
+
+
+class _Call(NamedTuple):
+    """A request of a client and the parsing of its response body."""
+
+    endpoint: str
+    params: Dict[str, str]
+    parse: Callable[[bytes], Any]
+
+
+class WeatherBaseClient(TokenValidation):
+    """
+    Base class of the sync and async AccuWeather API clients. It holds the
+    options of the client and builds its requests and the parsing of their
+    responses; the subclasses only send the requests, in `_perform`. The
+    request methods of `AsyncWeatherClient` return awaitables of the
+    results.
 
     Attributes:
         token (str): API token for authenticating requests to the AccuWeather API.
         city (Optional[str]): The city name for which to fetch weather data.
         country (Optional[str]): The country associated with the city (optional).
         poi (Optional[str]): The Point of Interest for which to fetch weather data.
+        lat (Optional[float]): The latitude for which to fetch weather data.
+        lon (Optional[float]): The longitude for which to fetch weather data.
         base_url (str): The base URL for the AccuWeather API endpoints.
-        _session (Session): A requests session used for making HTTP requests.
         location_client (Optional[LocationBaseClient]): Client for fetching location-related data.
-        location (Optional[LocationModel]): Location data model retrieved from the location client.
+        location (Optional[LocationModelItem]): Location data model of the resolved location.
         location_key (Optional[str]): The location key used to specify a location in API requests.
+        location_cache (Optional[LocationCache]): Cache checked before the location API is queried.
+        geo_index (Optional[GeoIndex]): Spatial index of resolved locations, answers nearby coordinates without a lookup.
+        response_cache (Optional[ResponseCache]): Cache for the responses of the weather endpoints.
+        fast_parse (bool): Validates responses straight from the raw JSON bytes instead of decoding them first.
+        priority (int): The priority of the requests for the rate limiter of the token.
+        instrumentation (Optional[Instrumentation]): Receives the timing of every request and parsing phase and the outcome of cache lookups.
+        details (bool): Requests the full details of locations and forecasts. Without details the responses are smaller and forecasts are parsed into projections of the fields the API still returns.
+        metric (Optional[bool]): Requests forecasts in metric units, the API default when None.
+        language (Optional[str]): The language of the localized texts, e.g. "de-de", the API default when None.
+        timelines (TimelineStore): The forecast timelines kept by the incremental refreshes, share a store between clients to keep all locations in one place.
+        https (bool): Sends all requests over HTTPS, switching the scheme of `base_url`.
     """
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     city: Optional[str] = None
     country: Optional[str] = None
     poi: Optional[str] = None
     lat: Optional[float] = None
     lon: Optional[float] = None
     base_url: str = "http://dataservice.accuweather.com/"
-    _session: Session = PrivateAttr(default_factory=Session)
     location_client: Optional[LocationBaseClient] = None
     location: Optional[LocationModelItem] = None
     location_key: Optional[str] = None
+    location_cache: Optional[LocationCache] = None
+    geo_index: Optional[GeoIndex] = None
+    response_cache: Optional[ResponseCache] = None
+    fast_parse: bool = False
+    priority: int = 0
+    instrumentation: Optional[Instrumentation] = None
+    details: bool = True
+    metric: Optional[bool] = None
+    language: Optional[str] = None
+    timelines: TimelineStore = Field(default_factory=TimelineStore)
+    https: bool = False
+
+    @model_validator(mode="after")
+    def switch_to_https(self) -> "WeatherBaseClient":
+        """Switches the `base_url` to HTTPS when `https` is set."""
+        self.base_url = with_https(self.base_url, self.https)
+        return self
+
+    @abstractmethod
+    def _perform(self, call: _Call) -> Any:
+        """
+        Sends the request of a call and parses its response body.
+
+        Args:
+            call (_Call): The request and the parser of its response.
+
+        Returns:
+            Any: The parsed response, or an awaitable of it for async
+            clients.
+
+        Raises:
+            RequestException: If the API request fails.
+        """
+
+    def request_params(
+        self,
+        details: Optional[bool] = None,
+        metric: Optional[bool] = None,
+        language: Optional[str] = None,
+    ) -> Dict[str, str]:
+        """
+        Builds the query parameters of a request, falling back to the client
+        options for the options that are not given.
+
+        Args:
+            details (Optional[bool]): Whether to request the full details.
+            metric (Optional[bool]): Whether to request metric units.
+            language (Optional[str]): The language of the localized texts.
+
+        Returns:
+            Dict[str, str]: The query parameters.
+        """
+        return api_params(
+            self.token,
+            details=self.details if details is None else details,
+            metric=self.metric if metric is None else metric,
+            language=language or self.language,
+        )
+
+    def _make_request(self, endpoint: str) -> Any:
+        """
+        Helper method to make API requests to the AccuWeather API.
+
+        Args:
+            endpoint (str): The API endpoint to query.
+
+        Returns:
+            Any: The JSON response from the API.
+
+        Raises:
+            RequestException: If the API request fails.
+        """
+        return self._perform(
+            _Call(endpoint, self.request_params(), json.loads)
+        )
+
+    def _model_call(
+        self,
+        endpoint: str,
+        model: type,
+        details: Optional[bool],
+        metric: Optional[bool],
+        language: Optional[str],
+        fields: Optional[Sequence[str]],
+    ) -> _Call:
+        """Builds the request of an endpoint and the parsing of its response
+        into the model, or into its projection when fields are selected or
+        details are off."""
+        params = self.request_params(details, metric, language)
+        parsed = response_model(model, params["details"] == "true", fields)
+        return _Call(
+            endpoint,
+            params,
+            lambda content: parse_response(
+                content,
+                self.fast_parse,
+                parsed.from_json,
+                parsed.from_api_response,
+                self.instrumentation,
+                endpoint,
+            ),
+        )
+
+    def _refresh_call(
+        self,
+        kind: str,
+        length: int,
+        details: Optional[bool],
+        metric: Optional[bool],
+        language: Optional[str],
+        fields: Optional[Sequence[str]],
+    ) -> _Call:
+        """Builds the request of a forecast and the merging of its response
+        into the timeline of the location."""
+        endpoint = forecast_endpoint(kind, length)
+        params = self.request_params(details, metric, language)
+        source, parse = timeline_parser(
+            kind,
+            endpoint,
+            params,
+            fields,
+            self.fast_parse,
+            self.instrumentation,
+        )
+        return _Call(
+            endpoint,
+            params,
+            # The location key is only known once the request was sent
+            lambda content: self.timelines.get(
+                str(self.location_key), kind
+            ).update(source, content, parse),
+        )
+
+    def get_daily_forecast(
+        self,
+        days: int = 5,
+        details: Optional[bool] = None,
+        metric: Optional[bool] = None,
+        language: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> ForecastModel5Days | Projection:
+        """
+        Retrieves the daily weather forecast for the specified location.
+
+        Args:
+            days (int): The number of days, 1, 5, 10 or 15.
+            details (Optional[bool]): Whether to request the full details,
+            the client option by default.
+            metric (Optional[bool]): Whether to request metric units, the
+            client option by default.
+            language (Optional[str]): The language of the texts, the client
+            option by default.
+            fields (Optional[Sequence[str]]): The dotted paths of the fields
+            to parse, e.g. "daily_forecasts.temperature", all by default.
+
+        Returns:
+            ForecastModel5Days | Projection: A model containing the daily
+            weather forecast data, or a projection of the selected fields.
+
+        Raises:
+            ValueError: If the API does not offer the number of days.
+        """
+        return self._perform(
+            self._model_call(
+                forecast_endpoint("daily", days),
+                ForecastModel5Days,
+                details,
+                metric,
+                language,
+                fields,
+            )
+        )
+
+    def get_hourly_forecast(
+        self,
+        hours: int = 12,
+        details: Optional[bool] = None,
+        metric: Optional[bool] = None,
+        language: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> HourlyForecastModel | Projection:
+        """
+        Retrieves the hourly weather forecast for the specified location.
+
+        Args:
+            hours (int): The number of hours, 1, 12, 24, 72 or 120.
+            details (Optional[bool]): Whether to request the full details,
+            the client option by default.
+            metric (Optional[bool]): Whether to request metric units, the
+            client option by default.
+            language (Optional[str]): The language of the texts, the client
+            option by default.
+            fields (Optional[Sequence[str]]): The dotted paths of the fields
+            to parse, e.g. "output.temperature.value", all by default.
+
+        Returns:
+            HourlyForecastModel | Projection: A model containing the hourly
+            weather forecast, or a projection of the selected fields.
+
+        Raises:
+            ValueError: If the API does not offer the number of hours.
+        """
+        return self._perform(
+            self._model_call(
+                forecast_endpoint("hourly", hours),
+                HourlyForecastModel,
+                details,
+                metric,
+                language,
+                fields,
+            )
+        )
+
+    def get_5day_forecast(
+        self, **options: Any
+    ) -> ForecastModel5Days | Projection:
+        """
+        Retrieves the 5-day weather forecast for the specified location.
+
+        Args:
+            **options: The options of `get_daily_forecast`.
+
+        Returns:
+            ForecastModel5Days | Projection: A model containing the 5-day
+            weather forecast data, or a projection of the selected fields.
+        """
+        return self.get_daily_forecast(5, **options)
+
+    def get_hourly_forecast_12h(
+        self, **options: Any
+    ) -> HourlyForecastModel | Projection:
+        """
+        Retrieves an hourly forecast for the next 12 hours.
+
+        Args:
+            **options: The options of `get_hourly_forecast`.
+
+        Returns:
+            HourlyForecastModel | Projection: A model containing the hourly
+            weather forecast for the next 12 hours, or a projection of the
+            selected fields.
+        """
+        return self.get_hourly_forecast(12, **options)
+
+    def refresh_daily_forecast(
+        self,
+        days: int = 5,
+        details: Optional[bool] = None,
+        metric: Optional[bool] = None,
+        language: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> TimelineUpdate:
+        """
+        Retrieves the daily forecast and merges its days into the daily
+        timeline of the location by `EpochDate`.
+
+        Args:
+            days (int): The number of days, 1, 5, 10 or 15.
+            details (Optional[bool]): Whether to request the full details,
+            the client option by default.
+            metric (Optional[bool]): Whether to request metric units, the
+            client option by default.
+            language (Optional[str]): The language of the texts, the client
+            option by default.
+            fields (Optional[Sequence[str]]): The dotted paths of the fields
+            to keep, all by default. Keep them the same for every refresh.
+
+        Returns:
+            TimelineUpdate: The added and changed days.
+
+        Raises:
+            ValueError: If the API does not offer the number of days.
+        """
+        return self._perform(
+            self._refresh_call(
+                "daily", days, details, metric, language, fields
+            )
+        )
+
+    def refresh_hourly_forecast(
+        self,
+        hours: int = 12,
+        details: Optional[bool] = None,
+        metric: Optional[bool] = None,
+        language: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> TimelineUpdate:
+        """
+        Retrieves the hourly forecast and merges its hours into the hourly
+        timeline of the location by `EpochDateTime`.
+
+        Args:
+            hours (int): The number of hours, 1, 12, 24, 72 or 120.
+            details (Optional[bool]): Whether to request the full details,
+            the client option by default.
+            metric (Optional[bool]): Whether to request metric units, the
+            client option by default.
+            language (Optional[str]): The language of the texts, the client
+            option by default.
+            fields (Optional[Sequence[str]]): The dotted paths of the fields
+            to keep, all by default. Keep them the same for every refresh.
+
+        Returns:
+            TimelineUpdate: The added and changed hours.
+
+        Raises:
+            ValueError: If the API does not offer the number of hours.
+        """
+        return self._perform(
+            self._refresh_call(
+                "hourly", hours, details, metric, language, fields
+            )
+        )
+
+    def get_current_conditions(
+        self,
+        details: Optional[bool] = None,
+        language: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> CurrentConditionsModel | Projection:
+        """
+        Retrieves the current weather conditions for the specified location.
+
+        Args:
+            details (Optional[bool]): Whether to request the full details,
+            the client option by default.
+            language (Optional[str]): The language of the texts, the client
+            option by default.
+            fields (Optional[Sequence[str]]): The dotted paths of the fields
+            to parse, e.g. "output.Temperature.Metric.Value", all by
+            default.
+
+        Returns:
+            CurrentConditionsModel | Projection: A model containing the
+            current weather conditions data, or a projection of the
+            selected fields.
+        """
+        return self._perform(
+            self._model_call(
+                "currentconditions/v1/",
+                CurrentConditionsModel,
+                details,
+                None,
+                language,
+                fields,
+            )
+        )
+
+    def get_current_observations(
+        self,
+        details: Optional[bool] = None,
+        language: Optional[str] = None,
+    ) -> List[CurrentConditionModel]:
+        """
+        Retrieves the current weather conditions as typed observations,
+        parsed straight from the response without the dictionaries of
+        `CurrentConditionsModel`.
+
+        Args:
+            details (Optional[bool]): Whether to request the full details,
+            the client option by default.
+            language (Optional[str]): The language of the texts, the client
+            option by default.
+
+        Returns:
+            List[CurrentConditionModel]: The observations, usually one.
+        """
+        endpoint = "currentconditions/v1/"
+        return self._perform(
+            _Call(
+                endpoint,
+                self.request_params(details, None, language),
+                lambda content: parse_response(
+                    content,
+                    self.fast_parse,
+                    CURRENT_OBSERVATIONS.validate_json,
+                    CURRENT_OBSERVATIONS.validate_python,
+                    self.instrumentation,
+                    endpoint,
+                    "CurrentConditionModel",
+                ),
+            )
+        )
+
+
+class WeatherClient(WeatherBaseClient):
+    """
+    AccuWeather API client for retrieving a 5-day weather forecast and current weather conditions.
+
+    Besides the options of `WeatherBaseClient`:
+
+    Attributes:
+        transport (Transport): The pooled HTTP transport used for requests, shared by all clients by default.
+        lazy (bool): Defers the location lookup until the first request or `resolve_location` call.
+    """
+
+    transport: Transport = Field(default_factory=get_default_transport)
+    lazy: bool = False
+    _location_lock: threading.Lock = PrivateAttr(
+        default_factory=threading.Lock
+    )
 
     @model_validator(mode="before")
     @classmethod
@@ -65,7 +657,8 @@ class WeatherClient(TokenValidation):
         Initializes location-related attributes when an instance of WeatherClient is created.
 
         This method sets up the `location_client`, `location`, and `location_key` attributes
-        based on the provided city, country, or POI.
+        based on the provided city, country, or POI. Nothing is looked up when a `location_key`
+        is provided, and lazy clients only validate the location inputs.
 
         Args:
             values (Dict[str, Any]): The dictionary of values passed during initialization.
@@ -73,6 +666,8 @@ class WeatherClient(TokenValidation):
         Returns:
             Dict[str, Any]: The dictionary of values with the location-related attributes added.
         """
+        if values.get("location_key"):
+            return values
         location_client = get_location_model(
             token=values.get("token"),
             city=values.get("city"),
@@ -80,83 +675,115 @@ class WeatherClient(TokenValidation):
             poi=values.get("poi"),
             lat=values.get("lat"),
             lon=values.get("lon"),
+            cache=values.get("location_cache"),
+            geo_index=values.get("geo_index"),
+            api_root=values.get("base_url"),
+            transport=values.get("transport") or get_default_transport(),
+            lazy=values.get("lazy", False),
+            fast_parse=values.get("fast_parse", False),
+            priority=values.get("priority", 0),
+            instrumentation=values.get("instrumentation"),
+            details=values.get("details", True),
+            language=values.get("language"),
+            https=values.get("https", False),
         )
-        location = (
-            location_client.location.response[0]
-            if isinstance(location_client.location.response, list)
-            else location_client.location.response
-        )
-        location_key = location.Key
+        values["location_client"] = location_client
+        if location_client.location is None:
+            return values
+        location = location_client.location.get_location_item()
 
         # Directly update the values dictionary
-        values.update(
-            {
-                "location_client": location_client,
-                "location": location,
-                "location_key": location_key,
-            }
-        )
+        values.update({"location": location, "location_key": location.Key})
         return values
 
-    def _make_request(self, endpoint: str) -> dict:
+    def warm_up(self, connections: int = 2) -> WarmupReport:
         """
-        Helper method to make API requests to the AccuWeather API.
+        Resolves the API host and opens pooled connections to it ahead of the
+        first requests, including the TLS handshakes of HTTPS clients.
 
         Args:
-            endpoint (str): The API endpoint to query.
+            connections (int): The number of connections to keep open, capped
+            at the pool size of the transport.
 
         Returns:
-            dict: The JSON response from the API.
+            WarmupReport: The cost of the name resolution and of each
+            connection.
 
         Raises:
-            RequestException: If the API request fails.
+            OSError: If the API host cannot be resolved.
         """
-        url = self.base_url + endpoint + str(self.location_key)
-        try:
-            response = self._session.request(
-                method="GET",
-                url=url,
-                params={"apikey": self.token, "details": "true"},
-            )
-            response.raise_for_status()
-            return response.json()
-        except RequestException as e:
-            raise RequestException(
-                f"Failed to retrieve data from {url}"
-            ) from e
+        return self.transport.warm_up(self.base_url, connections)
 
-    def get_5day_forecast(self) -> ForecastModel5Days:
+    def resolve_location(self) -> Optional[LocationModelItem]:
         """
-        Retrieves the 5-day weather forecast for the specified location.
+        Looks up the location of a lazy client. Safe to call from several
+        threads; the lookup happens at most once.
 
         Returns:
-            ForecastModel5Days: A model containing the 5-day weather forecast
-            data.
-        """
-        return ForecastModel5Days.from_api_response(
-            self._make_request("forecasts/v1/daily/5day/")
-        )
+            Optional[LocationModelItem]: The location, or None for clients
+            that were created from a location key.
 
-    def get_hourly_forecast_12h(self) -> HourlyForecastModel:
+        Raises:
+            ValueError: If the location data could not be fetched.
         """
-        Retrieves an hourly forecast for the next 24 hours.
+        if self.location_key is None:
+            with self._location_lock:
+                if self.location_key is None:
+                    location_model = self.location_client.fetch_location()
+                    self.location = location_model.get_location_item()
+                    self.location_key = self.location.Key
+        return self.location
 
-        Returns:
-            HourlyForecastModel: A model containing the hourly weather forecast
-            for the next 24 hours.
+    def _request_content(
+        self, endpoint: str, params: Optional[Dict[str, str]] = None
+    ) -> bytes:
         """
-        return HourlyForecastModel(
-            output=self._make_request("forecasts/v1/hourly/12hour/")
-        )
+        Helper method to make API requests to the AccuWeather API, served
+        from the response cache when one is set.
 
-    def get_current_conditions(self) -> CurrentConditionsModel:
-        """
-        Retrieves the current weather conditions for the specified location.
+        Args:
+            endpoint (str): The API endpoint to query.
+            params (Optional[Dict[str, str]]): The query parameters, those of
+            the client options by default.
 
         Returns:
-            CurrentConditionsModel: A model containing the current weather
-            conditions data.
+            bytes: The raw JSON body of the response.
+
+        Raises:
+            RequestException: If the API request fails.
         """
-        return CurrentConditionsModel(
-            output=self._make_request("currentconditions/v1/")
-        )
+        self.resolve_location()
+        url = self.base_url + endpoint + str(self.location_key)
+        params = params or self.request_params()
+        try:
+            if self.response_cache is not None:
+                return self.response_cache.fetch(
+                    endpoint,
+                    str(self.location_key),
+                    params,
+                    lambda headers: self.transport.get(
+                        url,
+                        params=params,
+                        priority=self.priority,
+                        instrumentation=self.instrumentation,
+                        endpoint=endpoint,
+                        headers=headers,
+                    ),
+                    instrumentation=self.instrumentation,
+                )
+            response = self.transport.get(
+                url,
+                params=params,
+                priority=self.priority,
+                instrumentation=self.instrumentation,
+                endpoint=endpoint,
+            )
+            response.raise_for_status()
+            return response.content
+        except RequestException as e:
+            raise RequestException(
+                f"Failed to retrieve data from {url}"
+            ) from e
+
+    def _perform(self, call: _Call) -> Any:
+        return call.parse(self._request_content(call.endpoint, call.params))
@@ -0,0 +1,3 @@
+from .arrow import ForecastTableWriter, forecasts_to_table  # noqa: F401
+from .arrow import daily_schema, hourly_schema  # noqa: F401
+from .snapshot import SnapshotStore, record_dtype  # noqa: F401
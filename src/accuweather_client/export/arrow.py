@@ -0,0 +1,247 @@
+"""
+arrow.py
+
+This module exports forecasts of many locations to Arrow tables and to
+Parquet or Arrow IPC files. Columns are read straight from the forecast
+models into a fixed, typed schema, without converting every record to a
+dictionary or inferring the schema. The columns are those of
+`accuweather_client.models.columns`.
+
+The module requires the optional `pyarrow` dependency, which is installed with
+`pip install accuweather_client[parquet]`.
+
+Classes:
+    - ForecastTableWriter: Appends forecasts to a Parquet or Arrow IPC file
+      in row groups.
+
+Functions:
+    - hourly_schema: Returns the schema of hourly forecast tables.
+    - daily_schema: Returns the schema of daily forecast tables.
+    - forecasts_to_table: Converts forecasts of many locations into one table.
+"""
+
+from typing import Any, Iterable, List, Literal, Optional
+
+from accuweather_client.models import ForecastModel5Days, HourlyForecastModel
+from accuweather_client.models.columns import (
+    COLUMNS,
+    ROW_MODELS,
+    column_values,
+)
+from accuweather_client.models.projection import Projection
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = pq = None
+
+ForecastKind = Literal["hourly", "daily"]
+
+
+def _require_pyarrow() -> None:
+    """Raises an ImportError with install instructions without pyarrow."""
+    if pa is None:
+        raise ImportError(
+            "The arrow export requires pyarrow, install it with "
+            '"pip install accuweather_client[parquet]".'
+        )
+
+
+def _schema(kind: ForecastKind) -> "pa.Schema":
+    """Builds the schema of a forecast kind."""
+    _require_pyarrow()
+    return pa.schema(
+        [("location_key", pa.string())]
+        + [
+            (column.name, getattr(pa, column.type)())
+            for column in COLUMNS[kind]
+        ]
+    )
+
+
+def hourly_schema() -> "pa.Schema":
+    """
+    Returns the schema of hourly forecast tables.
+
+    Returns:
+        pa.Schema: The schema, one row per location and hour.
+    """
+    return _schema("hourly")
+
+
+def daily_schema() -> "pa.Schema":
+    """
+    Returns the schema of daily forecast tables.
+
+    Returns:
+        pa.Schema: The schema, one row per location and day.
+    """
+    return _schema("daily")
+
+
+def _rows(
+    forecast: HourlyForecastModel | ForecastModel5Days | Projection,
+    kind: ForecastKind,
+) -> List[Any]:
+    """Returns the hourly or daily records of a forecast model or of a
+    projection of one."""
+    return forecast.output if kind == "hourly" else forecast.daily_forecasts
+
+
+class _ColumnBuffer:
+    """Collects the columns of a forecast kind until they are written."""
+
+    def __init__(self, kind: ForecastKind) -> None:
+        self.kind = kind
+        self.schema = _schema(kind)
+        self.clear()
+
+    def clear(self) -> None:
+        self.location_keys: List[str] = []
+        self.columns: List[List[Any]] = [[] for _ in COLUMNS[self.kind]]
+
+    def __len__(self) -> int:
+        return len(self.location_keys)
+
+    def append(
+        self,
+        location_key: str,
+        forecast: HourlyForecastModel | ForecastModel5Days | Projection,
+    ) -> None:
+        rows = _rows(forecast, self.kind)
+        self.location_keys.extend([location_key] * len(rows))
+        model = ROW_MODELS[self.kind]
+        for values, column in zip(self.columns, COLUMNS[self.kind]):
+            # Fields a projection does not hold are written as nulls
+            values.extend(column_values(rows, model, column.path))
+
+    def to_table(self) -> "pa.Table":
+        return pa.Table.from_arrays(
+            [pa.array(self.location_keys, pa.string())]
+            + [
+                pa.array(column, field.type)
+                for column, field in zip(self.columns, list(self.schema)[1:])
+            ],
+            schema=self.schema,
+        )
+
+
+def forecasts_to_table(
+    forecasts: Iterable[
+        tuple[str, HourlyForecastModel | ForecastModel5Days | Projection]
+    ],
+    kind: ForecastKind,
+) -> "pa.Table":
+    """
+    Converts forecasts of many locations into one Arrow table.
+
+    Args:
+        forecasts (Iterable[tuple[str, HourlyForecastModel |
+        ForecastModel5Days | Projection]]): Pairs of location key and
+        forecast model, or projection of one. Fields a projection does not
+        hold are null.
+        kind (ForecastKind): "hourly" for `HourlyForecastModel` input or
+        "daily" for `ForecastModel5Days` input.
+
+    Returns:
+        pa.Table: The table with the schema of the forecast kind.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    buffer = _ColumnBuffer(kind)
+    for location_key, forecast in forecasts:
+        buffer.append(location_key, forecast)
+    return buffer.to_table()
+
+
+class ForecastTableWriter:
+    """
+    Appends forecasts of many locations to a Parquet or Arrow IPC file.
+
+    Forecasts are buffered and written as one row group or record batch per
+    `row_group_size` rows, so memory stays bounded however many locations
+    are written.
+
+    Example:
+        with ForecastTableWriter("hourly.parquet", kind="hourly") as writer:
+            for client in clients:
+                writer.write(
+                    client.location_key, client.get_hourly_forecast_12h()
+                )
+
+    Attributes:
+        path (str): The path of the output file.
+        kind (ForecastKind): The kind of forecasts written, "hourly" or
+        "daily".
+        format (str): The file format, "parquet" or "arrow".
+        row_group_size (int): The number of rows per row group.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        kind: ForecastKind,
+        format: Literal["parquet", "arrow"] = "parquet",
+        row_group_size: int = 64 * 1024,
+        compression: Optional[str] = "zstd",
+    ) -> None:
+        _require_pyarrow()
+        if format not in ("parquet", "arrow"):
+            raise ValueError('The format must be "parquet" or "arrow".')
+        self.path = path
+        self.kind = kind
+        self.format = format
+        self.row_group_size = row_group_size
+        self._buffer = _ColumnBuffer(kind)
+        if format == "parquet":
+            self._writer = pq.ParquetWriter(
+                path, self._buffer.schema, compression=compression
+            )
+        else:
+            self._writer = pa.ipc.new_file(
+                path,
+                self._buffer.schema,
+                options=pa.ipc.IpcWriteOptions(compression=compression),
+            )
+
+    def write(
+        self,
+        location_key: str,
+        forecast: HourlyForecastModel | ForecastModel5Days | Projection,
+    ) -> None:
+        """
+        Appends the forecast of a location.
+
+        Args:
+            location_key (str): The location key of the forecast.
+            forecast (HourlyForecastModel | ForecastModel5Days | Projection):
+            The forecast or a projection of one, matching the kind of the
+            writer. Fields a projection does not hold are null.
+        """
+        self._buffer.append(location_key, forecast)
+        if len(self._buffer) >= self.row_group_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes the buffered rows as a row group."""
+        if not len(self._buffer):
+            return
+        table = self._buffer.to_table()
+        if self.format == "parquet":
+            self._writer.write_table(table)
+        else:
+            self._writer.write_table(table, max_chunksize=len(table))
+        self._buffer.clear()
+
+    def close(self) -> None:
+        """Writes the remaining rows and closes the file."""
+        self.flush()
+        self._writer.close()
+
+    def __enter__(self) -> "ForecastTableWriter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
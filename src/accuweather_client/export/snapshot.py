@@ -0,0 +1,424 @@
+"""
+snapshot.py
+
+This module keeps the history of every forecast and observation of a
+location on disk, e.g. to evaluate forecast skill. Each location key and kind
+of forecast has one append-only file of fixed-width binary records, a record
+per forecast day, hour or observation, stamped with the time the forecast
+was issued. Files are memory-mapped for reading, so queries return zero-copy
+NumPy views of the records. Records are appended in order of issue time,
+which makes the issue time column its own index: a range of issue times is
+found by binary search without reading the rest of the file.
+
+Records hold the numeric fields of the models in compact types, texts such
+as icon phrases are not stored. Missing values are NaN for floats and -1 for
+integers.
+
+The module requires the optional `numpy` dependency, which is installed with
+`pip install accuweather_client[numpy]`.
+
+Example:
+    store = SnapshotStore("history")
+    store.append("hourly", "349727", weather.get_hourly_forecast(hours=72))
+    records = store.query("hourly", "349727", start=t1, end=t2)
+    records["temperature"], records["epoch_date_time"]
+
+Classes:
+    - SnapshotStore: Append-only, memory-mapped store of forecast records.
+"""
+
+import os
+import re
+import struct
+import threading
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from pydantic import BaseModel
+
+from accuweather_client.models import (
+    CurrentConditionModel,
+    CurrentConditionsModel,
+)
+from accuweather_client.models.columns import (
+    DAILY_COLUMNS,
+    HOURLY_COLUMNS,
+    NUMPY_TYPES,
+    ROW_MODELS,
+    Column,
+    column_values,
+    missing_value,
+    require_numpy,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+# Magic, version, kind code, record size and flags at the start of a file
+HEADER = struct.Struct("<4sHHII")
+MAGIC = b"AWSS"
+# Version 2 records hold the columns of `accuweather_client.models.columns`
+VERSION = 2
+# Set in the header flags once a record was appended out of issue order
+UNSORTED = 1
+
+VALID_LOCATION_KEY = re.compile(r"^[\w-]+$")
+
+# Records hold floats in single precision, and no texts
+STORAGE_TYPES: Dict[str, str] = {**NUMPY_TYPES, "float64": "<f4"}
+
+# Columns of current conditions, in metric units
+CURRENT_COLUMNS: List[Column] = [
+    Column("epoch_time", "int64", "epoch_time"),
+    Column("weather_icon", "int16", "weather_icon"),
+    Column("is_day_time", "bool_", "is_day_time"),
+    Column("has_precipitation", "bool_", "has_precipitation"),
+    Column("temperature", "float64", "temperature.metric.value"),
+    Column(
+        "real_feel_temperature",
+        "float64",
+        "real_feel_temperature.metric.value",
+    ),
+    Column("dew_point", "float64", "dew_point.metric.value"),
+    Column("relative_humidity", "int16", "relative_humidity"),
+    Column("wind_speed", "float64", "wind.speed.metric.value"),
+    Column("wind_direction_degrees", "int16", "wind.direction.degrees"),
+    Column("wind_gust_speed", "float64", "wind_gust.speed.metric.value"),
+    Column("uv_index", "int16", "uv_index"),
+    Column("cloud_cover", "int16", "cloud_cover"),
+    Column("visibility", "float64", "visibility.metric.value"),
+    Column("pressure", "float64", "pressure.metric.value"),
+    Column("precipitation_1hr", "float64", "precipitation_1hr.metric.value"),
+]
+
+# Header code, numeric columns and row model per kind of record
+KINDS: Dict[str, Tuple[int, List[Column], type[BaseModel]]] = {
+    kind: (
+        code,
+        [column for column in columns if column.type in STORAGE_TYPES],
+        model,
+    )
+    for kind, code, columns, model in (
+        ("daily", 1, DAILY_COLUMNS, ROW_MODELS["daily"]),
+        ("hourly", 2, HOURLY_COLUMNS, ROW_MODELS["hourly"]),
+        ("current", 3, CURRENT_COLUMNS, CurrentConditionModel),
+    )
+}
+
+
+def record_dtype(kind: str) -> "np.dtype":
+    """
+    Returns the record layout of a kind of forecast: the issue time
+    followed by its columns, packed without padding.
+
+    Args:
+        kind (str): "daily", "hourly" or "current".
+
+    Returns:
+        np.dtype: The structured type of a record.
+    """
+    require_numpy("the snapshot store")
+    _check_kind(kind)
+    return np.dtype(
+        [("issued", "<i8")]
+        + [
+            (column.name, STORAGE_TYPES[column.type])
+            for column in KINDS[kind][1]
+        ]
+    )
+
+
+def _check_kind(kind: str) -> None:
+    if kind not in KINDS:
+        raise ValueError(
+            f"Unknown kind {kind!r}, choose from {sorted(KINDS)}."
+        )
+
+
+class _Mapping:
+    """Memory map of the records of a file, valid for one file size."""
+
+    __slots__ = ("size", "records", "sorted")
+
+    def __init__(self, size: int, records: "np.ndarray", sorted: bool):
+        self.size = size
+        self.records = records
+        self.sorted = sorted
+
+
+class SnapshotStore:
+    """
+    Append-only, memory-mapped store of forecast and observation records,
+    one file per kind and location key under a directory. Safe to share
+    between threads; a directory should have one writing process.
+
+    Attributes:
+        root (str): The directory of the store.
+        max_maps (int): The number of files kept memory-mapped between
+        queries, each holds a file descriptor. The least recently queried
+        files are unmapped first.
+    """
+
+    def __init__(self, root: str, max_maps: int = 256) -> None:
+        require_numpy("the snapshot store")
+        self.root = root
+        self.max_maps = max_maps
+        self._dtypes = {kind: record_dtype(kind) for kind in KINDS}
+        self._maps: OrderedDict[str, _Mapping] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def path(self, kind: str, location_key: str) -> str:
+        """
+        Returns the path of the file of a location.
+
+        Args:
+            kind (str): "daily", "hourly" or "current".
+            location_key (str): The location key.
+
+        Returns:
+            str: The path.
+
+        Raises:
+            ValueError: If the kind or the location key is invalid.
+        """
+        _check_kind(kind)
+        if not VALID_LOCATION_KEY.match(str(location_key)):
+            raise ValueError(f"Invalid location key {location_key!r}.")
+        return os.path.join(self.root, kind, f"{location_key}.bin")
+
+    def _records(
+        self, kind: str, rows: Sequence[BaseModel], issued: Sequence[int]
+    ) -> "np.ndarray":
+        """Packs rows into records, in order of their issue time."""
+        dtype = self._dtypes[kind]
+        records = np.empty(len(rows), dtype=dtype)
+        records["issued"] = issued
+        _, columns, model = KINDS[kind]
+        for column in columns:
+            missing = missing_value(STORAGE_TYPES[column.type])
+            values = column_values(rows, model, column.path)
+            records[column.name] = [
+                missing if value is None else value for value in values
+            ]
+        return records[np.argsort(records["issued"], kind="stable")]
+
+    def append(
+        self,
+        kind: str,
+        location_key: str,
+        forecast: Any,
+        issued: Optional[int] = None,
+    ) -> int:
+        """
+        Appends the rows of a forecast or of current conditions to the file
+        of a location.
+
+        Args:
+            kind (str): "daily", "hourly" or "current".
+            location_key (str): The location key.
+            forecast (Any): A `ForecastModel5Days` or `HourlyForecastModel`,
+            or a projection of one, a `CurrentConditionsModel` or a list of
+            `CurrentConditionModel` observations.
+            issued (Optional[int]): The issue time as UNIX time, now by
+            default. Observations are stamped with their observation time.
+
+        Returns:
+            int: The number of appended records.
+
+        Raises:
+            ValueError: If the kind or the location key is invalid, or the
+            file is not a snapshot file of the kind.
+        """
+        path = self.path(kind, location_key)
+        if kind == "current":
+            rows = (
+                forecast.observations
+                if isinstance(forecast, CurrentConditionsModel)
+                else list(forecast)
+            )
+            stamps = [row.epoch_time for row in rows]
+        else:
+            rows = (
+                forecast.daily_forecasts
+                if kind == "daily"
+                else forecast.output
+            )
+            stamp = int(time.time()) if issued is None else int(issued)
+            stamps = [stamp] * len(rows)
+        if not rows:
+            return 0
+        records = self._records(kind, rows, stamps)
+        dtype = self._dtypes[kind]
+        with self._lock:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "a+b") as file:
+                file.seek(0, os.SEEK_END)
+                size = file.tell()
+                if size < HEADER.size:
+                    file.truncate(0)
+                    file.write(
+                        HEADER.pack(
+                            MAGIC, VERSION, KINDS[kind][0], dtype.itemsize, 0
+                        )
+                    )
+                else:
+                    flags = self._check_header(file, kind, path)
+                    # Drops a record torn by an interrupted append
+                    count = (size - HEADER.size) // dtype.itemsize
+                    end = HEADER.size + count * dtype.itemsize
+                    if end != size:
+                        file.truncate(end)
+                    if count and not flags & UNSORTED:
+                        file.seek(end - dtype.itemsize)
+                        (last,) = struct.unpack("<q", file.read(8))
+                        if records["issued"][0] < last:
+                            self._set_flags(path, flags | UNSORTED)
+                file.write(records.tobytes())
+        return len(records)
+
+    def _check_header(self, file: Any, kind: str, path: str) -> int:
+        """Validates the header of a file and returns its flags."""
+        file.seek(0)
+        magic, version, code, itemsize, flags = HEADER.unpack(
+            file.read(HEADER.size)
+        )
+        if (
+            magic != MAGIC
+            or version != VERSION
+            or code != KINDS[kind][0]
+            or itemsize != self._dtypes[kind].itemsize
+        ):
+            raise ValueError(f"{path} is not a {kind} snapshot file.")
+        return flags
+
+    @staticmethod
+    def _set_flags(path: str, flags: int) -> None:
+        with open(path, "r+b") as file:
+            file.seek(HEADER.size - 4)
+            file.write(struct.pack("<I", flags))
+
+    def _map(self, kind: str, location_key: str) -> Optional[_Mapping]:
+        """Returns the memory map of a file, remapped when it grew."""
+        path = self.path(kind, location_key)
+        try:
+            size = os.path.getsize(path)
+        except FileNotFoundError:
+            return None
+        with self._lock:
+            mapping = self._maps.get(path)
+            if mapping is not None and mapping.size == size:
+                self._maps.move_to_end(path)
+                return mapping
+        dtype = self._dtypes[kind]
+        with open(path, "rb") as file:
+            flags = self._check_header(file, kind, path)
+        count = max(size - HEADER.size, 0) // dtype.itemsize
+        records = (
+            np.memmap(
+                path,
+                dtype=dtype,
+                mode="r",
+                offset=HEADER.size,
+                shape=(count,),
+            )
+            if count
+            else np.empty(0, dtype=dtype)
+        )
+        mapping = _Mapping(size, records, not flags & UNSORTED)
+        with self._lock:
+            self._maps[path] = mapping
+            self._maps.move_to_end(path)
+            # Evicted maps are closed once no returned view refers to them
+            while len(self._maps) > self.max_maps:
+                self._maps.popitem(last=False)
+        return mapping
+
+    def query(
+        self,
+        kind: str,
+        location_key: str,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+    ) -> "np.ndarray":
+        """
+        Returns the records of a location issued in a range of time.
+
+        Args:
+            kind (str): "daily", "hourly" or "current".
+            location_key (str): The location key.
+            start (Optional[int]): The first issue time to include, as UNIX
+            time.
+            end (Optional[int]): The issue time to stop before.
+
+        Returns:
+            np.ndarray: The structured records in order of issue time, a
+            read-only view of the memory-mapped file, or a copy for files
+            that were appended out of order. Fields are accessed by column
+            name, e.g. `records["temperature"]`.
+
+        Raises:
+            ValueError: If the kind or the location key is invalid.
+        """
+        mapping = self._map(kind, location_key)
+        if mapping is None:
+            return np.empty(0, dtype=self._dtypes[kind])
+        records = mapping.records
+        issued = records["issued"]
+        if not mapping.sorted:
+            selected = np.ones(len(records), dtype=bool)
+            if start is not None:
+                selected &= issued >= start
+            if end is not None:
+                selected &= issued < end
+            indices = np.flatnonzero(selected)
+            return records[indices[np.argsort(issued[indices], kind="stable")]]
+        # Bisects the strided issue times in place, searchsorted would copy
+        # the whole column first
+        low = 0 if start is None else bisect_left(issued, start)
+        high = len(records) if end is None else bisect_left(issued, end)
+        return records[low:high]
+
+    def issues(
+        self,
+        kind: str,
+        location_key: str,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+    ) -> "np.ndarray":
+        """
+        Returns the distinct issue times of a location in a range of time.
+
+        Args:
+            kind (str): "daily", "hourly" or "current".
+            location_key (str): The location key.
+            start (Optional[int]): The first issue time to include.
+            end (Optional[int]): The issue time to stop before.
+
+        Returns:
+            np.ndarray: The issue times in ascending order.
+        """
+        return np.unique(self.query(kind, location_key, start, end)["issued"])
+
+    def location_keys(self, kind: str) -> List[str]:
+        """
+        Returns the location keys with records of a kind.
+
+        Args:
+            kind (str): "daily", "hourly" or "current".
+
+        Returns:
+            List[str]: The location keys, sorted.
+        """
+        _check_kind(kind)
+        directory = os.path.join(self.root, kind)
+        if not os.path.isdir(directory):
+            return []
+        return sorted(
+            name[: -len(".bin")]
+            for name in os.listdir(directory)
+            if name.endswith(".bin")
+        )
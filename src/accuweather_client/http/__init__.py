@@ -0,0 +1,9 @@
+from .transport import Transport, get_default_transport  # noqa: F401
+from .transport import WarmupReport, set_default_transport  # noqa: F401
+from .ratelimit import QuotaExceededError, RateLimitError  # noqa: F401
+from .ratelimit import RateLimiter, RateLimitMetrics  # noqa: F401
+from .ratelimit import RateLimitTimeoutError, get_rate_limiter  # noqa: F401
+from .ratelimit import register_rate_limiter  # noqa: F401
+from .ratelimit import unregister_rate_limiter  # noqa: F401
+from .resilience import CircuitBreaker, CircuitOpenError  # noqa: F401
+from .resilience import RetryPolicy  # noqa: F401
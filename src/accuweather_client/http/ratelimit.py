@@ -0,0 +1,380 @@
+"""
+ratelimit.py
+
+This module provides a client-side rate limiter and daily quota accountant for
+AccuWeather API keys. A limiter is registered per API token, so every client
+and transport that uses the token shares it. Requests wait for a token of a
+token bucket, and waiting requests are served by priority. When the daily
+quota runs low, the remaining calls are reserved for high-priority requests.
+
+The state of a limiter lives in memory, or in a SQLite database when it has
+to be shared by several processes.
+
+Classes:
+    - RateLimitError: Base class of the rate limit errors.
+    - QuotaExceededError: Raised when the daily quota is used up.
+    - RateLimitTimeoutError: Raised when a request waited too long.
+    - RateLimitMetrics: Snapshot of the state of a limiter.
+    - RateLimiter: Token bucket with daily quota and priority scheduling.
+
+Functions:
+    - register_rate_limiter: Registers the limiter of an API token.
+    - unregister_rate_limiter: Removes the limiter of an API token.
+    - get_rate_limiter: Returns the limiter of an API token, if any.
+"""
+
+import heapq
+import itertools
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from pydantic import BaseModel
+from requests.exceptions import RequestException
+
+
+class RateLimitError(RequestException):
+    """Base class of the errors raised by the rate limiter."""
+
+
+class QuotaExceededError(RateLimitError):
+    """Raised when the daily quota available to a request is used up."""
+
+
+class RateLimitTimeoutError(RateLimitError):
+    """Raised when a request could not be scheduled within its timeout."""
+
+
+class RateLimitMetrics(BaseModel):
+    """
+    Snapshot of the state of a rate limiter.
+
+    Attributes:
+        rate (float): The sustained number of requests per second.
+        burst (int): The size of the token bucket.
+        tokens (float): The number of requests that can start right away.
+        daily_quota (Optional[int]): The number of requests per UTC day.
+        used_today (int): The number of requests made today.
+        remaining_today (Optional[int]): The number of requests left today.
+        waiting (int): The number of requests waiting in this process.
+        throttled (int): The number of requests that had to wait.
+        rejected (int): The number of requests rejected for lack of quota.
+    """
+
+    rate: float
+    burst: int
+    tokens: float
+    daily_quota: Optional[int]
+    used_today: int
+    remaining_today: Optional[int]
+    waiting: int
+    throttled: int
+    rejected: int
+
+
+def _today() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+
+class _MemoryState:
+    """Limiter state for a single process, guarded by the limiter lock."""
+
+    def __init__(self, burst: int) -> None:
+        self.state = {
+            "tokens": float(burst),
+            "updated": time.time(),
+            "day": _today(),
+            "used": 0,
+            "paused_until": 0.0,
+        }
+
+    def transact(self, update):
+        return update(self.state)
+
+
+class _SQLiteState:
+    """Limiter state shared by processes through a SQLite database."""
+
+    def __init__(self, path: str, name: str, burst: int) -> None:
+        self.path = path
+        self.key = name
+        self.burst = burst
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit ("
+                "key TEXT PRIMARY KEY, tokens REAL NOT NULL, "
+                "updated REAL NOT NULL, day TEXT NOT NULL, "
+                "used INTEGER NOT NULL, paused_until REAL NOT NULL)"
+            )
+            conn.execute(
+                "INSERT OR IGNORE INTO rate_limit VALUES (?, ?, ?, ?, 0, 0)",
+                (self.key, float(burst), time.time(), _today()),
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            self._local.conn = conn
+        return conn
+
+    def transact(self, update):
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT tokens, updated, day, used, paused_until "
+                "FROM rate_limit WHERE key = ?",
+                (self.key,),
+            ).fetchone()
+            state = dict(
+                zip(("tokens", "updated", "day", "used", "paused_until"), row)
+            )
+            result = update(state)
+            conn.execute(
+                "UPDATE rate_limit SET tokens = ?, updated = ?, day = ?, "
+                "used = ?, paused_until = ? WHERE key = ?",
+                (
+                    state["tokens"],
+                    state["updated"],
+                    state["day"],
+                    state["used"],
+                    state["paused_until"],
+                    self.key,
+                ),
+            )
+            conn.execute("COMMIT")
+            return result
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+
+class RateLimiter:
+    """
+    Token bucket rate limiter with a daily quota and priority scheduling.
+
+    Example:
+        register_rate_limiter(
+            API_KEY, RateLimiter(rate=5, daily_quota=50, reserve=10)
+        )
+        # Only clients with priority >= 1 can use the last 10 calls
+        WeatherClient(token=API_KEY, city="sydney", priority=1)
+
+    Attributes:
+        rate (float): The sustained number of requests per second.
+        burst (int): The number of requests that can start back to back.
+        daily_quota (Optional[int]): The number of requests per UTC day, or
+        None for no quota.
+        reserve (int): The number of calls of the daily quota that are kept
+        for requests with at least `reserve_priority`.
+        reserve_priority (int): The priority that may use the reserve.
+        path (Optional[str]): The SQLite database that holds the state, so
+        that processes share it, or None to keep the state in memory.
+        name (str): The name under which the state is stored in the
+        database; processes that use the same name share one budget.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: int = 10,
+        daily_quota: Optional[int] = None,
+        reserve: int = 0,
+        reserve_priority: int = 1,
+        path: Optional[str] = None,
+        name: str = "default",
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.daily_quota = daily_quota
+        self.reserve = reserve
+        self.reserve_priority = reserve_priority
+        self._store = (
+            _SQLiteState(path, name, burst)
+            if path is not None
+            else _MemoryState(burst)
+        )
+        self._condition = threading.Condition()
+        self._waiters: list = []
+        self._sequence = itertools.count()
+        self._throttled = 0
+        self._rejected = 0
+
+    def _refill(self, state: dict) -> None:
+        """Adds the tokens earned since the last update to the state."""
+        now = time.time()
+        if state["day"] != _today():
+            state["day"], state["used"] = _today(), 0
+        state["tokens"] = min(
+            self.burst,
+            state["tokens"] + (now - state["updated"]) * self.rate,
+        )
+        state["updated"] = now
+
+    def _take(self, priority: int) -> float:
+        """Takes a token from the state, returning 0 on success or the time
+        to wait for the next token."""
+
+        def update(state: dict) -> float:
+            self._refill(state)
+            if self.daily_quota is not None:
+                limit = self.daily_quota
+                if priority < self.reserve_priority:
+                    limit -= self.reserve
+                if state["used"] >= limit:
+                    raise QuotaExceededError(
+                        f"The daily quota available to priority {priority} "
+                        f"is used up ({state['used']} of "
+                        f"{self.daily_quota} calls)."
+                    )
+            paused = state["paused_until"] - time.time()
+            if paused > 0:
+                return paused
+            if state["tokens"] < 1:
+                return (1 - state["tokens"]) / self.rate
+            state["tokens"] -= 1
+            state["used"] += 1
+            return 0.0
+
+        return self._store.transact(update)
+
+    def acquire(self, priority: int = 0, timeout: Optional[float] = None):
+        """
+        Blocks until a request may be sent. Waiting requests are served in
+        order of priority, highest first.
+
+        Args:
+            priority (int): The priority of the request.
+            timeout (float, optional): The maximum time to wait in seconds.
+
+        Raises:
+            QuotaExceededError: If the daily quota available to the priority
+            is used up.
+            RateLimitTimeoutError: If the request could not be scheduled
+            within the timeout.
+        """
+        entry = (-priority, next(self._sequence))
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            heapq.heappush(self._waiters, entry)
+            try:
+                waited = False
+                while True:
+                    wait = None
+                    if self._waiters[0] == entry:
+                        try:
+                            wait = self._take(priority)
+                        except QuotaExceededError:
+                            self._rejected += 1
+                            raise
+                        if not wait:
+                            if waited:
+                                self._throttled += 1
+                            return
+                    if deadline is not None:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise RateLimitTimeoutError(
+                                "Timed out waiting for the rate limiter."
+                            )
+                        wait = (
+                            remaining if wait is None else min(wait, remaining)
+                        )
+                    waited = True
+                    self._condition.wait(wait)
+            finally:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+                self._condition.notify_all()
+
+    def pause(self, seconds: float) -> None:
+        """
+        Stops granting requests for a while, e.g. after the API answered with
+        429 Too Many Requests.
+
+        Args:
+            seconds (float): The length of the pause.
+        """
+
+        def update(state: dict) -> None:
+            state["paused_until"] = max(
+                state["paused_until"], time.time() + seconds
+            )
+            state["tokens"] = 0.0
+
+        with self._condition:
+            self._store.transact(update)
+
+    def metrics(self) -> RateLimitMetrics:
+        """
+        Returns a snapshot of the state of the limiter.
+
+        Returns:
+            RateLimitMetrics: The current budget and counters.
+        """
+        with self._condition:
+
+            def update(state: dict) -> dict:
+                self._refill(state)
+                return dict(state)
+
+            state = self._store.transact(update)
+            return RateLimitMetrics(
+                rate=self.rate,
+                burst=self.burst,
+                tokens=state["tokens"],
+                daily_quota=self.daily_quota,
+                used_today=state["used"],
+                remaining_today=(
+                    None
+                    if self.daily_quota is None
+                    else max(self.daily_quota - state["used"], 0)
+                ),
+                waiting=len(self._waiters),
+                throttled=self._throttled,
+                rejected=self._rejected,
+            )
+
+
+_rate_limiters: Dict[str, RateLimiter] = {}
+
+
+def register_rate_limiter(token: str, limiter: RateLimiter) -> None:
+    """
+    Registers the rate limiter of an API token. All requests with the token
+    go through the limiter, whichever client or transport sends them.
+
+    Args:
+        token (str): The API token.
+        limiter (RateLimiter): The limiter of the token.
+    """
+    _rate_limiters[token] = limiter
+
+
+def unregister_rate_limiter(token: str) -> None:
+    """
+    Removes the rate limiter of an API token.
+
+    Args:
+        token (str): The API token.
+    """
+    _rate_limiters.pop(token, None)
+
+
+def get_rate_limiter(token: Optional[str]) -> Optional[RateLimiter]:
+    """
+    Returns the rate limiter of an API token.
+
+    Args:
+        token (Optional[str]): The API token.
+
+    Returns:
+        Optional[RateLimiter]: The limiter, or None if none is registered.
+    """
+    if not _rate_limiters or token is None:
+        return None
+    return _rate_limiters.get(token)
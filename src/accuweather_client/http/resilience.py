@@ -0,0 +1,216 @@
+"""
+resilience.py
+
+This module provides the policies the transport uses to cope with a slow or
+degraded AccuWeather API: retries with jittered exponential backoff, hedged
+requests that cut the tail latency of idempotent requests, and a circuit
+breaker that fails fast while the API is unhealthy.
+
+Classes:
+    - CircuitOpenError: Raised when the circuit breaker rejects a request.
+    - RetryPolicy: When and how long to wait before retrying a request.
+    - CircuitBreaker: Fails fast after repeated failures of the API.
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional
+
+from requests import Response
+from requests.exceptions import ConnectionError, RequestException, Timeout
+
+
+class CircuitOpenError(RequestException):
+    """Raised when the circuit breaker rejects a request."""
+
+
+def retry_after(response: Response, default: float) -> float:
+    """
+    Returns the delay in seconds requested by the `Retry-After` header of a
+    response, given either in seconds or as an HTTP date.
+
+    Args:
+        response (Response): The response.
+        default (float): The delay when the header is missing or invalid.
+
+    Returns:
+        float: The delay in seconds.
+    """
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return default
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return default
+
+
+class RetryPolicy:
+    """
+    When and how long to wait before retrying a request. Only idempotent
+    requests are retried.
+
+    Attributes:
+        max_retries (int): The number of retries after the first attempt.
+        backoff_base (float): The delay in seconds before the first retry.
+        backoff_max (float): The maximum delay in seconds between attempts.
+        jitter (bool): Whether the delays are drawn uniformly between zero
+        and the exponential backoff ("full jitter"), so clients that failed
+        together do not retry together.
+        retry_statuses (FrozenSet[int]): The status codes that are retried.
+        methods (FrozenSet[str]): The HTTP methods that are retried.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 2,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        jitter: bool = True,
+        retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504}),
+        methods: FrozenSet[str] = frozenset({"GET", "HEAD"}),
+    ) -> None:
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.methods = frozenset(method.upper() for method in methods)
+
+    def is_retryable(
+        self,
+        method: str,
+        response: Optional[Response] = None,
+        error: Optional[Exception] = None,
+    ) -> bool:
+        """
+        Whether a failed attempt is worth retrying.
+
+        Args:
+            method (str): The HTTP method of the request.
+            response (Response, optional): The response of the attempt.
+            error (Exception, optional): The error raised by the attempt.
+
+        Returns:
+            bool: True when the request should be retried.
+        """
+        if method.upper() not in self.methods:
+            return False
+        if error is not None:
+            return isinstance(error, (ConnectionError, Timeout))
+        return response is not None and (
+            response.status_code in self.retry_statuses
+        )
+
+    def backoff(
+        self, attempt: int, response: Optional[Response] = None
+    ) -> float:
+        """
+        Returns the delay before the next attempt. A `Retry-After` header of
+        the response takes precedence over the backoff.
+
+        Args:
+            attempt (int): The number of the failed attempt, starting at 0.
+            response (Response, optional): The response of the attempt.
+
+        Returns:
+            float: The delay in seconds.
+        """
+        delay = min(self.backoff_max, self.backoff_base * 2**attempt)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        if response is not None and "Retry-After" in response.headers:
+            return min(self.backoff_max, retry_after(response, delay))
+        return delay
+
+
+class CircuitBreaker:
+    """
+    Fails fast after repeated failures of the API. The circuit opens after
+    `failure_threshold` consecutive failures and rejects requests for
+    `recovery_timeout` seconds. Then a single trial request is let through:
+    the circuit closes when it succeeds and opens again when it fails.
+
+    Attributes:
+        failure_threshold (int): The number of consecutive failures that
+        open the circuit.
+        recovery_timeout (float): How long in seconds the circuit stays open
+        before a trial request.
+        failures (int): The number of consecutive failures.
+        opened_at (Optional[float]): The monotonic time the circuit opened,
+        None while it is closed.
+    """
+
+    def __init__(
+        self, failure_threshold: int = 5, recovery_timeout: float = 30.0
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """The state of the circuit: "closed", "open" or "half-open"."""
+        with self._lock:
+            if self.opened_at is None:
+                return "closed"
+            if time.monotonic() - self.opened_at < self.recovery_timeout:
+                return "open"
+            return "half-open"
+
+    def before_request(self) -> None:
+        """
+        Checks whether a request may be sent.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or a trial request is
+            already in flight.
+        """
+        with self._lock:
+            if self.opened_at is None:
+                return
+            remaining = self.recovery_timeout - (
+                time.monotonic() - self.opened_at
+            )
+            if remaining > 0:
+                raise CircuitOpenError(
+                    f"Circuit open, retry in {remaining:.1f}s"
+                )
+            if self._trial_in_flight:
+                raise CircuitOpenError("Circuit half-open, trial in flight")
+            self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        """Closes the circuit after a successful request."""
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Counts a failed request, opening the circuit at the threshold."""
+        with self._lock:
+            self.failures += 1
+            if self._trial_in_flight or (
+                self.failures >= self.failure_threshold
+            ):
+                self.opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+    def release(self) -> None:
+        """Ends a trial request that was not sent, without an outcome."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def reset(self) -> None:
+        """Closes the circuit and forgets past failures."""
+        self.record_success()
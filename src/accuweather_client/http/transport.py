@@ -0,0 +1,522 @@
+"""
+transport.py
+
+This module provides the pooled HTTP transport used by the location and
+weather clients. A single transport is shared by all clients in a process by
+default, so keep-alive connections are reused across clients. Failed
+idempotent requests are retried with backoff, slow ones can be hedged, and a
+circuit breaker can fail requests fast while the API is unhealthy. Pooled
+connections can be opened ahead of the first request with `warm_up`.
+
+Classes:
+    - Transport: Pooled HTTP transport with timeouts, retries, hedging and
+      an optional circuit breaker.
+    - WarmupReport: The cost of warming up the connections to a host.
+
+Functions:
+    - get_default_transport: Returns the process-wide default transport.
+    - set_default_transport: Replaces the process-wide default transport.
+"""
+
+import socket
+import threading
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+from pydantic import BaseModel, Field
+from requests import Request, Response, Session
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError, RequestException, Timeout
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import HTTPError
+
+from accuweather_client.http.ratelimit import get_rate_limiter
+from accuweather_client.instrumentation import Instrumentation, RequestEvent
+from accuweather_client.http.resilience import (
+    CircuitBreaker,
+    RetryPolicy,
+    retry_after,
+)
+
+
+# Duration of the last connection set up by the current thread
+_connect_timing = threading.local()
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    def connect(self) -> None:
+        start = time.perf_counter()
+        super().connect()
+        _connect_timing.seconds = time.perf_counter() - start
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    def connect(self) -> None:
+        start = time.perf_counter()
+        super().connect()
+        _connect_timing.seconds = time.perf_counter() - start
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TimedHTTPAdapter(HTTPAdapter):
+    """HTTP adapter whose connections record how long they took to open."""
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+class WarmupReport(BaseModel):
+    """
+    The cost of warming up the connections to a host.
+
+    Attributes:
+        url (str): The URL whose host was warmed up.
+        addresses (List[str]): The resolved IP addresses of the host.
+        dns (float): The seconds the name resolution took.
+        connections (int): The number of connections opened.
+        reused (int): The number of connections that were already open.
+        connect (List[float]): The seconds each connection took to open,
+        including the TLS handshake for HTTPS.
+        total (float): The seconds of the whole warm-up.
+        errors (List[str]): The errors of connections that failed to open.
+    """
+
+    url: str
+    addresses: List[str] = Field(default_factory=list)
+    dns: float = 0.0
+    connections: int = 0
+    reused: int = 0
+    connect: List[float] = Field(default_factory=list)
+    total: float = 0.0
+    errors: List[str] = Field(default_factory=list)
+
+
+def _open(connection: Any) -> float:
+    """Opens a pooled connection and returns how long it took."""
+    start = time.perf_counter()
+    connection.connect()
+    return time.perf_counter() - start
+
+
+class Transport:
+    """
+    Pooled HTTP transport for the AccuWeather API.
+
+    Attributes:
+        session (Session): The requests session holding the connection pools.
+        timeout (tuple[float, float]): The connect and read timeouts in
+        seconds.
+        pool_connections (int): The number of hosts a connection pool is kept
+        for.
+        pool_maxsize (int): The maximum number of connections kept alive per
+        host.
+        pool_block (bool): Whether requests wait for a free connection when
+        the pool is exhausted, rather than opening an extra connection.
+        keep_alive (bool): Whether connections are reused between requests.
+        retry (RetryPolicy): The retry policy, `RetryPolicy(max_retries=0)`
+        disables retries.
+        hedge_after (Optional[float]): The delay in seconds after which a
+        second, hedged copy of a slow idempotent request is sent. The first
+        successful response wins. None disables hedging.
+        circuit_breaker (Optional[CircuitBreaker]): The circuit breaker
+        guarding the API, if any.
+        trust_env (bool): Whether proxies, certificates and credentials are
+        read from the environment and `.netrc`. Looking them up costs CPU
+        on every request, so disable it when none are needed.
+        stats (Counter): The number of retries, hedged requests, hedged
+        requests that won and requests rejected by the circuit breaker.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 4,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        connect_timeout: float = 3.05,
+        read_timeout: float = 10.0,
+        keep_alive: bool = True,
+        session: Optional[Session] = None,
+        retry: Optional[RetryPolicy] = None,
+        hedge_after: Optional[float] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        trust_env: bool = True,
+    ) -> None:
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.timeout = (connect_timeout, read_timeout)
+        self.session = session if session is not None else Session()
+        adapter = _TimedHTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+        self.session.trust_env = trust_env
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.hedge_after = hedge_after
+        self.circuit_breaker = circuit_breaker
+        self.stats: Counter = Counter()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        priority: int = 0,
+        instrumentation: Optional[Instrumentation] = None,
+        endpoint: Optional[str] = None,
+        **kwargs,
+    ) -> Response:
+        """
+        Sends a request over the pooled session. Requests whose API key has
+        a registered rate limiter wait for it first. Connection errors,
+        timeouts and retryable status codes are retried according to the
+        retry policy; the response of the last attempt is returned.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The URL of the request.
+            params (Dict[str, Any], optional): The query parameters.
+            priority (int): The priority of the request for the rate limiter.
+            instrumentation (Instrumentation, optional): Receives a
+            `RequestEvent` per attempt.
+            endpoint (str, optional): The endpoint label of the events,
+            defaults to the URL.
+            **kwargs: Additional keyword arguments passed to
+            `Session.request`.
+
+        Returns:
+            Response: The response of the request.
+
+        Raises:
+            RateLimitError: If the rate limiter rejects the request.
+            CircuitOpenError: If the circuit breaker rejects the request.
+            RequestException: If the last attempt fails to connect or times
+            out.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        breaker = self.circuit_breaker
+        attempt = 0
+        while True:
+            if breaker is not None:
+                try:
+                    breaker.before_request()
+                except RequestException:
+                    self.stats["short_circuited"] += 1
+                    raise
+            response = error = None
+            try:
+                response = self._send_hedged(
+                    method,
+                    url,
+                    params,
+                    priority,
+                    instrumentation,
+                    endpoint,
+                    **kwargs,
+                )
+            except (ConnectionError, Timeout) as e:
+                error = e
+            except RequestException:
+                if breaker is not None:
+                    breaker.release()
+                raise
+            if breaker is not None:
+                if error is not None or response.status_code >= 500:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+            if attempt >= self.retry.max_retries or (
+                not self.retry.is_retryable(method, response, error)
+            ):
+                if error is not None:
+                    raise error
+                return response
+            time.sleep(self.retry.backoff(attempt, response))
+            attempt += 1
+            self.stats["retries"] += 1
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        priority: int,
+        instrumentation: Optional[Instrumentation] = None,
+        endpoint: Optional[str] = None,
+        **kwargs,
+    ) -> Response:
+        """Sends a single attempt of a request."""
+        if instrumentation is not None:
+            return self._send_instrumented(
+                method,
+                url,
+                params,
+                priority,
+                instrumentation,
+                endpoint or url,
+                **kwargs,
+            )
+        limiter = get_rate_limiter(params.get("apikey") if params else None)
+        if limiter is not None:
+            limiter.acquire(priority)
+        response = self.session.request(
+            method=method, url=url, params=params, **kwargs
+        )
+        if limiter is not None and response.status_code == 429:
+            limiter.pause(retry_after(response, default=1.0))
+        return response
+
+    def _send_instrumented(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        priority: int,
+        instrumentation: Instrumentation,
+        endpoint: str,
+        **kwargs,
+    ) -> Response:
+        """Sends a single attempt of a request and emits its timing."""
+        start = time.perf_counter()
+        limiter = get_rate_limiter(params.get("apikey") if params else None)
+        if limiter is not None:
+            limiter.acquire(priority)
+        sent = time.perf_counter()
+        _connect_timing.seconds = None
+        try:
+            response = self.session.request(
+                method=method, url=url, params=params, **kwargs
+            )
+        except RequestException as e:
+            connect = _connect_timing.seconds
+            instrumentation.emit(
+                RequestEvent(
+                    endpoint=endpoint,
+                    queued=sent - start,
+                    connect=connect or 0.0,
+                    total=time.perf_counter() - start,
+                    reused_connection=connect is None,
+                    error=repr(e),
+                )
+            )
+            raise
+        finished = time.perf_counter()
+        if limiter is not None and response.status_code == 429:
+            limiter.pause(retry_after(response, default=1.0))
+        connect = _connect_timing.seconds
+        ttfb = min(response.elapsed.total_seconds(), finished - sent)
+        instrumentation.emit(
+            RequestEvent(
+                endpoint=endpoint,
+                status=response.status_code,
+                queued=sent - start,
+                connect=connect or 0.0,
+                ttfb=ttfb,
+                download=finished - sent - ttfb,
+                total=finished - start,
+                bytes_received=len(response.content),
+                reused_connection=connect is None,
+            )
+        )
+        return response
+
+    def _send_hedged(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        priority: int,
+        *args,
+        **kwargs,
+    ) -> Response:
+        """
+        Sends an attempt of a request, and a hedged copy of it when the first
+        copy is still outstanding after `hedge_after` seconds.
+        """
+        if (
+            self.hedge_after is None
+            or method.upper() not in self.retry.methods
+        ):
+            return self._send(method, url, params, priority, *args, **kwargs)
+        executor = self._get_executor()
+        primary = executor.submit(
+            self._send, method, url, params, priority, *args, **kwargs
+        )
+        done, _ = wait([primary], timeout=self.hedge_after)
+        if done:
+            return primary.result()
+        self.stats["hedged"] += 1
+        hedge = executor.submit(
+            self._send, method, url, params, priority, *args, **kwargs
+        )
+        pending = {primary, hedge}
+        fallback: Optional[Response] = None
+        error: Optional[RequestException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    response = future.result()
+                except RequestException as e:
+                    error = e
+                    continue
+                if response.status_code < 500:
+                    if future is hedge:
+                        self.stats["hedge_wins"] += 1
+                    return response
+                fallback = response
+        if fallback is not None:
+            return fallback
+        raise error
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Returns the thread pool of the hedged requests."""
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=2 * self.pool_maxsize,
+                        thread_name_prefix="accuweather-hedge",
+                    )
+        return self._executor
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ) -> Response:
+        """Sends a GET request, see `request`."""
+        return self.request("GET", url, params=params, **kwargs)
+
+    def warm_up(self, url: str, connections: int = 1) -> WarmupReport:
+        """
+        Resolves the host of a URL and opens pooled connections to it, so
+        that the first requests skip the name resolution, the connection
+        setup and, for HTTPS, the TLS handshake. Connections are opened
+        concurrently, at most `pool_maxsize` of them, and idle connections
+        that are already open count towards the number.
+
+        Args:
+            url (str): A URL of the host, e.g. the `base_url` of a client.
+            connections (int): The number of connections to keep open.
+
+        Returns:
+            WarmupReport: The cost of the warm-up.
+
+        Raises:
+            OSError: If the host cannot be resolved.
+        """
+        start = time.perf_counter()
+        report = WarmupReport(url=url)
+        parts = urlsplit(url)
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        addresses = socket.getaddrinfo(
+            parts.hostname, port, type=socket.SOCK_STREAM
+        )
+        report.dns = time.perf_counter() - start
+        report.addresses = sorted({address[4][0] for address in addresses})
+        # Takes the pool the requests of the session would use, with the
+        # same TLS and proxy settings
+        request = self.session.prepare_request(Request("GET", url))
+        settings = self.session.merge_environment_settings(
+            request.url, {}, None, None, None
+        )
+        pool = self.session.get_adapter(url).get_connection_with_tls_context(
+            request,
+            settings["verify"],
+            proxies=settings["proxies"],
+            cert=settings["cert"],
+        )
+        taken = [
+            pool._get_conn()
+            for _ in range(min(connections, self.pool_maxsize))
+        ]
+        closed = [
+            connection for connection in taken if not connection.is_connected
+        ]
+        report.reused = len(taken) - len(closed)
+        try:
+            if closed:
+                with ThreadPoolExecutor(len(closed)) as executor:
+                    futures = [executor.submit(_open, c) for c in closed]
+                for future in futures:
+                    try:
+                        report.connect.append(future.result())
+                    except (OSError, HTTPError) as e:
+                        report.errors.append(f"{type(e).__name__}: {e}")
+        finally:
+            for connection in taken:
+                pool._put_conn(connection)
+        report.connections = len(report.connect)
+        report.total = time.perf_counter() - start
+        return report
+
+    def close(self) -> None:
+        """Closes all pooled connections."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self.session.close()
+
+    def __enter__(self) -> "Transport":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+_default_transport: Optional[Transport] = None
+_default_transport_lock = threading.Lock()
+
+
+def get_default_transport() -> Transport:
+    """
+    Returns the transport shared by all clients that are not given one,
+    creating it on first use.
+
+    Returns:
+        Transport: The process-wide default transport.
+    """
+    global _default_transport
+    if _default_transport is None:
+        with _default_transport_lock:
+            if _default_transport is None:
+                _default_transport = Transport()
+    return _default_transport
+
+
+def set_default_transport(transport: Transport) -> None:
+    """
+    Replaces the process-wide default transport. Clients created before the
+    call keep using the previous transport.
+
+    Args:
+        transport (Transport): The new default transport.
+    """
+    global _default_transport
+    with _default_transport_lock:
+        _default_transport = transport
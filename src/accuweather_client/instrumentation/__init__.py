@@ -0,0 +1,3 @@
+from .events import CacheEvent, Instrumentation, ParseEvent  # noqa: F401
+from .events import RequestEvent  # noqa: F401
+from .adapters import LoggingHook, PrometheusHook  # noqa: F401
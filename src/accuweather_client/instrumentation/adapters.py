@@ -0,0 +1,234 @@
+"""
+adapters.py
+
+This module provides ready-made hooks for `Instrumentation`: one that logs
+every event and one that aggregates events into Prometheus-style counters and
+histograms, which can be rendered in the Prometheus text exposition format.
+
+Classes:
+    - LoggingHook: Logs every event.
+    - PrometheusHook: Aggregates events into counters and histograms.
+"""
+
+import logging
+import threading
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from accuweather_client.instrumentation.events import (
+    CacheEvent,
+    Event,
+    ParseEvent,
+    RequestEvent,
+)
+
+# Upper bounds in seconds of the latency histogram buckets
+DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class LoggingHook:
+    """
+    Logs every event as a single line of key=value pairs.
+
+    Attributes:
+        logger (logging.Logger): The logger the events are written to.
+        level (int): The level of the log records.
+    """
+
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        level: int = logging.DEBUG,
+    ) -> None:
+        self.logger = logger or logging.getLogger("accuweather_client")
+        self.level = level
+
+    def __call__(self, event: Event) -> None:
+        if not self.logger.isEnabledFor(self.level):
+            return
+        fields = " ".join(
+            (
+                f"{name}={value:.6f}"
+                if isinstance(value, float)
+                else f"{name}={value}"
+            )
+            for name, value in event.model_dump(exclude={"kind"}).items()
+        )
+        self.logger.log(self.level, "accuweather %s %s", event.kind, fields)
+
+
+class _Histogram:
+    """Cumulative histogram of observations in seconds."""
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+                break
+
+
+class PrometheusHook:
+    """
+    Aggregates events into Prometheus-style metrics:
+
+    - `{prefix}_requests_total{endpoint,status}` counter,
+    - `{prefix}_request_phase_seconds{endpoint,phase}` histogram of the
+      queued, connect, ttfb, download and total phases,
+    - `{prefix}_response_bytes_total{endpoint}` counter,
+    - `{prefix}_parse_seconds{model,phase}` histogram of decode and
+      validation,
+    - `{prefix}_cache_lookups_total{cache,outcome}` counter.
+
+    Attributes:
+        prefix (str): The prefix of the metric names.
+        buckets (Sequence[float]): The upper bounds of the histogram buckets.
+    """
+
+    def __init__(
+        self,
+        prefix: str = "accuweather",
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        self.prefix = prefix
+        self.buckets = tuple(buckets)
+        self._counters: Dict[str, Dict[Tuple, float]] = defaultdict(
+            lambda: defaultdict(float)
+        )
+        self._histograms: Dict[str, Dict[Tuple, _Histogram]] = defaultdict(
+            dict
+        )
+        self._lock = threading.Lock()
+
+    def _observe(self, name: str, labels: Tuple, value: float) -> None:
+        histograms = self._histograms[name]
+        histogram = histograms.get(labels)
+        if histogram is None:
+            histogram = histograms[labels] = _Histogram(self.buckets)
+        histogram.observe(value)
+
+    def __call__(self, event: Event) -> None:
+        with self._lock:
+            if isinstance(event, RequestEvent):
+                status = str(event.status) if event.status else "error"
+                labels = (("endpoint", event.endpoint),)
+                self._counters["requests_total"][
+                    labels + (("status", status),)
+                ] += 1
+                self._counters["response_bytes_total"][
+                    labels
+                ] += event.bytes_received
+                for phase in (
+                    "queued",
+                    "connect",
+                    "ttfb",
+                    "download",
+                    "total",
+                ):
+                    if phase == "connect" and event.reused_connection:
+                        continue
+                    self._observe(
+                        "request_phase_seconds",
+                        labels + (("phase", phase),),
+                        getattr(event, phase),
+                    )
+            elif isinstance(event, ParseEvent):
+                for phase in ("decode", "validation"):
+                    self._observe(
+                        "parse_seconds",
+                        (("model", event.model), ("phase", phase)),
+                        getattr(event, phase),
+                    )
+            elif isinstance(event, CacheEvent):
+                self._counters["cache_lookups_total"][
+                    (("cache", event.cache), ("outcome", event.outcome))
+                ] += 1
+
+    def counter(self, name: str, **labels: str) -> float:
+        """
+        Returns the value of a counter.
+
+        Args:
+            name (str): The name of the counter without the prefix, e.g.
+            "requests_total".
+            **labels (str): The labels of the series.
+
+        Returns:
+            float: The value, 0 for unknown series.
+        """
+        with self._lock:
+            for series, value in self._counters.get(name, {}).items():
+                if dict(series) == labels:
+                    return value
+        return 0.0
+
+    def render(self) -> str:
+        """
+        Renders all metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: The metrics.
+        """
+
+        def label_text(labels: Tuple, extra: Tuple = ()) -> str:
+            pairs = labels + extra
+            if not pairs:
+                return ""
+            inner = ",".join(f'{name}="{value}"' for name, value in pairs)
+            return "{" + inner + "}"
+
+        lines: List[str] = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                metric = f"{self.prefix}_{name}"
+                lines.append(f"# TYPE {metric} counter")
+                for labels, value in sorted(series.items()):
+                    lines.append(f"{metric}{label_text(labels)} {value:g}")
+            for name, series in sorted(self._histograms.items()):
+                metric = f"{self.prefix}_{name}"
+                lines.append(f"# TYPE {metric} histogram")
+                for labels, histogram in sorted(series.items()):
+                    cumulative = 0
+                    for bound, count in zip(
+                        histogram.buckets, histogram.counts
+                    ):
+                        cumulative += count
+                        lines.append(
+                            f"{metric}_bucket"
+                            f"{label_text(labels, (('le', f'{bound:g}'),))}"
+                            f" {cumulative}"
+                        )
+                    lines.append(
+                        f"{metric}_bucket"
+                        f"{label_text(labels, (('le', '+Inf'),))}"
+                        f" {histogram.count}"
+                    )
+                    lines.append(
+                        f"{metric}_sum{label_text(labels)} {histogram.sum:g}"
+                    )
+                    lines.append(
+                        f"{metric}_count{label_text(labels)} "
+                        f"{histogram.count}"
+                    )
+        return "\n".join(lines) + "\n"
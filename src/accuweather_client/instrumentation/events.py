@@ -0,0 +1,137 @@
+"""
+events.py
+
+This module defines the events emitted by instrumented clients and the
+dispatcher that passes them on to hooks. Clients without instrumentation
+skip the timing and the creation of events entirely, so instrumentation costs
+nothing unless it is enabled.
+
+Classes:
+    - RequestEvent: Timing and size of a single HTTP request.
+    - ParseEvent: Timing of the decoding and validation of a response.
+    - CacheEvent: Outcome of a cache lookup.
+    - Instrumentation: Dispatches events to hooks.
+"""
+
+import logging
+from typing import Callable, List, Literal, Optional, Union
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+
+class RequestEvent(BaseModel):
+    """
+    Timing and size of a single HTTP request. Retried and hedged requests
+    emit one event per attempt.
+
+    Attributes:
+        endpoint (str): The endpoint of the request, e.g.
+        "currentconditions/v1/", or its URL when it has no endpoint label.
+        status (Optional[int]): The status code, None when the request
+        failed without a response.
+        queued (float): The seconds spent waiting for the rate limiter.
+        connect (float): The seconds spent resolving the host and opening a
+        connection, 0 when a pooled connection was reused.
+        ttfb (float): The seconds from sending the request until the
+        response headers were received, including `connect`.
+        download (float): The seconds spent reading the response body.
+        total (float): The seconds spent on the request, including
+        `queued`.
+        bytes_received (int): The size of the response body.
+        reused_connection (bool): Whether a pooled connection was reused.
+        error (Optional[str]): The error of a failed request.
+    """
+
+    kind: Literal["request"] = "request"
+    endpoint: str
+    status: Optional[int] = None
+    queued: float = 0.0
+    connect: float = 0.0
+    ttfb: float = 0.0
+    download: float = 0.0
+    total: float = 0.0
+    bytes_received: int = 0
+    reused_connection: bool = True
+    error: Optional[str] = None
+
+
+class ParseEvent(BaseModel):
+    """
+    Timing of the decoding and validation of a response.
+
+    Attributes:
+        endpoint (str): The API endpoint, e.g. "currentconditions/v1/".
+        model (str): The name of the model class.
+        decode (float): The seconds spent decoding the JSON body, 0 on the
+        fast parsing path, which validates the raw bytes.
+        validation (float): The seconds spent validating the model.
+        bytes_parsed (int): The size of the parsed body.
+    """
+
+    kind: Literal["parse"] = "parse"
+    endpoint: str
+    model: str
+    decode: float = 0.0
+    validation: float = 0.0
+    bytes_parsed: int = 0
+
+
+class CacheEvent(BaseModel):
+    """
+    Outcome of a cache lookup.
+
+    Attributes:
+        cache (str): The cache, "location", "geo_index" or "response".
+        key (str): The cache key.
+        outcome (str): "hit", "miss", "revalidated", "coalesced" or "stale".
+    """
+
+    kind: Literal["cache"] = "cache"
+    cache: str
+    key: str
+    outcome: str
+
+
+Event = Union[RequestEvent, ParseEvent, CacheEvent]
+Hook = Callable[[Event], None]
+
+
+class Instrumentation:
+    """
+    Dispatches the events of instrumented clients to hooks. A failing hook
+    is logged and never breaks the request it observes.
+
+    Attributes:
+        hooks (List[Hook]): The callables that receive every event.
+    """
+
+    def __init__(self, *hooks: Hook) -> None:
+        self.hooks: List[Hook] = list(hooks)
+
+    def add(self, hook: Hook) -> Hook:
+        """
+        Adds a hook.
+
+        Args:
+            hook (Hook): A callable that receives every event.
+
+        Returns:
+            Hook: The hook, so the method can be used as a decorator.
+        """
+        self.hooks.append(hook)
+        return hook
+
+    def emit(self, event: Event) -> None:
+        """
+        Passes an event to every hook.
+
+        Args:
+            event (Event): The event.
+        """
+        for hook in self.hooks:
+            try:
+                hook(event)
+            except Exception:
+                logger.exception("Instrumentation hook %r failed", hook)
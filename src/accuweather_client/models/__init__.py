@@ -1,4 +1,25 @@
 from ._base import TokenValidation  # noqa: F401
 from .location import LocationModel, LocationModelItem  # noqa: F401
+from .weather import CurrentConditionModel  # noqa: F401
 from .weather import CurrentConditionsModel  # noqa: F401
 from .weather import ForecastModel5Days, HourlyForecastModel  # noqa: F401
+from .current import CurrentConditionsRecord  # noqa: F401
+from .batch import BatchResult, SerializedBatchResult  # noqa: F401
+from .projection import Projection, project, response_model  # noqa: F401
+from .timeline import ForecastTimeline, TimelineStore  # noqa: F401
+from .timeline import TimelineUpdate  # noqa: F401
+
+# The compact forecasts need numpy, which is imported on first access only
+_LAZY_ATTRIBUTES = {
+    "CompactDailyForecast": ".compact",
+    "CompactHourlyForecast": ".compact",
+    "CurrentConditionsColumns": ".compact",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        from importlib import import_module
+
+        return getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,104 @@
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from accuweather_client.models.location import LocationModelItem
+from accuweather_client.models.weather import (
+    CurrentConditionsModel,
+    ForecastModel5Days,
+    HourlyForecastModel,
+)
+
+
+class BatchResult(BaseModel):
+    """
+    Outcome of a batch fetch for one location.
+
+    Attributes:
+        query (Dict[str, Any]): The location query, e.g. {"city": "oslo"}.
+        location_key (Optional[str]): The resolved location key.
+        location (Optional[LocationModelItem]): The resolved location.
+        results (Dict[str, Any]): The parsed model per endpoint name.
+        errors (Dict[str, Exception]): The error per endpoint name, or under
+        "location" when the location could not be resolved.
+        timings (Dict[str, float]): The duration in seconds per endpoint name
+        and of the "location" lookup.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    query: Dict[str, Any]
+    location_key: Optional[str] = None
+    location: Optional[LocationModelItem] = None
+    results: Dict[str, Any] = Field(default_factory=dict)
+    errors: Dict[str, Exception] = Field(default_factory=dict)
+    timings: Dict[str, float] = Field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """Whether every request for this location succeeded."""
+        return not self.errors
+
+
+# Model of the serialized results per endpoint name, see `ENDPOINTS`
+ENDPOINT_MODELS: Dict[str, type[BaseModel]] = {
+    "daily": ForecastModel5Days,
+    "hourly": HourlyForecastModel,
+    "current": CurrentConditionsModel,
+}
+
+
+class SerializedBatchResult(BaseModel):
+    """
+    Outcome of a batch fetch for one location in a compact serialized form,
+    as returned by worker processes. Models are held as JSON bytes and only
+    validated when loaded.
+
+    Attributes:
+        query (Dict[str, Any]): The location query, e.g. {"city": "oslo"}.
+        location_key (Optional[str]): The resolved location key.
+        location (Optional[bytes]): The resolved location as JSON.
+        results (Dict[str, Any]): The model per endpoint name as JSON, or
+        the value the `transform` of the batch returned for it.
+        errors (Dict[str, str]): The error message per endpoint name, or
+        under "location" when the location could not be resolved.
+        timings (Dict[str, float]): The duration in seconds per endpoint name
+        and of the "location" lookup.
+    """
+
+    query: Dict[str, Any]
+    location_key: Optional[str] = None
+    location: Optional[bytes] = None
+    results: Dict[str, Any] = Field(default_factory=dict)
+    errors: Dict[str, str] = Field(default_factory=dict)
+    timings: Dict[str, float] = Field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """Whether every request for this location succeeded."""
+        return not self.errors
+
+    def load(self, endpoint: str) -> BaseModel:
+        """
+        Validates the serialized model of an endpoint.
+
+        Args:
+            endpoint (str): The endpoint name, e.g. "daily".
+
+        Returns:
+            BaseModel: The model, e.g. a `ForecastModel5Days`.
+        """
+        return ENDPOINT_MODELS[endpoint].model_validate_json(
+            self.results[endpoint]
+        )
+
+    def load_location(self) -> Optional[LocationModelItem]:
+        """
+        Validates the serialized location.
+
+        Returns:
+            Optional[LocationModelItem]: The location, None if unresolved.
+        """
+        if self.location is None:
+            return None
+        return LocationModelItem.model_validate_json(self.location)
@@ -0,0 +1,260 @@
+"""
+columns.py
+
+This module defines the columns of daily and hourly forecasts once, for the
+Arrow export, the snapshot store and the analytics. A column has a name, an
+Arrow type name and the dotted attribute path of its value in a forecast
+row. Paths into dictionary fields continue with the keys of the API payload,
+e.g. "temperature.Maximum.Value". The NumPy types of the columns are derived
+from their Arrow types.
+
+Classes:
+    - Column: Name, type and path of a column.
+
+Functions:
+    - column_values: Reads a column of many rows, models or payloads.
+    - missing_value: Returns the value stored for a missing value.
+    - require_numpy: Returns numpy, or raises an ImportError without it.
+"""
+
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+from typing import Tuple
+
+from pydantic import BaseModel
+
+from accuweather_client.models.weather import DailyForecastModel, ForecastModel
+
+
+class Column(NamedTuple):
+    """
+    A column of forecast rows.
+
+    Attributes:
+        name (str): The column name.
+        type (str): The Arrow type name, e.g. "int16", "float64" or
+        "string".
+        path (str): The dotted attribute path of the value in a row.
+    """
+
+    name: str
+    type: str
+    path: str
+
+
+# Columns of hourly forecasts, one row per hour
+HOURLY_COLUMNS: List[Column] = [
+    Column("epoch_date_time", "int64", "epoch_date_time"),
+    Column("date_time", "string", "date_time"),
+    Column("weather_icon", "int16", "weather_icon"),
+    Column("icon_phrase", "string", "icon_phrase"),
+    Column("is_daylight", "bool_", "is_daylight"),
+    Column("has_precipitation", "bool_", "has_precipitation"),
+    Column("precipitation_type", "string", "precipitation_type"),
+    Column("precipitation_intensity", "string", "precipitation_intensity"),
+    Column("temperature", "float64", "temperature.value"),
+    Column("temperature_unit", "string", "temperature.unit"),
+    Column("temperature_unit_type", "int8", "temperature.unit_type"),
+    Column("real_feel_temperature", "float64", "real_feel_temperature.value"),
+    Column(
+        "real_feel_temperature_shade",
+        "float64",
+        "real_feel_temperature_shade.value",
+    ),
+    Column("wet_bulb_temperature", "float64", "wet_bulb_temperature.value"),
+    Column("dew_point", "float64", "dew_point.value"),
+    Column("wind_speed", "float64", "wind.speed.value"),
+    Column("wind_speed_unit", "string", "wind.speed.unit"),
+    Column("wind_speed_unit_type", "int8", "wind.speed.unit_type"),
+    Column("wind_direction_degrees", "int16", "wind.direction.degrees"),
+    Column("wind_gust_speed", "float64", "wind_gust.speed.value"),
+    Column("relative_humidity", "int16", "relative_humidity"),
+    Column("cloud_cover", "int16", "cloud_cover"),
+    Column("uv_index", "int16", "uv_index"),
+    Column("precipitation_probability", "int16", "precipitation_probability"),
+    Column("thunderstorm_probability", "int16", "thunderstorm_probability"),
+    Column("rain_probability", "int16", "rain_probability"),
+    Column("snow_probability", "int16", "snow_probability"),
+    Column("ice_probability", "int16", "ice_probability"),
+]
+
+# Columns of daily forecasts, one row per day
+DAILY_COLUMNS: List[Column] = [
+    Column("epoch_date", "int64", "epoch_date"),
+    Column("date", "string", "date"),
+    Column("temperature_min", "float64", "temperature.Minimum.Value"),
+    Column("temperature_max", "float64", "temperature.Maximum.Value"),
+    Column("temperature_unit", "string", "temperature.Maximum.Unit"),
+    Column("temperature_unit_type", "int8", "temperature.Maximum.UnitType"),
+    Column("wind_speed_unit_type", "int8", "day.wind.speed.unit_type"),
+]
+for _period in ("day", "night"):
+    DAILY_COLUMNS += [
+        Column(f"{_period}_icon", "int16", f"{_period}.icon"),
+        Column(f"{_period}_icon_phrase", "string", f"{_period}.icon_phrase"),
+        Column(
+            f"{_period}_has_precipitation",
+            "bool_",
+            f"{_period}.has_precipitation",
+        ),
+        Column(
+            f"{_period}_precipitation_probability",
+            "int16",
+            f"{_period}.precipitation_probability",
+        ),
+        Column(
+            f"{_period}_wind_speed", "float64", f"{_period}.wind.speed.value"
+        ),
+        Column(
+            f"{_period}_wind_direction_degrees",
+            "int16",
+            f"{_period}.wind.direction.degrees",
+        ),
+        Column(
+            f"{_period}_wind_gust_speed",
+            "float64",
+            f"{_period}.wind_gust.speed.value",
+        ),
+    ]
+
+# Columns and row model per forecast kind
+COLUMNS: Dict[str, List[Column]] = {
+    "hourly": HOURLY_COLUMNS,
+    "daily": DAILY_COLUMNS,
+}
+ROW_MODELS: Dict[str, type[BaseModel]] = {
+    "hourly": ForecastModel,
+    "daily": DailyForecastModel,
+}
+
+# NumPy type per Arrow type name, texts have none
+NUMPY_TYPES: Dict[str, str] = {
+    "bool_": "?",
+    "int8": "i1",
+    "int16": "<i2",
+    "int64": "<i8",
+    "float32": "<f4",
+    "float64": "<f8",
+}
+
+
+def _steps(
+    model: Optional[type], names: Sequence[str], payload: bool
+) -> List[Tuple[bool, str]]:
+    """Translates an attribute path into attribute and key lookups, the
+    keys of the API payload for payloads."""
+    steps = []
+    for name in names:
+        field = model.model_fields.get(name) if model is not None else None
+        if field is None:
+            steps.append((False, name))
+            model = None
+            continue
+        steps.append((not payload, field.alias if payload else name))
+        annotation = field.annotation
+        model = (
+            annotation
+            if isinstance(annotation, type)
+            and issubclass(annotation, BaseModel)
+            else None
+        )
+    return steps
+
+
+@lru_cache(maxsize=None)
+def _reader(
+    model: type[BaseModel], path: str, payload: bool
+) -> Tuple[Callable[[Any], Any], Tuple[str, ...]]:
+    """Returns a function that follows the lookups of a path, and the names
+    along the path."""
+    steps = _steps(model, path.split("."), payload)
+    names = tuple(name for _, name in steps)
+    if all(attribute for attribute, _ in steps):
+        return attrgetter(".".join(names)), names
+
+    def get(value: Any) -> Any:
+        for attribute, name in steps:
+            value = getattr(value, name) if attribute else value[name]
+        return value
+
+    return get, names
+
+
+def _walk(value: Any, names: Sequence[str]) -> Any:
+    """Follows a path through models and dictionaries, None if missing."""
+    for name in names:
+        if value is None:
+            return None
+        if isinstance(value, dict):
+            value = value.get(name)
+        else:
+            value = getattr(value, name, None)
+    return value
+
+
+def column_values(
+    rows: Sequence[Any],
+    model: type[BaseModel],
+    path: str,
+    payload: bool = False,
+) -> List[Any]:
+    """
+    Reads a column of many rows.
+
+    Args:
+        rows (Sequence[Any]): The rows, models or projections of `model`, or
+        decoded API payloads of it.
+        model (type[BaseModel]): The model class of the rows.
+        path (str): The dotted attribute path of the column.
+        payload (bool): Whether the rows are API payloads, read by the keys
+        of the payload instead of the attribute names.
+
+    Returns:
+        List[Any]: The value of each row, None where a row lacks it.
+    """
+    get, names = _reader(model, path, payload)
+    try:
+        return list(map(get, rows))
+    except (AttributeError, KeyError, TypeError):
+        # Projections and partial payloads lack some fields
+        return [_walk(row, names) for row in rows]
+
+
+def missing_value(dtype: str) -> Any:
+    """
+    Returns the value stored for a missing value of a NumPy type: NaN for
+    floats, -1 for integers and False for booleans.
+
+    Args:
+        dtype (str): The NumPy type, e.g. "<f4".
+
+    Returns:
+        Any: The missing value.
+    """
+    if dtype == "?":
+        return False
+    return float("nan") if "f" in dtype else -1
+
+
+def require_numpy(feature: str) -> Any:
+    """
+    Returns the numpy module.
+
+    Args:
+        feature (str): The feature that needs numpy, for the error message.
+
+    Returns:
+        module: numpy.
+
+    Raises:
+        ImportError: With install instructions, if numpy is not installed.
+    """
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            f"numpy is required for {feature}, install it with "
+            '"pip install accuweather_client[numpy]".'
+        ) from e
+    return numpy
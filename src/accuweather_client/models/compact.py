@@ -0,0 +1,499 @@
+"""
+compact.py
+
+This module provides compact, column-oriented representations of hourly and
+daily forecasts. Numeric fields are held in typed NumPy arrays and text fields
+in tuples of interned strings, instead of a tree of pydantic models per hour
+or day. Rows are exposed as lightweight attribute-style views, and the
+representations convert back to the pydantic models without loss.
+
+The module requires the optional `numpy` dependency, which is installed with
+`pip install accuweather_client[numpy]`. It is only imported when one of its
+classes is first used.
+
+Classes:
+    - CompactForecast: Struct-of-arrays storage of a list of forecast models.
+    - CompactHourlyForecast: Compact form of a `HourlyForecastModel`.
+    - CompactDailyForecast: Compact form of a `ForecastModel5Days`.
+    - RowView: Attribute-style view of a single row.
+    - CurrentConditionsColumns: Current conditions of many locations in
+      columns keyed by location key.
+"""
+
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from pydantic import BaseModel
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError(
+        "The compact forecasts require numpy, install it with "
+        '"pip install accuweather_client[numpy]".'
+    ) from e
+
+from accuweather_client.models.current import (
+    RECORD_FIELDS,
+    CurrentConditionsRecord,
+)
+from accuweather_client.models.weather import (
+    DailyForecastModel,
+    ForecastModel,
+    ForecastModel5Days,
+    HourlyForecastModel,
+)
+from accuweather_client.models.projection import Projection
+
+DTYPES = {bool: np.bool_, int: np.int64, float: np.float64}
+
+
+class _Column:
+    """A leaf field of a model, addressed by field names and aliases."""
+
+    __slots__ = ("name", "path", "aliases", "dtype")
+
+    def __init__(self, path: tuple, aliases: tuple, dtype: Any) -> None:
+        self.name = ".".join(path)
+        self.path = path
+        self.aliases = aliases
+        self.dtype = dtype
+
+
+def _model_columns(
+    model: type[BaseModel], path: tuple = (), aliases: tuple = ()
+) -> List[_Column]:
+    """Flattens the fields of a model class into leaf columns."""
+    columns = []
+    for name, field in model.model_fields.items():
+        annotation = field.annotation
+        alias = field.alias or name
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            columns += _model_columns(
+                annotation, path + (name,), aliases + (alias,)
+            )
+        else:
+            columns.append(
+                _Column(
+                    path + (name,), aliases + (alias,), DTYPES.get(annotation)
+                )
+            )
+    return columns
+
+
+def _dict_leaves(value: Any, path: tuple = ()) -> List[tuple]:
+    """Returns the paths and values of the leaves of nested dictionaries."""
+    if isinstance(value, dict) and value:
+        leaves = []
+        for key, item in value.items():
+            leaves += _dict_leaves(item, path + (key,))
+        return leaves
+    return [(path, value)]
+
+
+def _expand_dict_columns(
+    columns: List[_Column], records: Dict[str, list]
+) -> List[_Column]:
+    """Splits dictionary columns whose rows share one layout into a column
+    per leaf, so their numbers can be stored in typed arrays too."""
+    expanded = []
+    for column in columns:
+        values = records[column.name]
+        if column.dtype is not None or not values:
+            expanded.append(column)
+            continue
+        layouts = [
+            _dict_leaves(value) if isinstance(value, dict) else None
+            for value in values
+        ]
+        keys = [leaf[0] for leaf in layouts[0] or []]
+        if not keys or any(
+            layout is None or [leaf[0] for leaf in layout] != keys
+            for layout in layouts
+        ):
+            expanded.append(column)
+            continue
+        del records[column.name]
+        for i, key in enumerate(keys):
+            leaf_values = [layout[i][1] for layout in layouts]
+            types = {type(value) for value in leaf_values}
+            leaf = _Column(
+                column.path + key,
+                column.aliases + key,
+                DTYPES.get(types.pop()) if len(types) == 1 else None,
+            )
+            records[leaf.name] = leaf_values
+            expanded.append(leaf)
+    return expanded
+
+
+def _check_full(forecast: Any, model: type[BaseModel]) -> None:
+    """Raises a TypeError for anything but a full forecast model, since the
+    compact forms convert back to the model without loss."""
+    if not isinstance(forecast, model):
+        kind = (
+            "a projection"
+            if isinstance(forecast, Projection)
+            else type(forecast).__name__
+        )
+        raise TypeError(
+            f"A compact form needs a full {model.__name__}, got {kind}; "
+            "request the forecast with details=True and without fields."
+        )
+
+
+def _to_array(values: list, dtype: Any) -> np.ndarray | tuple:
+    """Stores values in a typed array, or in a tuple with interned text."""
+    if dtype is not None:
+        return np.array(values, dtype=dtype)
+    return tuple(
+        sys.intern(value) if isinstance(value, str) else value
+        for value in values
+    )
+
+
+class RowView:
+    """
+    Attribute-style view of a single row of a `CompactForecast`. Nested
+    fields return views as well, e.g. `row.temperature.value`.
+    """
+
+    __slots__ = ("_forecast", "_index", "_prefix")
+
+    def __init__(
+        self, forecast: "CompactForecast", index: int, prefix: str = ""
+    ) -> None:
+        self._forecast = forecast
+        self._index = index
+        self._prefix = prefix
+
+    def __getattr__(self, name: str) -> Any:
+        key = self._prefix + name
+        column = self._forecast.columns.get(key)
+        if column is not None:
+            value = column[self._index]
+            return value.item() if isinstance(value, np.generic) else value
+        if key in self._forecast._groups:
+            return RowView(self._forecast, self._index, key + ".")
+        raise AttributeError(name)
+
+    def __repr__(self) -> str:
+        return f"RowView({self._prefix or 'row'}[{self._index}])"
+
+
+class CompactForecast:
+    """
+    Struct-of-arrays storage of a list of forecast models of one class.
+
+    Attributes:
+        model (type[BaseModel]): The model class of the rows.
+        columns (Dict[str, np.ndarray | tuple]): The values per leaf field,
+        named by the dotted field path, e.g. "temperature.value".
+    """
+
+    __slots__ = ("model", "columns", "_leaves", "_groups", "_length")
+
+    def __init__(
+        self,
+        model: type[BaseModel],
+        columns: Dict[str, np.ndarray | tuple],
+        leaves: List[_Column],
+        length: int,
+    ) -> None:
+        self.model = model
+        self.columns = columns
+        self._leaves = leaves
+        self._length = length
+        self._groups = {
+            ".".join(leaf.path[:i])
+            for leaf in leaves
+            for i in range(1, len(leaf.path))
+        }
+
+    @classmethod
+    def from_models(
+        cls, model: type[BaseModel], rows: Sequence[BaseModel]
+    ) -> "CompactForecast":
+        """
+        Builds the compact form of a list of models.
+
+        Args:
+            model (type[BaseModel]): The model class of the rows.
+            rows (Sequence[BaseModel]): The models.
+
+        Returns:
+            CompactForecast: The compact form.
+        """
+        leaves = _model_columns(model)
+        records: Dict[str, list] = {}
+        for leaf in leaves:
+            values = []
+            for row in rows:
+                value = row
+                for name in leaf.path:
+                    value = getattr(value, name)
+                values.append(value)
+            records[leaf.name] = values
+        leaves = _expand_dict_columns(leaves, records)
+        columns = {
+            leaf.name: _to_array(records[leaf.name], leaf.dtype)
+            for leaf in leaves
+        }
+        return cls(model, columns, leaves, len(rows))
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> RowView:
+        if not -self._length <= index < self._length:
+            raise IndexError(index)
+        return RowView(self, index % self._length)
+
+    def __iter__(self) -> Iterator[RowView]:
+        return (RowView(self, index) for index in range(self._length))
+
+    def column(self, name: str) -> np.ndarray | tuple:
+        """
+        Returns the values of a leaf field.
+
+        Args:
+            name (str): The dotted field path, e.g. "wind.speed.value".
+
+        Returns:
+            np.ndarray | tuple: The values, one per row.
+        """
+        return self.columns[name]
+
+    def to_models(self) -> List[BaseModel]:
+        """
+        Converts the rows back to models.
+
+        Returns:
+            List[BaseModel]: One model per row, equal to the original rows.
+        """
+        values = [
+            (
+                leaf.aliases,
+                (
+                    self.columns[leaf.name].tolist()
+                    if leaf.dtype is not None
+                    else self.columns[leaf.name]
+                ),
+            )
+            for leaf in self._leaves
+        ]
+        rows = []
+        for index in range(self._length):
+            data: Dict[str, Any] = {}
+            for aliases, column in values:
+                target = data
+                for alias in aliases[:-1]:
+                    target = target.setdefault(alias, {})
+                target[aliases[-1]] = column[index]
+            rows.append(self.model.model_validate(data))
+        return rows
+
+    @property
+    def nbytes(self) -> int:
+        """The size of the typed arrays in bytes."""
+        return sum(
+            column.nbytes
+            for column in self.columns.values()
+            if isinstance(column, np.ndarray)
+        )
+
+
+class CompactHourlyForecast(CompactForecast):
+    """Compact form of a `HourlyForecastModel`, one row per hour."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_model(
+        cls, forecast: HourlyForecastModel
+    ) -> "CompactHourlyForecast":
+        """
+        Builds the compact form of an hourly forecast.
+
+        Args:
+            forecast (HourlyForecastModel): The hourly forecast.
+
+        Returns:
+            CompactHourlyForecast: The compact form.
+
+        Raises:
+            TypeError: If the forecast is a projection.
+        """
+        _check_full(forecast, HourlyForecastModel)
+        return cls.from_models(ForecastModel, forecast.output)
+
+    def to_model(self) -> HourlyForecastModel:
+        """
+        Converts the compact form back to an hourly forecast.
+
+        Returns:
+            HourlyForecastModel: The hourly forecast.
+        """
+        return HourlyForecastModel(output=self.to_models())
+
+
+class CompactDailyForecast(CompactForecast):
+    """
+    Compact form of a `ForecastModel5Days`, one row per day.
+
+    Attributes:
+        headline (Optional[HeadlineModel]): The headline of the forecast.
+    """
+
+    __slots__ = ("headline",)
+
+    @classmethod
+    def from_model(
+        cls, forecast: ForecastModel5Days
+    ) -> "CompactDailyForecast":
+        """
+        Builds the compact form of a daily forecast.
+
+        Args:
+            forecast (ForecastModel5Days): The daily forecast.
+
+        Returns:
+            CompactDailyForecast: The compact form.
+
+        Raises:
+            TypeError: If the forecast is a projection.
+        """
+        _check_full(forecast, ForecastModel5Days)
+        compact = cls.from_models(DailyForecastModel, forecast.daily_forecasts)
+        compact.headline = forecast.headline
+        return compact
+
+    @classmethod
+    def from_models(
+        cls, model: type[BaseModel], rows: Sequence[BaseModel]
+    ) -> "CompactDailyForecast":
+        compact = super().from_models(model, rows)
+        compact.headline = None
+        return compact
+
+    def to_model(self) -> ForecastModel5Days:
+        """
+        Converts the compact form back to a daily forecast.
+
+        Returns:
+            ForecastModel5Days: The daily forecast.
+        """
+        return ForecastModel5Days(
+            Headline=self.headline, DailyForecasts=self.to_models()
+        )
+
+
+class CurrentConditionsColumns:
+    """
+    Current conditions of many locations, one row per location key, with a
+    typed array per value of `CurrentConditionsRecord`, e.g.
+    `columns.column("temperature")`. Missing floats are NaN.
+
+    Attributes:
+        location_keys (tuple): The location key of each row.
+        metric (bool): Whether the values are in metric units.
+        columns (Dict[str, np.ndarray | tuple]): The values per field.
+        errors (Dict[str, str]): The error per location key that could not
+        be fetched, those keys have no row.
+    """
+
+    __slots__ = ("location_keys", "metric", "columns", "errors", "_rows")
+
+    def __init__(
+        self,
+        location_keys: Sequence[str],
+        columns: Dict[str, np.ndarray | tuple],
+        metric: bool = True,
+        errors: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self.location_keys = tuple(location_keys)
+        self.columns = columns
+        self.metric = metric
+        self.errors = errors or {}
+        self._rows = {key: row for row, key in enumerate(self.location_keys)}
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[CurrentConditionsRecord],
+        metric: bool = True,
+        errors: Optional[Dict[str, str]] = None,
+    ) -> "CurrentConditionsColumns":
+        """
+        Builds the columns of records.
+
+        Args:
+            records (Iterable[CurrentConditionsRecord]): The records, in one
+            unit system.
+            metric (bool): Whether the records are in metric units.
+            errors (Optional[Dict[str, str]]): The error per location key
+            without a record.
+
+        Returns:
+            CurrentConditionsColumns: The columns.
+        """
+        records = list(records)
+        columns = {
+            name: _to_array(
+                [getattr(record, name) for record in records],
+                DTYPES.get(kind),
+            )
+            for name, kind in RECORD_FIELDS.items()
+        }
+        return cls(
+            [record.location_key for record in records],
+            columns,
+            metric,
+            errors,
+        )
+
+    def __len__(self) -> int:
+        return len(self.location_keys)
+
+    def __contains__(self, location_key: str) -> bool:
+        return location_key in self._rows
+
+    def __getitem__(self, location_key: str) -> CurrentConditionsRecord:
+        row = self._rows[location_key]
+        return CurrentConditionsRecord(
+            location_key,
+            self.metric,
+            **{
+                name: (
+                    column[row].item()
+                    if isinstance(column, np.ndarray)
+                    else column[row]
+                )
+                for name, column in self.columns.items()
+            },
+        )
+
+    def column(self, name: str) -> np.ndarray | tuple:
+        """
+        Returns the values of a field.
+
+        Args:
+            name (str): The field, e.g. "wind_speed".
+
+        Returns:
+            np.ndarray | tuple: The values, one per location key.
+        """
+        return self.columns[name]
+
+    def to_records(self) -> List[CurrentConditionsRecord]:
+        """Returns the record of each row."""
+        return [self[key] for key in self.location_keys]
+
+    @property
+    def nbytes(self) -> int:
+        """The size of the typed arrays in bytes."""
+        return sum(
+            column.nbytes
+            for column in self.columns.values()
+            if isinstance(column, np.ndarray)
+        )
@@ -0,0 +1,154 @@
+"""
+current.py
+
+This module provides a compact record of the current conditions at a
+location. A record holds the commonly used values of an observation as plain
+Python values in slots, in one unit system, instead of the nested models or
+dictionaries of the API payload. Values that were not returned, e.g. the wind
+of a response without details, are NaN.
+
+Example:
+    observation = weather.get_current_observations()[0]
+    record = CurrentConditionsRecord.from_model("349727", observation)
+    record.temperature, record.wind_speed, record.relative_humidity
+
+Classes:
+    - CurrentConditionsRecord: Slots-based record of an observation.
+"""
+
+import math
+from typing import Any, Dict, Optional
+
+from accuweather_client.models.weather import (
+    CurrentConditionModel,
+    MetricImperialModel,
+)
+
+# The values of a record and their types, in column order
+RECORD_FIELDS: Dict[str, type] = {
+    "epoch_time": int,
+    "weather_icon": int,
+    "is_day_time": bool,
+    "has_precipitation": bool,
+    "temperature": float,
+    "real_feel_temperature": float,
+    "dew_point": float,
+    "relative_humidity": float,
+    "wind_speed": float,
+    "wind_direction": float,
+    "wind_gust": float,
+    "uv_index": float,
+    "cloud_cover": float,
+    "visibility": float,
+    "pressure": float,
+    "precipitation_1hr": float,
+    "weather_text": str,
+}
+
+
+def _value(quantity: Optional[MetricImperialModel], metric: bool) -> float:
+    return math.nan if quantity is None else quantity.value(metric)
+
+
+def _number(value: Optional[int]) -> float:
+    return math.nan if value is None else float(value)
+
+
+class CurrentConditionsRecord:
+    """
+    Slots-based record of the current conditions at a location.
+
+    Attributes:
+        location_key (str): The location key.
+        metric (bool): Whether the values are in metric units, i.e. °C, km/h,
+        km, mb and mm, or in imperial units.
+        epoch_time (int): The observation time as UNIX time.
+        weather_icon (int): The weather icon number, 0 when not returned.
+        is_day_time (bool): Whether it is daytime.
+        has_precipitation (bool): Whether there is precipitation.
+        temperature (float): The temperature.
+        real_feel_temperature (float): The RealFeel temperature.
+        dew_point (float): The dew point.
+        relative_humidity (float): The relative humidity in percent.
+        wind_speed (float): The wind speed.
+        wind_direction (float): The wind direction in degrees.
+        wind_gust (float): The speed of the wind gusts.
+        uv_index (float): The UV index.
+        cloud_cover (float): The cloud cover in percent.
+        visibility (float): The visibility.
+        pressure (float): The air pressure.
+        precipitation_1hr (float): The precipitation of the past hour.
+        weather_text (str): The phrase describing the weather.
+    """
+
+    __slots__ = ("location_key", "metric", *RECORD_FIELDS)
+
+    def __init__(self, location_key: str, metric: bool, **values: Any):
+        self.location_key = location_key
+        self.metric = metric
+        for name in RECORD_FIELDS:
+            setattr(self, name, values[name])
+
+    @classmethod
+    def from_model(
+        cls,
+        location_key: str,
+        observation: CurrentConditionModel,
+        metric: bool = True,
+    ) -> "CurrentConditionsRecord":
+        """
+        Builds the record of an observation.
+
+        Args:
+            location_key (str): The location key of the observation.
+            observation (CurrentConditionModel): The observation.
+            metric (bool): Whether to keep the metric or imperial values.
+
+        Returns:
+            CurrentConditionsRecord: The record.
+        """
+        wind = observation.wind
+        gust = observation.wind_gust
+        return cls(
+            location_key,
+            metric,
+            epoch_time=observation.epoch_time,
+            weather_icon=observation.weather_icon or 0,
+            is_day_time=observation.is_day_time,
+            has_precipitation=observation.has_precipitation,
+            temperature=observation.temperature.value(metric),
+            real_feel_temperature=_value(
+                observation.real_feel_temperature, metric
+            ),
+            dew_point=_value(observation.dew_point, metric),
+            relative_humidity=_number(observation.relative_humidity),
+            wind_speed=_value(wind and wind.speed, metric),
+            wind_direction=_number(wind and wind.direction.degrees),
+            wind_gust=_value(gust and gust.speed, metric),
+            uv_index=_number(observation.uv_index),
+            cloud_cover=_number(observation.cloud_cover),
+            visibility=_value(observation.visibility, metric),
+            pressure=_value(observation.pressure, metric),
+            precipitation_1hr=_value(observation.precipitation_1hr, metric),
+            weather_text=observation.weather_text,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the location key, unit system and values of the record."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CurrentConditionsRecord):
+            return NotImplemented
+        # NaN values compare equal, as they both stand for a missing value
+        return all(
+            a == b or (a != a and b != b)
+            for a, b in zip(self.to_dict().values(), other.to_dict().values())
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"CurrentConditionsRecord({self.location_key!r}, "
+            f"temperature={self.temperature}, "
+            f"weather_text={self.weather_text!r})"
+        )
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from typing import List, Optional
 
 
@@ -101,6 +101,10 @@ class Details(BaseModel):
     DMA: Optional[DMAModel] = None
 
 
+# The field of the same name shadows the class in `LocationModelItem`
+DetailsModel = Details
+
+
 class ParentCityModel(BaseModel):
     Key: str
     LocalizedName: str
@@ -123,12 +127,32 @@ class LocationModelItem(BaseModel):
     IsAlias: bool
     SupplementalAdminAreas: List[SupplementalAdminArea]
     DataSets: List[str]
-    Details: Details
+    # Only returned when the location is requested with details
+    Details: Optional[DetailsModel] = None
     ParentCity: Optional[ParentCityModel] = None
 
 
+_LOCATION_ITEMS = TypeAdapter(List[LocationModelItem])
+
+
 class LocationModel(BaseModel):
     response: list[LocationModelItem] | LocationModelItem
 
+    @classmethod
+    def from_json(cls, content: bytes | str):
+        # Picks the branch of the union up front, the items are validated by
+        # pydantic-core straight from the raw JSON
+        if content.lstrip()[:1] in (b"[", "["):
+            response = _LOCATION_ITEMS.validate_json(content)
+        else:
+            response = LocationModelItem.model_validate_json(content)
+        return cls.model_construct(response=response)
+
     def get_location_key(self):
         return self.response[0].Key
+
+    def get_location_item(self) -> LocationModelItem:
+        """Returns the best matching location of the response."""
+        if isinstance(self.response, list):
+            return self.response[0]
+        return self.response
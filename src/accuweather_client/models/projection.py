@@ -0,0 +1,268 @@
+"""
+projection.py
+
+This module builds lightweight pydantic models that hold only a selection of
+the fields of a response model. Fields are selected by their dotted
+attribute paths, e.g. "output.temperature.value"; lists are traversed
+transparently, and paths into dictionary fields continue with the keys of the
+API payload, e.g. "output.Temperature.Metric.Value". Unselected fields are
+skipped by the validator, so projected responses take less time to parse and
+less memory to hold.
+
+Example:
+    HourlyTemperatures = project(
+        HourlyForecastModel,
+        ["output.epoch_date_time", "output.temperature.value"],
+    )
+    forecast = HourlyTemperatures.from_json(content)
+    forecast.output[0].temperature.value
+
+Classes:
+    - Projection: Base class of the projected models.
+
+Functions:
+    - project: Builds the projected model of a response model.
+    - response_model: Returns the model a response is parsed into.
+"""
+
+from functools import lru_cache
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, Field, TypeAdapter, create_model
+
+from accuweather_client.models.weather import (
+    CurrentConditionsModel,
+    ForecastModel5Days,
+    HourlyForecastModel,
+)
+
+# Response models whose payload is a JSON list held in a field
+LIST_RESPONSES = {
+    HourlyForecastModel: "output",
+    CurrentConditionsModel: "output",
+}
+
+# The fields the API returns when `details` is false
+BASIC_FIELDS: Dict[type, Tuple[str, ...]] = {
+    ForecastModel5Days: (
+        "headline",
+        "daily_forecasts.date",
+        "daily_forecasts.epoch_date",
+        "daily_forecasts.temperature",
+        *(
+            f"daily_forecasts.{period}.{name}"
+            for period in ("day", "night")
+            for name in ("icon", "icon_phrase", "has_precipitation")
+        ),
+        "daily_forecasts.sources",
+        "daily_forecasts.mobile_link",
+        "daily_forecasts.link",
+    ),
+    HourlyForecastModel: (
+        "output.date_time",
+        "output.epoch_date_time",
+        "output.weather_icon",
+        "output.icon_phrase",
+        "output.has_precipitation",
+        "output.precipitation_type",
+        "output.precipitation_intensity",
+        "output.is_daylight",
+        "output.temperature",
+        "output.precipitation_probability",
+    ),
+    CurrentConditionsModel: (
+        "output.LocalObservationDateTime",
+        "output.EpochTime",
+        "output.WeatherText",
+        "output.WeatherIcon",
+        "output.HasPrecipitation",
+        "output.PrecipitationType",
+        "output.IsDayTime",
+        "output.Temperature",
+        "output.MobileLink",
+        "output.Link",
+    ),
+}
+
+
+class Projection(BaseModel):
+    """
+    Base class of the projected models. Projections of list responses hold
+    the items in the same field as their response model, e.g. `output`.
+    """
+
+    _list_field: ClassVar[Optional[str]] = None
+    _items: ClassVar[Optional[TypeAdapter]] = None
+
+    @classmethod
+    def from_api_response(cls, data: Any):
+        if cls._list_field is not None:
+            data = {cls._list_field: data}
+        return cls.model_validate(data)
+
+    @classmethod
+    def from_json(cls, content: bytes | str):
+        if cls._list_field is not None:
+            return cls.model_construct(
+                **{cls._list_field: cls._items.validate_json(content)}
+            )
+        return cls.model_validate_json(content)
+
+
+def _path_tree(fields: Iterable[str]) -> Dict[str, Dict]:
+    """Merges dotted paths into a tree of nested dictionaries."""
+    tree: Dict[str, Dict] = {}
+    for path in fields:
+        node = tree
+        for name in path.split("."):
+            node = node.setdefault(name, {})
+    return tree
+
+
+def _unwrap(annotation: Any) -> Tuple[Any, bool, bool]:
+    """Strips `Optional` and `List` from an annotation."""
+    optional = False
+    if get_origin(annotation) is Union and type(None) in get_args(annotation):
+        optional = True
+        (annotation,) = [
+            arg for arg in get_args(annotation) if arg is not type(None)
+        ]
+    is_list = get_origin(annotation) in (list, List)
+    if is_list:
+        (annotation,) = get_args(annotation)
+    return annotation, optional, is_list
+
+
+def _rewrap(annotation: Any, optional: bool, is_list: bool) -> Any:
+    if is_list:
+        annotation = List[annotation]
+    if optional:
+        annotation = Optional[annotation]
+    return annotation
+
+
+def _is_dict(annotation: Any) -> bool:
+    return (
+        annotation is Any
+        or annotation is dict
+        or get_origin(annotation) is dict
+    )
+
+
+def _dict_model(name: str, tree: Dict[str, Dict]) -> type[BaseModel]:
+    """Builds a model of the selected keys of a dictionary."""
+    fields = {}
+    for key, subtree in tree.items():
+        if not key.isidentifier() or key.startswith("_"):
+            raise ValueError(f"Cannot project the key {key!r} of {name}")
+        annotation = (
+            Optional[_dict_model(f"{name}{key}", subtree)] if subtree else Any
+        )
+        fields[key] = (annotation, None)
+    return create_model(f"{name}Projection", **fields)
+
+
+def _model(
+    model: type[BaseModel], tree: Dict[str, Dict], base: type = BaseModel
+) -> type[BaseModel]:
+    """Builds a model of the selected fields of a model."""
+    aliases = {
+        field.alias: name
+        for name, field in model.model_fields.items()
+        if field.alias
+    }
+    fields = {}
+    for name, subtree in tree.items():
+        name = aliases.get(name, name)
+        field = model.model_fields.get(name)
+        if field is None:
+            raise ValueError(f"{model.__name__} has no field {name!r}")
+        annotation = field.annotation
+        if subtree:
+            inner, optional, is_list = _unwrap(annotation)
+            if isinstance(inner, type) and issubclass(inner, BaseModel):
+                inner = _model(inner, subtree)
+            elif _is_dict(inner):
+                inner = _dict_model(f"{model.__name__}{name.title()}", subtree)
+            else:
+                raise ValueError(
+                    f"The field {name!r} of {model.__name__} has no fields"
+                )
+            annotation = _rewrap(inner, optional, is_list)
+        default = ... if field.is_required() else field.default
+        fields[name] = (annotation, Field(default, alias=field.alias))
+    return create_model(f"{model.__name__}Projection", __base__=base, **fields)
+
+
+@lru_cache(maxsize=256)
+def _project(model: type[BaseModel], fields: Tuple[str, ...]):
+    projected = _model(model, _path_tree(fields), Projection)
+    list_field = LIST_RESPONSES.get(model)
+    if list_field is not None:
+        projected._list_field = list_field
+        projected._items = TypeAdapter(
+            projected.model_fields[list_field].annotation
+        )
+    return projected
+
+
+def project(model: type[BaseModel], fields: Iterable[str]) -> type[Projection]:
+    """
+    Builds the projected model of a response model. Projections are cached,
+    so the same selection of fields returns the same class.
+
+    Args:
+        model (type[BaseModel]): The response model, e.g.
+        `HourlyForecastModel`.
+        fields (Iterable[str]): The dotted attribute paths of the fields to
+        keep, e.g. "output.temperature.value". Field aliases are accepted
+        too.
+
+    Returns:
+        type[Projection]: A model with `from_json` and `from_api_response`
+        constructors that holds only the selected fields.
+
+    Raises:
+        ValueError: If a path does not lead to a field of the model.
+    """
+    fields = tuple(sorted(set(fields)))
+    if not fields:
+        raise ValueError("At least one field must be selected.")
+    return _project(model, fields)
+
+
+def response_model(
+    model: type[BaseModel],
+    details: bool = True,
+    fields: Optional[Sequence[str]] = None,
+) -> type[BaseModel]:
+    """
+    Returns the model a response is parsed into: the projection of the
+    selected fields, the projection of the fields returned without details,
+    or the response model itself.
+
+    Args:
+        model (type[BaseModel]): The response model.
+        details (bool): Whether the response was requested with details.
+        fields (Optional[Sequence[str]]): The fields to keep, all by default.
+
+    Returns:
+        type[BaseModel]: The model to parse the response into.
+    """
+    if fields:
+        return project(model, fields)
+    if not details and model in BASIC_FIELDS:
+        return project(model, BASIC_FIELDS[model])
+    return model
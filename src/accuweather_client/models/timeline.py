@@ -0,0 +1,271 @@
+"""
+timeline.py
+
+This module keeps forecast timelines for incremental refreshes. A timeline
+holds the latest forecast row of a location per `EpochDate` (days) or
+`EpochDateTime` (hours). Merging a new response updates the rows and reports
+which days or hours were added or changed, so consumers only recompute the
+deltas. Responses identical to the previous response of the same endpoint
+are detected from their bytes and not parsed at all.
+
+Example:
+    timelines = TimelineStore()
+    weather = WeatherClient(token="your_api_key", city="Oslo",
+                            timelines=timelines)
+    update = weather.refresh_hourly_forecast(hours=72)
+    for epoch in update.epochs:
+        print(epoch, timelines.get(weather.location_key, "hourly")[epoch])
+
+Classes:
+    - TimelineUpdate: Outcome of merging a response into a timeline.
+    - ForecastTimeline: Forecast rows of one location keyed by epoch time.
+    - TimelineStore: Thread-safe collection of timelines.
+
+Functions:
+    - rows_of: Returns the forecast rows of a daily or hourly response.
+"""
+
+import hashlib
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from pydantic import BaseModel, Field
+
+# Attribute holding the epoch time of the rows, per forecast kind
+EPOCH_FIELDS = {"daily": "epoch_date", "hourly": "epoch_date_time"}
+# Path of the epoch time in the response models, see `project`
+EPOCH_PATHS = {
+    "daily": "daily_forecasts.epoch_date",
+    "hourly": "output.epoch_date_time",
+}
+
+
+class TimelineUpdate(BaseModel):
+    """
+    Outcome of merging a response into a timeline.
+
+    Attributes:
+        location_key (str): The location key of the timeline.
+        kind (str): "daily" or "hourly".
+        added (List[int]): The epoch times of the new rows.
+        changed (Dict[int, List[str]]): The names of the changed fields per
+        epoch time of the changed rows.
+        unchanged (int): The number of merged rows that did not change.
+        not_modified (bool): Whether the response was identical to the
+        previous response of the endpoint, and thus not parsed.
+    """
+
+    location_key: str
+    kind: str
+    added: List[int] = Field(default_factory=list)
+    changed: Dict[int, List[str]] = Field(default_factory=dict)
+    unchanged: int = 0
+    not_modified: bool = False
+
+    @property
+    def epochs(self) -> List[int]:
+        """The epoch times of the added and changed rows, in order."""
+        return sorted([*self.added, *self.changed])
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether any row was added or changed."""
+        return bool(self.added or self.changed)
+
+
+def _changed_fields(old: BaseModel, new: BaseModel) -> List[str]:
+    """Returns the names of the fields that differ between two rows."""
+    if type(old) is not type(new):
+        return list(type(new).model_fields)
+    return [
+        name
+        for name in type(new).model_fields
+        if getattr(old, name) != getattr(new, name)
+    ]
+
+
+class ForecastTimeline:
+    """
+    Forecast rows of one location keyed by their epoch time. Rows keep their
+    model class, so refreshes of one timeline should select the same fields.
+
+    Attributes:
+        location_key (str): The location key.
+        kind (str): "daily" or "hourly".
+        epoch_field (str): The attribute holding the epoch time of a row.
+    """
+
+    def __init__(self, location_key: str, kind: str) -> None:
+        if kind not in EPOCH_FIELDS:
+            raise ValueError(
+                f"Unknown forecast kind {kind!r}, use daily or hourly."
+            )
+        self.location_key = location_key
+        self.kind = kind
+        self.epoch_field = EPOCH_FIELDS[kind]
+        self._rows: Dict[int, BaseModel] = {}
+        self._digests: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, epoch: int) -> bool:
+        return epoch in self._rows
+
+    def __getitem__(self, epoch: int) -> BaseModel:
+        return self._rows[epoch]
+
+    def rows(
+        self, start: Optional[int] = None, end: Optional[int] = None
+    ) -> List[BaseModel]:
+        """
+        Returns the rows in order of their epoch time.
+
+        Args:
+            start (Optional[int]): The first epoch time to include.
+            end (Optional[int]): The epoch time to stop before.
+
+        Returns:
+            List[BaseModel]: The rows.
+        """
+        with self._lock:
+            return [
+                self._rows[epoch]
+                for epoch in sorted(self._rows)
+                if (start is None or epoch >= start)
+                and (end is None or epoch < end)
+            ]
+
+    def merge(self, rows: Sequence[BaseModel]) -> TimelineUpdate:
+        """
+        Merges forecast rows into the timeline. Rows of epoch times that
+        are not part of the new rows are kept.
+
+        Args:
+            rows (Sequence[BaseModel]): The rows of a response.
+
+        Returns:
+            TimelineUpdate: The added and changed epoch times.
+        """
+        update = TimelineUpdate(location_key=self.location_key, kind=self.kind)
+        with self._lock:
+            for row in rows:
+                epoch = getattr(row, self.epoch_field)
+                old = self._rows.get(epoch)
+                self._rows[epoch] = row
+                if old is None:
+                    update.added.append(epoch)
+                    continue
+                changed = _changed_fields(old, row)
+                if changed:
+                    update.changed[epoch] = changed
+                else:
+                    update.unchanged += 1
+        return update
+
+    def update(
+        self,
+        source: str,
+        content: bytes,
+        parse: Callable[[bytes], Sequence[BaseModel]],
+    ) -> TimelineUpdate:
+        """
+        Merges the rows of a response body, unless the body is identical to
+        the previous body of the same source.
+
+        Args:
+            source (str): The endpoint and options the body was requested
+            with, e.g. "forecasts/v1/hourly/72hour/?details=true".
+            content (bytes): The raw JSON body of the response.
+            parse (Callable[[bytes], Sequence[BaseModel]]): Parses the body
+            into rows.
+
+        Returns:
+            TimelineUpdate: The added and changed epoch times.
+        """
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+        with self._lock:
+            if self._digests.get(source) == digest:
+                return TimelineUpdate(
+                    location_key=self.location_key,
+                    kind=self.kind,
+                    not_modified=True,
+                )
+        update = self.merge(parse(content))
+        with self._lock:
+            self._digests[source] = digest
+        return update
+
+    def prune(self, before: int) -> int:
+        """
+        Removes the rows before an epoch time, e.g. past hours.
+
+        Args:
+            before (int): The first epoch time to keep.
+
+        Returns:
+            int: The number of removed rows.
+        """
+        with self._lock:
+            old = [epoch for epoch in self._rows if epoch < before]
+            for epoch in old:
+                del self._rows[epoch]
+        return len(old)
+
+
+class TimelineStore:
+    """
+    Thread-safe collection of forecast timelines, one per location key and
+    forecast kind. Share a store between clients to keep the timelines of
+    many locations in one place.
+    """
+
+    def __init__(self) -> None:
+        self._timelines: Dict[Tuple[str, str], ForecastTimeline] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._timelines)
+
+    def get(self, location_key: str, kind: str) -> ForecastTimeline:
+        """
+        Returns the timeline of a location, creating it when needed.
+
+        Args:
+            location_key (str): The location key.
+            kind (str): "daily" or "hourly".
+
+        Returns:
+            ForecastTimeline: The timeline.
+        """
+        key = (location_key, kind)
+        with self._lock:
+            timeline = self._timelines.get(key)
+            if timeline is None:
+                timeline = self._timelines[key] = ForecastTimeline(
+                    location_key, kind
+                )
+            return timeline
+
+    def items(self) -> List[Tuple[Tuple[str, str], ForecastTimeline]]:
+        """Returns the timelines keyed by location key and kind."""
+        with self._lock:
+            return list(self._timelines.items())
+
+    def prune(self, before: int) -> int:
+        """
+        Removes the rows before an epoch time from every timeline.
+
+        Args:
+            before (int): The first epoch time to keep.
+
+        Returns:
+            int: The number of removed rows.
+        """
+        return sum(timeline.prune(before) for _, timeline in self.items())
+
+
+def rows_of(kind: str, forecast: Any) -> Sequence[BaseModel]:
+    """Returns the forecast rows of a daily or hourly response model."""
+    return forecast.daily_forecasts if kind == "daily" else forecast.output
@@ -1,7 +1,11 @@
-from typing import Any, List, Optional
+import json
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, List, Optional
 
-import pandas as pd
-from pydantic import BaseModel, computed_field, Field
+from pydantic import BaseModel, computed_field, Field, TypeAdapter
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class TemperatureModel(BaseModel):
@@ -120,6 +124,10 @@ class ForecastModel5Days(BaseModel):
     def from_api_response(cls, data: dict):
         return cls(**data)
 
+    @classmethod
+    def from_json(cls, content: bytes | str):
+        return cls.model_validate_json(content)
+
     @computed_field
     @property
     def text(self) -> str:
@@ -135,28 +143,117 @@ class ForecastModel5Days(BaseModel):
         rain = day_dict.day.precipitation_probability
         return f"{text}, max temp is {temp}{temp_unit} and {rain}% chance of rain."
 
-    def to_pandas_df(self) -> pd.DataFrame:
+    def to_pandas_df(self) -> "pd.DataFrame":
+        try:
+            import pandas as pd
+        except ImportError as e:
+            raise ImportError(
+                "to_pandas_df requires pandas, install it with "
+                '"pip install accuweather_client[pandas]".'
+            ) from e
+
         forecast_dicts = [
             forecast.dict(by_alias=True) for forecast in self.daily_forecasts
         ]
         return pd.json_normalize(forecast_dicts)
 
 
+_HOURLY_FORECASTS = TypeAdapter(List[ForecastModel])
+
+
 class HourlyForecastModel(BaseModel):
     output: List[ForecastModel]
 
+    @classmethod
+    def from_api_response(cls, data: list):
+        return cls(output=data)
+
+    @classmethod
+    def from_json(cls, content: bytes | str):
+        return cls.model_construct(
+            output=_HOURLY_FORECASTS.validate_json(content)
+        )
+
+
+class MetricImperialModel(BaseModel):
+    metric: TemperatureModel = Field(..., alias="Metric")
+    imperial: TemperatureModel = Field(..., alias="Imperial")
+
+    def value(self, metric: bool = True) -> float:
+        return (self.metric if metric else self.imperial).value
+
+
+class CurrentWindModel(BaseModel):
+    direction: WindDirectionModel = Field(..., alias="Direction")
+    speed: MetricImperialModel = Field(..., alias="Speed")
+
+
+class CurrentWindGustModel(BaseModel):
+    speed: MetricImperialModel = Field(..., alias="Speed")
+
+
+class CurrentConditionModel(BaseModel):
+    """A single observation of the current conditions. The fields after
+    `temperature` are only returned with details."""
+
+    local_observation_date_time: str = Field(
+        ..., alias="LocalObservationDateTime"
+    )
+    epoch_time: int = Field(..., alias="EpochTime")
+    weather_text: str = Field(..., alias="WeatherText")
+    weather_icon: Optional[int] = Field(..., alias="WeatherIcon")
+    has_precipitation: bool = Field(..., alias="HasPrecipitation")
+    precipitation_type: Optional[str] = Field(None, alias="PrecipitationType")
+    is_day_time: bool = Field(..., alias="IsDayTime")
+    temperature: MetricImperialModel = Field(..., alias="Temperature")
+    real_feel_temperature: Optional[MetricImperialModel] = Field(
+        None, alias="RealFeelTemperature"
+    )
+    relative_humidity: Optional[int] = Field(None, alias="RelativeHumidity")
+    dew_point: Optional[MetricImperialModel] = Field(None, alias="DewPoint")
+    wind: Optional[CurrentWindModel] = Field(None, alias="Wind")
+    wind_gust: Optional[CurrentWindGustModel] = Field(None, alias="WindGust")
+    uv_index: Optional[int] = Field(None, alias="UVIndex")
+    cloud_cover: Optional[int] = Field(None, alias="CloudCover")
+    visibility: Optional[MetricImperialModel] = Field(None, alias="Visibility")
+    pressure: Optional[MetricImperialModel] = Field(None, alias="Pressure")
+    precipitation_1hr: Optional[MetricImperialModel] = Field(
+        None, alias="Precip1hr"
+    )
+    mobile_link: Optional[str] = Field(None, alias="MobileLink")
+    link: Optional[str] = Field(None, alias="Link")
+
+
+CURRENT_OBSERVATIONS = TypeAdapter(List[CurrentConditionModel])
+
 
 class CurrentConditionsModel(BaseModel):
     output: list[dict[str, Any]]
 
+    @classmethod
+    def from_api_response(cls, data: list):
+        return cls(output=data)
+
+    @classmethod
+    def from_json(cls, content: bytes | str):
+        # The output keeps the raw dictionaries, which json.loads decodes
+        # faster than pydantic-core. Typed observations are parsed straight
+        # from the JSON by `WeatherClient.get_current_observations`.
+        return cls.from_api_response(json.loads(content))
+
+    @cached_property
+    def observations(self) -> List[CurrentConditionModel]:
+        """The typed observations, validated on first access."""
+        return CURRENT_OBSERVATIONS.validate_python(self.output)
+
     @computed_field
     @property
     def current_conditions(self) -> str:
-        info = self.output[0]
-        text = info["WeatherText"]
-        temp = info["Temperature"]["Metric"]["Value"]
-        temp_unit = info["Temperature"]["Metric"]["Unit"]
-        wind_speed = info["Wind"]["Speed"]["Metric"]["Value"]
-        wind_direction = info["Wind"]["Direction"]["Localized"]
-        wind_unit = info["Wind"]["Speed"]["Metric"]["Unit"]
+        info = self.observations[0]
+        text = info.weather_text
+        temp = info.temperature.metric.value
+        temp_unit = info.temperature.metric.unit
+        wind_speed = info.wind.speed.metric.value
+        wind_direction = info.wind.direction.localized
+        wind_unit = info.wind.speed.metric.unit
         return f"At the moment: {text.lower()}, with a temperature of {temp}{temp_unit}. The wind is comming from the {wind_direction} at {wind_speed}{wind_unit}."
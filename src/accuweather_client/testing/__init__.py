@@ -0,0 +1,4 @@
+from .fixtures import current_conditions, daily_forecast  # noqa: F401
+from .fixtures import hourly_forecast, location_item  # noqa: F401
+from .fixtures import location_search  # noqa: F401
+from .server import MockAccuWeatherServer  # noqa: F401
@@ -0,0 +1,434 @@
+"""
+fixtures.py
+
+This module builds recorded-style AccuWeather API payloads, requested with
+`details=true` and metric units. The payloads are deterministic and have the
+structure of real responses, so they can stand in for the API in benchmarks
+and offline tests.
+
+Functions:
+    - location_item: Builds the payload of a single location.
+    - location_search: Builds the payload of a city or POI search.
+    - daily_forecast: Builds the payload of a daily forecast.
+    - hourly_forecast: Builds the payload of an hourly forecast.
+    - current_conditions: Builds the payload of the current conditions.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+# 2024-08-20T00:00:00+10:00, the issue time of the forecasts
+START_EPOCH = 1724076000
+TZ = timezone(timedelta(hours=10))
+
+
+def _unit(value: float, unit: str, unit_type: int) -> Dict[str, Any]:
+    return {"Value": value, "Unit": unit, "UnitType": unit_type}
+
+
+def _celsius(value: float) -> Dict[str, Any]:
+    return _unit(round(value, 1), "C", 17)
+
+
+def _wind(speed: float, degrees: int) -> Dict[str, Any]:
+    directions = ["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
+    direction = directions[round(degrees / 45) % 8]
+    return {
+        "Speed": _unit(round(speed, 1), "km/h", 7),
+        "Direction": {
+            "Degrees": degrees,
+            "Localized": direction,
+            "English": direction,
+        },
+    }
+
+
+def _iso(epoch: int) -> str:
+    return datetime.fromtimestamp(epoch, TZ).isoformat()
+
+
+def _link(path: str, location_key: str) -> str:
+    return (
+        f"http://www.accuweather.com/en/au/sydney/2000/{path}/"
+        f"{location_key}?lang=en-us"
+    )
+
+
+def location_item(
+    key: str = "22889",
+    name: str = "Sydney",
+    country_id: str = "AU",
+    country: str = "Australia",
+    area_id: str = "NSW",
+    area: str = "New South Wales",
+    lat: float = -33.869,
+    lon: float = 151.209,
+) -> Dict[str, Any]:
+    """
+    Builds the payload of a single location.
+
+    Args:
+        key (str): The location key.
+        name (str): The name of the city.
+        country_id (str): The ISO code of the country.
+        country (str): The name of the country.
+        area_id (str): The code of the administrative area.
+        area (str): The name of the administrative area.
+        lat (float): The latitude of the location.
+        lon (float): The longitude of the location.
+
+    Returns:
+        Dict[str, Any]: The location payload.
+    """
+    return {
+        "Version": 1,
+        "Key": key,
+        "Type": "City",
+        "Rank": 10,
+        "LocalizedName": name,
+        "EnglishName": name,
+        "PrimaryPostalCode": "",
+        "Region": {
+            "ID": "OCN",
+            "LocalizedName": "Oceania",
+            "EnglishName": "Oceania",
+        },
+        "Country": {
+            "ID": country_id,
+            "LocalizedName": country,
+            "EnglishName": country,
+        },
+        "AdministrativeArea": {
+            "ID": area_id,
+            "LocalizedName": area,
+            "EnglishName": area,
+            "Level": 1,
+            "LocalizedType": "State",
+            "EnglishType": "State",
+            "CountryID": country_id,
+        },
+        "TimeZone": {
+            "Code": "AEST",
+            "Name": "Australia/Sydney",
+            "GmtOffset": 10.0,
+            "IsDaylightSaving": False,
+            "NextOffsetChange": "2024-10-05T16:00:00Z",
+        },
+        "GeoPosition": {
+            "Latitude": lat,
+            "Longitude": lon,
+            "Elevation": {
+                "Metric": _unit(19.0, "m", 5),
+                "Imperial": _unit(62.0, "ft", 0),
+            },
+        },
+        "IsAlias": False,
+        "SupplementalAdminAreas": [],
+        "DataSets": [
+            "AirQualityCurrentConditions",
+            "AirQualityForecasts",
+            "Alerts",
+            "DailyPollenForecast",
+            "ForecastConfidence",
+            "FutureRadar",
+            "MinuteCast",
+        ],
+        "Details": {
+            "Key": key,
+            "StationCode": "YSSY",
+            "StationGmtOffset": 10.0,
+            "BandMap": "AU",
+            "Climo": "YSSY",
+            "LocalRadar": "",
+            "MediaRegion": None,
+            "Metar": "YSSY",
+            "NXMetro": "",
+            "NXState": "",
+            "Population": 4627345,
+            "PrimaryWarningCountyCode": "",
+            "PrimaryWarningZoneCode": "",
+            "Satellite": "AUS",
+            "Synoptic": "94767",
+            "MarineStation": "",
+            "MarineStationGMTOffset": None,
+            "VideoCode": "",
+            "LocationStem": f"au/sydney/2000/{key}",
+            "PartnerID": None,
+            "Sources": [
+                {
+                    "DataType": "AirQualityCurrentConditions",
+                    "Source": "Plume Labs",
+                    "SourceId": 63,
+                },
+                {
+                    "DataType": "CurrentConditions",
+                    "Source": "AccuWeather",
+                    "SourceId": 1,
+                },
+                {
+                    "DataType": "DailyForecast",
+                    "Source": "AccuWeather",
+                    "SourceId": 1,
+                },
+                {
+                    "DataType": "HourlyForecast",
+                    "Source": "AccuWeather",
+                    "SourceId": 1,
+                },
+            ],
+            "CanonicalPostalCode": "2000",
+            "CanonicalLocationKey": key,
+        },
+    }
+
+
+def location_search(**kwargs) -> List[Dict[str, Any]]:
+    """
+    Builds the payload of a city or POI search, which is a list of
+    locations. The geoposition search returns a single location instead,
+    see `location_item`.
+
+    Args:
+        **kwargs: The keyword arguments of `location_item`.
+
+    Returns:
+        List[Dict[str, Any]]: The search payload.
+    """
+    return [location_item(**kwargs)]
+
+
+def _day_night(icon: int, phrase: str, rain: int, wind: float, degrees: int):
+    return {
+        "Icon": icon,
+        "IconPhrase": phrase,
+        "HasPrecipitation": rain >= 50,
+        "Wind": _wind(wind, degrees),
+        "WindGust": {"Speed": _unit(round(wind * 1.8, 1), "km/h", 7)},
+        "PrecipitationProbability": rain,
+    }
+
+
+def daily_forecast(
+    days: int = 5, location_key: str = "22889", start_epoch: int = START_EPOCH
+) -> Dict[str, Any]:
+    """
+    Builds the payload of a daily forecast.
+
+    Args:
+        days (int): The number of days.
+        location_key (str): The location key used in the links.
+        start_epoch (int): The issue time as UNIX time.
+
+    Returns:
+        Dict[str, Any]: The daily forecast payload.
+    """
+    link = _link("daily-weather-forecast", location_key)
+    forecasts = []
+    for day in range(days):
+        epoch = start_epoch + 7 * 3600 + day * 86400
+        rain = (day * 23) % 100
+        forecasts.append(
+            {
+                "Date": _iso(epoch),
+                "EpochDate": epoch,
+                "Temperature": {
+                    "Minimum": _celsius(9.0 + day % 4),
+                    "Maximum": _celsius(18.0 + (day * 3) % 7),
+                },
+                "Day": _day_night(
+                    14 if rain >= 50 else 2,
+                    (
+                        "Partly sunny w/ showers"
+                        if rain >= 50
+                        else "Mostly sunny"
+                    ),
+                    rain,
+                    12.0 + day,
+                    (day * 70) % 360,
+                ),
+                "Night": _day_night(
+                    35, "Partly cloudy", rain // 2, 8.0, (day * 50) % 360
+                ),
+                "Sources": ["AccuWeather"],
+                "MobileLink": link,
+                "Link": link,
+            }
+        )
+    return {
+        "Headline": {
+            "EffectiveDate": _iso(start_epoch + 86400 + 7 * 3600),
+            "EffectiveEpochDate": start_epoch + 86400 + 7 * 3600,
+            "Severity": 4,
+            "Text": "Expect showery weather Wednesday morning",
+            "Category": "rain",
+            "EndDate": _iso(start_epoch + 86400 + 13 * 3600),
+            "EndEpochDate": start_epoch + 86400 + 13 * 3600,
+            "MobileLink": link,
+            "Link": link,
+        },
+        "DailyForecasts": forecasts,
+    }
+
+
+def hourly_forecast(
+    hours: int = 12,
+    location_key: str = "22889",
+    start_epoch: int = START_EPOCH,
+) -> List[Dict[str, Any]]:
+    """
+    Builds the payload of an hourly forecast.
+
+    Args:
+        hours (int): The number of hours.
+        location_key (str): The location key used in the links.
+        start_epoch (int): The issue time as UNIX time; the first hour
+        starts one hour later.
+
+    Returns:
+        List[Dict[str, Any]]: The hourly forecast payload.
+    """
+    link = _link("hourly-weather-forecast", location_key)
+    forecasts = []
+    for hour in range(hours):
+        epoch = start_epoch + (hour + 1) * 3600
+        local_hour = datetime.fromtimestamp(epoch, TZ).hour
+        daylight = 7 <= local_hour < 18
+        temperature = 12.0 + 6.0 * daylight + (hour % 5) * 0.4
+        rain = (hour * 17) % 100
+        forecasts.append(
+            {
+                "DateTime": _iso(epoch),
+                "EpochDateTime": epoch,
+                "WeatherIcon": 2 if daylight else 35,
+                "IconPhrase": "Mostly sunny" if daylight else "Partly cloudy",
+                "HasPrecipitation": rain >= 70,
+                **(
+                    {
+                        "PrecipitationType": "Rain",
+                        "PrecipitationIntensity": "Light",
+                    }
+                    if rain >= 70
+                    else {}
+                ),
+                "IsDaylight": daylight,
+                "Temperature": _celsius(temperature),
+                "RealFeelTemperature": {
+                    **_celsius(temperature + 1.1),
+                    "Phrase": "Pleasant",
+                },
+                "RealFeelTemperatureShade": {
+                    **_celsius(temperature - 0.6),
+                    "Phrase": "Pleasant",
+                },
+                "WetBulbTemperature": _celsius(temperature - 4.2),
+                "WetBulbGlobeTemperature": _celsius(temperature - 1.5),
+                "DewPoint": _celsius(temperature - 8.3),
+                "Wind": _wind(9.3 + hour % 4, (hour * 30) % 360),
+                "WindGust": {"Speed": _unit(18.5, "km/h", 7)},
+                "RelativeHumidity": 45 + hour % 20,
+                "IndoorRelativeHumidity": 45 + hour % 20,
+                "Visibility": _unit(16.1, "km", 6),
+                "Ceiling": _unit(9144.0, "m", 5),
+                "UVIndex": 3 if daylight else 0,
+                "UVIndexText": "Moderate" if daylight else "Low",
+                "PrecipitationProbability": rain,
+                "ThunderstormProbability": rain // 5,
+                "RainProbability": rain,
+                "SnowProbability": 0,
+                "IceProbability": 0,
+                "TotalLiquid": _unit(0.0, "mm", 3),
+                "Rain": _unit(0.0, "mm", 3),
+                "Snow": _unit(0.0, "cm", 4),
+                "Ice": _unit(0.0, "mm", 3),
+                "CloudCover": (hour * 13) % 100,
+                "Evapotranspiration": _unit(0.1, "mm", 3),
+                "SolarIrradiance": _unit(250.0 * daylight, "W/m²", 33),
+                "MobileLink": link,
+                "Link": link,
+            }
+        )
+    return forecasts
+
+
+def current_conditions(
+    location_key: str = "22889", epoch: int = START_EPOCH
+) -> List[Dict[str, Any]]:
+    """
+    Builds the payload of the current conditions.
+
+    Args:
+        location_key (str): The location key used in the links.
+        epoch (int): The observation time as UNIX time.
+
+    Returns:
+        List[Dict[str, Any]]: The current conditions payload.
+    """
+    link = _link("current-weather", location_key)
+
+    def metric_imperial(metric, imperial):
+        return {"Metric": metric, "Imperial": imperial}
+
+    return [
+        {
+            "LocalObservationDateTime": _iso(epoch),
+            "EpochTime": epoch,
+            "WeatherText": "Mostly sunny",
+            "WeatherIcon": 2,
+            "HasPrecipitation": False,
+            "PrecipitationType": None,
+            "IsDayTime": True,
+            "Temperature": metric_imperial(
+                _celsius(18.3), _unit(65.0, "F", 18)
+            ),
+            "RealFeelTemperature": metric_imperial(
+                {**_celsius(19.4), "Phrase": "Pleasant"},
+                {**_unit(67.0, "F", 18), "Phrase": "Pleasant"},
+            ),
+            "RelativeHumidity": 52,
+            "IndoorRelativeHumidity": 52,
+            "DewPoint": metric_imperial(_celsius(8.3), _unit(47.0, "F", 18)),
+            "Wind": {
+                "Direction": {
+                    "Degrees": 270,
+                    "Localized": "W",
+                    "English": "W",
+                },
+                "Speed": metric_imperial(
+                    _unit(14.8, "km/h", 7), _unit(9.2, "mi/h", 9)
+                ),
+            },
+            "WindGust": {
+                "Speed": metric_imperial(
+                    _unit(27.8, "km/h", 7), _unit(17.3, "mi/h", 9)
+                )
+            },
+            "UVIndex": 4,
+            "UVIndexText": "Moderate",
+            "Visibility": metric_imperial(
+                _unit(16.1, "km", 6), _unit(10.0, "mi", 2)
+            ),
+            "ObstructionsToVisibility": "",
+            "CloudCover": 20,
+            "Ceiling": metric_imperial(
+                _unit(9144.0, "m", 5), _unit(30000.0, "ft", 0)
+            ),
+            "Pressure": metric_imperial(
+                _unit(1017.0, "mb", 14), _unit(30.03, "inHg", 12)
+            ),
+            "PressureTendency": {"LocalizedText": "Steady", "Code": "S"},
+            "ApparentTemperature": metric_imperial(
+                _celsius(17.8), _unit(64.0, "F", 18)
+            ),
+            "WindChillTemperature": metric_imperial(
+                _celsius(18.3), _unit(65.0, "F", 18)
+            ),
+            "WetBulbTemperature": metric_imperial(
+                _celsius(12.6), _unit(55.0, "F", 18)
+            ),
+            "Precip1hr": metric_imperial(
+                _unit(0.0, "mm", 3), _unit(0.0, "in", 1)
+            ),
+            "MobileLink": link,
+            "Link": link,
+        }
+    ]
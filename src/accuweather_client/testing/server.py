@@ -0,0 +1,387 @@
+"""
+server.py
+
+This module provides a local stand-in for the AccuWeather API. It serves the
+payloads of `accuweather_client.testing.fixtures` for the location searches,
+the 5-day and 12-hour forecasts and the current conditions, with
+configurable latency, error rate and rate limiting, so clients can be tested
+and benchmarked without an API key or network access.
+
+Every distinct query resolves to its own stable location key, and responses
+carry an `ETag` so conditional requests are answered with `304`. Requests
+with `details=false` get the smaller payloads the API returns without
+details.
+
+Example:
+    with MockAccuWeatherServer(latency=0.02, error_rate=0.01) as server:
+        weather = WeatherClient(
+            token="a" * 32, city="sydney", base_url=server.url
+        )
+        weather.get_5day_forecast()
+
+Run `python -m accuweather_client.testing.server --port 8080` to serve it
+from a separate process.
+
+Classes:
+    - MockAccuWeatherServer: Threaded HTTP server imitating the API.
+"""
+
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+import zlib
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from accuweather_client.testing.fixtures import (
+    current_conditions,
+    daily_forecast,
+    hourly_forecast,
+    location_item,
+)
+
+
+def _location_key(query: str) -> str:
+    """Returns a stable location key for a search query."""
+    return str(100000 + zlib.crc32(query.casefold().encode()) % 900000)
+
+
+def _location(query: str) -> Dict:
+    """Builds the location a search query resolves to."""
+    key = _location_key(query)
+    seed = int(key)
+    return location_item(
+        key=key,
+        name=query.split(",")[0].strip().title() or "Sydney",
+        lat=round((seed % 17000) / 100 - 85, 3),
+        lon=round((seed % 35000) / 100 - 175, 3),
+    )
+
+
+def _search(query: str) -> list:
+    return [_location(query)]
+
+
+# Routes as (pattern, name, payload factory of the match)
+ROUTES: Tuple[Tuple[re.Pattern, str, Callable], ...] = (
+    (
+        re.compile(r"/locations/v1/cities/geoposition/search$"),
+        "geoposition",
+        lambda match, query: _location(query),
+    ),
+    (
+        re.compile(r"/locations/v1/(cities/|poi/)?search$"),
+        "search",
+        lambda match, query: _search(query),
+    ),
+    (
+        re.compile(r"/forecasts/v1/daily/(\d+)day/(\w+)$"),
+        "daily",
+        lambda match, query: daily_forecast(
+            int(match.group(1)), match.group(2)
+        ),
+    ),
+    (
+        re.compile(r"/forecasts/v1/hourly/(\d+)hour/(\w+)$"),
+        "hourly",
+        lambda match, query: hourly_forecast(
+            int(match.group(1)), match.group(2)
+        ),
+    ),
+    (
+        re.compile(r"/currentconditions/v1/(\w+)$"),
+        "current",
+        lambda match, query: current_conditions(match.group(1)),
+    ),
+)
+
+
+# Keys of the payload items the API returns without details, per route
+_BASIC_KEYS = {
+    "hourly": {
+        "DateTime",
+        "EpochDateTime",
+        "WeatherIcon",
+        "IconPhrase",
+        "HasPrecipitation",
+        "PrecipitationType",
+        "PrecipitationIntensity",
+        "IsDaylight",
+        "Temperature",
+        "PrecipitationProbability",
+        "MobileLink",
+        "Link",
+    },
+    "current": {
+        "LocalObservationDateTime",
+        "EpochTime",
+        "WeatherText",
+        "WeatherIcon",
+        "HasPrecipitation",
+        "PrecipitationType",
+        "IsDayTime",
+        "Temperature",
+        "MobileLink",
+        "Link",
+    },
+}
+_BASIC_PERIOD_KEYS = {
+    "Icon",
+    "IconPhrase",
+    "HasPrecipitation",
+    "PrecipitationType",
+    "PrecipitationIntensity",
+}
+
+
+def _without_details(name: str, payload: Any) -> Any:
+    """Strips the keys the API only returns with details from a payload."""
+    if name in ("search", "geoposition"):
+        items = payload if isinstance(payload, list) else [payload]
+        for item in items:
+            item.pop("Details", None)
+    elif name == "daily":
+        for day in payload["DailyForecasts"]:
+            for period in ("Day", "Night"):
+                day[period] = {
+                    key: value
+                    for key, value in day[period].items()
+                    if key in _BASIC_PERIOD_KEYS
+                }
+    else:
+        keys = _BASIC_KEYS[name]
+        payload = [
+            {key: value for key, value in item.items() if key in keys}
+            for item in payload
+        ]
+    return payload
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "_HTTPServer"
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes, which Nagle would delay
+    disable_nagle_algorithm = True
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+    def _send(
+        self,
+        status: int,
+        body: bytes = b"",
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def _error(self, status: int, message: str, **headers: str) -> None:
+        body = json.dumps({"Code": str(status), "Message": message}).encode()
+        self._send(status, body, headers)
+
+    def do_GET(self) -> None:
+        mock = self.server.mock
+        url = urlsplit(self.path)
+        params = parse_qs(url.query)
+        for pattern, name, payload in ROUTES:
+            match = pattern.search(url.path)
+            if match:
+                break
+        else:
+            mock.count("not_found")
+            self._error(404, "Unknown endpoint")
+            return
+        mock.count(name)
+        if mock.latency or mock.latency_jitter:
+            time.sleep(
+                mock.latency + mock.random.uniform(0, mock.latency_jitter)
+            )
+        if not params.get("apikey"):
+            self._error(401, "Api Authorization failed")
+            return
+        retry_after = mock.take_token()
+        if retry_after is not None:
+            mock.count("rate_limited")
+            self._error(
+                429,
+                "The allowed number of requests has been exceeded.",
+                **{"Retry-After": f"{retry_after:.3f}"},
+            )
+            return
+        if mock.error_rate and mock.random.random() < mock.error_rate:
+            mock.count("errors")
+            self._error(503, "Service unavailable")
+            return
+        query = params.get("q", [""])[0]
+        details = params.get("details", ["false"])[0] == "true"
+        body, etag = mock.body(
+            f"{url.path}?{query}&{details}",
+            lambda: (
+                payload(match, query)
+                if details
+                else _without_details(name, payload(match, query))
+            ),
+        )
+        if self.headers.get("If-None-Match") == etag:
+            self._send(304, headers={"ETag": etag})
+            return
+        self._send(
+            200,
+            body,
+            {"ETag": etag, "Cache-Control": f"max-age={mock.max_age}"},
+        )
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+    mock: "MockAccuWeatherServer"
+
+
+class MockAccuWeatherServer:
+    """
+    Threaded HTTP server imitating the AccuWeather API on localhost.
+
+    Attributes:
+        latency (float): The delay in seconds added to every response.
+        latency_jitter (float): The maximum random delay in seconds added on
+        top of `latency`.
+        error_rate (float): The share of requests answered with `503`.
+        rate (Optional[float]): The number of requests per second accepted
+        before `429` responses, None for no limit.
+        burst (int): The size of the token bucket of the rate limit.
+        max_age (int): The `max-age` of the `Cache-Control` header.
+        stats (Counter): The number of requests per route, of errors and of
+        rate limited requests.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate: Optional[float] = None,
+        burst: int = 10,
+        max_age: int = 0,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.rate = rate
+        self.burst = burst
+        self.max_age = max_age
+        self.random = random.Random(seed)
+        self.stats: Counter = Counter()
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._bodies: Dict[str, Tuple[bytes, str]] = {}
+        self._lock = threading.Lock()
+        self._server = _HTTPServer((host, port), _Handler)
+        self._server.mock = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """The root URL of the server, to be used as `base_url`."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def count(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
+
+    def take_token(self) -> Optional[float]:
+        """
+        Takes a token of the rate limit.
+
+        Returns:
+            Optional[float]: None when the request is accepted, otherwise
+            the seconds until a token is available.
+        """
+        if self.rate is None:
+            return None
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return None
+            return (1 - self._tokens) / self.rate
+
+    def body(
+        self, key: str, payload: Callable[[], object]
+    ) -> Tuple[bytes, str]:
+        """Returns the serialized payload of a request and its ETag."""
+        cached = self._bodies.get(key)
+        if cached is None:
+            body = json.dumps(payload()).encode()
+            etag = '"' + hashlib.md5(body).hexdigest() + '"'
+            cached = self._bodies[key] = (body, etag)
+        return cached
+
+    def start(self) -> "MockAccuWeatherServer":
+        """Starts serving in a background thread."""
+        # A short poll interval keeps `stop` from blocking for half a second
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            args=(0.05,),
+            name="mock-accuweather",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops serving and closes the socket."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "MockAccuWeatherServer":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+
+def main() -> None:
+    """Runs the server in the foreground until interrupted."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Mock AccuWeather API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--latency-jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate", type=float)
+    parser.add_argument("--burst", type=int, default=10)
+    args = parser.parse_args()
+    server = MockAccuWeatherServer(**vars(args))
+    print(f"Serving the mock AccuWeather API on {server.url}")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        server._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
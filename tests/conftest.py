@@ -0,0 +1,38 @@
+import pytest
+
+from accuweather_client.clients import WeatherClient
+from accuweather_client.http import RetryPolicy, Transport
+from accuweather_client.testing import MockAccuWeatherServer
+
+TOKEN = "a" * 32
+LOCATION_KEY = "349727"
+
+
+@pytest.fixture
+def token():
+    return TOKEN
+
+
+@pytest.fixture
+def server():
+    with MockAccuWeatherServer() as server:
+        yield server
+
+
+@pytest.fixture
+def transport():
+    transport = Transport(
+        retry=RetryPolicy(max_retries=0), read_timeout=5.0, trust_env=False
+    )
+    yield transport
+    transport.close()
+
+
+@pytest.fixture
+def make_client(server, transport):
+    def make_client(**kwargs):
+        kwargs.setdefault("location_key", LOCATION_KEY)
+        kwargs.setdefault("transport", transport)
+        return WeatherClient(token=TOKEN, base_url=server.url, **kwargs)
+
+    return make_client
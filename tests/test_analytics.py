@@ -0,0 +1,40 @@
+import numpy as np
+
+from accuweather_client.analytics import ForecastBatch
+from accuweather_client.export import record_dtype
+
+
+def test_models_and_payloads_give_the_same_columns(make_client):
+    client = make_client()
+    forecast = client.get_hourly_forecast_12h()
+    payload = [row.model_dump(by_alias=True) for row in forecast.output]
+
+    from_models = ForecastBatch.from_models(
+        "hourly", {client.location_key: forecast}
+    )
+    from_payloads = ForecastBatch.from_payloads(
+        "hourly", {client.location_key: payload}
+    )
+
+    # The numeric columns of the snapshot records, in analytics types
+    for name in record_dtype("hourly").names[1:]:
+        np.testing.assert_array_equal(
+            from_models[name], from_payloads[name], err_msg=name
+        )
+    assert from_models["relative_humidity"].dtype == np.float64
+    assert from_models["temperature_unit_type"].dtype == np.int8
+
+
+def test_projections_have_missing_values(make_client):
+    client = make_client(details=False)
+
+    batch = ForecastBatch.from_models(
+        "daily", {client.location_key: client.get_5day_forecast()}
+    )
+
+    assert len(batch) == 5
+    assert not np.isnan(batch["temperature_max"]).any()
+    assert np.isnan(batch["day_wind_speed"]).all()
+    assert (batch["wind_speed_unit_type"] == -1).all()
+    converted = batch.to_units(metric=False)
+    assert (converted["temperature_unit_type"] == 18).all()
@@ -0,0 +1,145 @@
+import asyncio
+
+import httpx
+import pytest
+from requests.exceptions import RequestException
+
+from accuweather_client.cache import ResponseCache
+from accuweather_client.clients import AsyncWeatherClient
+from accuweather_client.clients.weather import WeatherBaseClient
+from accuweather_client.http import CircuitBreaker, CircuitOpenError
+from accuweather_client.http import RetryPolicy
+
+
+@pytest.fixture
+def run(server, token):
+    def run(test, **kwargs):
+        """Runs a test coroutine with a client of the mock server."""
+
+        async def main():
+            async with httpx.AsyncClient() as http_client:
+                kwargs.setdefault("location_key", "349727")
+                kwargs.setdefault("retry", RetryPolicy(max_retries=0))
+                client = await AsyncWeatherClient.create(
+                    http_client=http_client,
+                    token=token,
+                    base_url=server.url,
+                    **kwargs,
+                )
+                return await test(client)
+
+        return asyncio.run(main())
+
+    return run
+
+
+def test_matches_the_sync_client(run, make_client):
+    async def test(client):
+        return await client.get_hourly_forecast_12h(details=False)
+
+    assert run(test) == make_client().get_hourly_forecast_12h(details=False)
+    assert issubclass(AsyncWeatherClient, WeatherBaseClient)
+
+
+def test_concurrent_requests_resolve_the_location_once(server, token):
+    async def test(client):
+        await asyncio.gather(
+            *(client.get_current_conditions() for _ in range(5))
+        )
+        return client.location_key
+
+    async def main():
+        async with httpx.AsyncClient() as http_client:
+            client = AsyncWeatherClient(
+                token=token, city="oslo", base_url=server.url
+            )
+            client._http_client = http_client
+            return await test(client)
+
+    assert asyncio.run(main()) is not None
+    assert server.stats["search"] == 1
+    assert server.stats["current"] == 5
+
+
+def test_response_cache_coalesces_concurrent_requests(server, run):
+    server.max_age = 60
+    cache = ResponseCache()
+
+    async def test(client):
+        first = await asyncio.gather(
+            *(client.get_5day_forecast() for _ in range(3))
+        )
+        return first, await client.get_5day_forecast()
+
+    first, second = run(test, response_cache=cache)
+
+    assert first[0] == first[1] == first[2] == second
+    assert server.stats["daily"] == 1
+    assert cache.stats["misses"] == 1
+    assert cache.stats["coalesced"] == 2
+    assert cache.stats["hits"] == 1
+
+
+def test_stale_entry_is_revalidated(server, run):
+    cache = ResponseCache()
+
+    async def test(client):
+        return [await client.get_current_conditions() for _ in range(2)]
+
+    first, second = run(test, response_cache=cache)
+
+    assert first == second
+    assert cache.stats["revalidated"] == 1
+
+
+def test_retries_and_opens_the_circuit(server, run):
+    server.error_rate = 1.0
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=60.0)
+
+    async def test(client):
+        with pytest.raises(RequestException):
+            await client.get_current_conditions()
+        with pytest.raises(RequestException) as error:
+            await client.get_current_conditions()
+        return error.value
+
+    error = run(
+        test,
+        retry=RetryPolicy(max_retries=2, backoff_base=0.0),
+        circuit_breaker=breaker,
+    )
+
+    assert server.stats["errors"] == 3
+    assert breaker.state == "open"
+    assert isinstance(error.__cause__, CircuitOpenError)
+
+
+def test_warm_up_opens_connections(server, run):
+    async def test(client):
+        return await client.warm_up(connections=2)
+
+    report = run(test)
+
+    assert report.addresses
+    assert report.connections + report.reused == 2
+    assert not report.errors
+
+
+def test_location_lookup_is_retried(server, token):
+    server.error_rate = 1.0
+
+    async def main():
+        async with httpx.AsyncClient() as http_client:
+            await AsyncWeatherClient.create(
+                http_client=http_client,
+                token=token,
+                city="oslo",
+                base_url=server.url,
+                retry=RetryPolicy(max_retries=2, backoff_base=0.0),
+            )
+
+    with pytest.raises(ValueError) as error:
+        asyncio.run(main())
+
+    assert server.stats["errors"] == 3
+    assert isinstance(error.value.__cause__, RequestException)
@@ -0,0 +1,38 @@
+from collections import Counter
+
+from accuweather_client.clients import resolve_locations
+
+
+def test_resolves_locations_through_the_mock_server(server, token, transport):
+    rows = [
+        {"id": 1, "city": "Oslo", "country": "NO"},
+        {"id": 2, "city": " oslo ", "country": "no"},
+        {"id": 3, "lat": "59.9139", "lon": "10.7522"},
+        {"id": 4, "city": "Bergen"},
+        {"id": 5, "city": "OSLO", "country": "NO"},
+        {"id": 6, "lat": "59.91391", "lon": "10.75219"},
+    ]
+    stats = Counter()
+
+    resolved = list(
+        resolve_locations(
+            rows,
+            token,
+            chunk_size=2,
+            transport=transport,
+            api_root=server.url,
+            stats=stats,
+        )
+    )
+
+    assert [row["id"] for row in resolved] == [1, 2, 3, 4, 5, 6]
+    assert all(row["error"] is None for row in resolved)
+    assert all(row["location_key"] for row in resolved)
+    assert resolved[0]["location_key"] == resolved[1]["location_key"]
+    assert resolved[0]["location_key"] == resolved[4]["location_key"]
+    assert resolved[2]["location_key"] == resolved[5]["location_key"]
+    assert server.stats["search"] == 2
+    assert server.stats["geoposition"] == 1
+    assert stats["lookups"] == 3
+    assert stats["memo_hits"] == 2
+    assert stats["rows"] == 6
@@ -0,0 +1,37 @@
+import json
+
+from accuweather_client.cli import main
+
+
+def test_malformed_row_fails_alone(server, token, tmp_path):
+    locations = tmp_path / "locations.csv"
+    locations.write_text(
+        "city,lat,lon\n" "oslo,,\n" ",north,10.7\n" ",59.91,10.75\n"
+    )
+    output = tmp_path / "forecasts.jsonl"
+
+    status = main(
+        [
+            "fetch",
+            "--locations",
+            str(locations),
+            "--endpoints",
+            "current",
+            "--output",
+            str(output),
+            "--token",
+            token,
+            "--base-url",
+            server.url,
+            "--quiet",
+        ]
+    )
+
+    lines = [json.loads(line) for line in output.read_text().splitlines()]
+    failed = [line for line in lines if line["errors"]]
+    assert status == 1
+    assert len(lines) == 3
+    assert len(failed) == 1
+    assert failed[0]["query"]["lat"] == "north"
+    assert "location" in failed[0]["errors"]
+    assert server.stats["current"] == 2
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from accuweather_client.export import SnapshotStore, forecasts_to_table
+from accuweather_client.export import record_dtype
+
+
+@pytest.mark.parametrize("kind", ["hourly", "daily"])
+def test_snapshot_and_table_share_the_columns(kind, make_client, tmp_path):
+    client = make_client()
+    forecast = (
+        client.get_hourly_forecast_12h()
+        if kind == "hourly"
+        else client.get_5day_forecast()
+    )
+    store = SnapshotStore(str(tmp_path))
+
+    store.append(kind, client.location_key, forecast, issued=1)
+    records = store.query(kind, client.location_key)
+    table = forecasts_to_table([(client.location_key, forecast)], kind)
+
+    names = record_dtype(kind).names[1:]
+    assert set(names) <= set(table.column_names)
+    assert "temperature_unit_type" in names
+    for name in names:
+        expected = table.column(name).to_numpy(zero_copy_only=False)
+        np.testing.assert_allclose(
+            records[name].astype(np.float64),
+            expected.astype(np.float64),
+            rtol=1e-6,
+            err_msg=name,
+        )
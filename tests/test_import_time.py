@@ -0,0 +1,19 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_import_time_and_lazy_dependencies():
+    # Fresh interpreters, the modules of this one are already imported
+    result = subprocess.run(
+        [sys.executable, str(ROOT / "benchmarks" / "bench_import.py")]
+        + ["--runs", "7"],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(ROOT / "src")},
+    )
+
+    assert result.returncode == 0, result.stdout + result.stderr
@@ -0,0 +1,21 @@
+from accuweather_client.cache import LRULocationCache
+
+
+def test_options_are_part_of_the_key(server, make_client):
+    cache = LRULocationCache()
+
+    detailed = make_client(
+        location_key=None, city="oslo", location_cache=cache
+    )
+    basic = make_client(
+        location_key=None, city="oslo", location_cache=cache, details=False
+    )
+    german = make_client(
+        location_key=None, city="oslo", location_cache=cache, language="de-de"
+    )
+    again = make_client(location_key=None, city="Oslo ", location_cache=cache)
+
+    assert server.stats["search"] == 3
+    assert detailed.location.Details is not None
+    assert basic.location.Details is None
+    assert german.location_key == again.location_key == detailed.location_key
@@ -0,0 +1,45 @@
+import os
+
+from accuweather_client.clients import fetch_many_processes
+
+
+def crash_once(endpoint, model):
+    # Kills the worker process the first time, the marker file is shared by
+    # the workers of both pools
+    marker = os.environ["ACCUWEATHER_TEST_CRASH_MARKER"]
+    try:
+        os.remove(marker)
+    except FileNotFoundError:
+        return type(model).__name__
+    os._exit(1)
+
+
+def test_dead_worker_fails_its_chunks_only(
+    server, token, tmp_path, monkeypatch
+):
+    marker = tmp_path / "crash"
+    marker.touch()
+    monkeypatch.setenv("ACCUWEATHER_TEST_CRASH_MARKER", str(marker))
+    locations = [{"location_key": str(349727 + i)} for i in range(6)]
+
+    results = list(
+        fetch_many_processes(
+            locations,
+            token,
+            endpoints=["current"],
+            processes=1,
+            threads=1,
+            chunk_size=1,
+            cache_dir=str(tmp_path / "cache"),
+            transform=crash_once,
+            base_url=server.url,
+        )
+    )
+
+    failed = [result for result in results if not result.ok]
+    assert len(results) == 6
+    assert 1 <= len(failed) <= 2
+    assert all("BrokenProcessPool" in r.errors["location"] for r in failed)
+    assert {r.results["current"] for r in results if r.ok} == {
+        "CurrentConditionsModel"
+    }
@@ -0,0 +1,39 @@
+import pytest
+
+from accuweather_client.export.arrow import forecasts_to_table
+from accuweather_client.models import CompactHourlyForecast
+from accuweather_client.models.projection import Projection
+
+
+def test_exports_a_basic_forecast_with_nulls(make_client):
+    client = make_client(details=False)
+
+    forecast = client.get_hourly_forecast_12h()
+    table = forecasts_to_table([(client.location_key, forecast)], "hourly")
+
+    assert isinstance(forecast, Projection)
+    assert table.num_rows == 12
+    assert table.column("temperature").null_count == 0
+    assert table.column("real_feel_temperature").null_count == 12
+
+
+def test_exports_a_daily_projection(make_client):
+    client = make_client()
+
+    forecast = client.get_5day_forecast(
+        fields=["daily_forecasts.epoch_date", "daily_forecasts.temperature"]
+    )
+    table = forecasts_to_table([(client.location_key, forecast)], "daily")
+
+    assert table.num_rows == 5
+    assert table.column("temperature_max").null_count == 0
+    assert table.column("day_icon").null_count == 5
+
+
+def test_compact_form_rejects_projections(make_client):
+    client = make_client(details=False)
+
+    with pytest.raises(TypeError, match="projection"):
+        CompactHourlyForecast.from_model(client.get_hourly_forecast_12h())
+    full = make_client().get_hourly_forecast_12h()
+    assert CompactHourlyForecast.from_model(full).to_model() == full
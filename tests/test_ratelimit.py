@@ -0,0 +1,49 @@
+import pytest
+from requests.exceptions import RequestException
+
+from accuweather_client.http import (
+    QuotaExceededError,
+    RateLimiter,
+    RateLimitTimeoutError,
+    register_rate_limiter,
+    unregister_rate_limiter,
+)
+
+
+@pytest.fixture
+def limiter(token):
+    limiter = RateLimiter(rate=1000.0, burst=10, daily_quota=3, reserve=1)
+    register_rate_limiter(token, limiter)
+    yield limiter
+    unregister_rate_limiter(token)
+
+
+def test_quota_is_enforced_before_sending(server, make_client, limiter):
+    client = make_client()
+
+    client.get_current_conditions()
+    client.get_current_conditions()
+    with pytest.raises(RequestException) as error:
+        client.get_current_conditions()
+
+    assert isinstance(error.value.__cause__, QuotaExceededError)
+    assert server.stats["current"] == 2
+    assert limiter.metrics().rejected == 1
+
+
+def test_reserve_is_kept_for_high_priority(server, make_client, limiter):
+    make_client().get_current_conditions()
+    make_client().get_current_conditions()
+
+    make_client(priority=1).get_current_conditions()
+
+    assert server.stats["current"] == 3
+    assert limiter.metrics().remaining_today == 0
+
+
+def test_acquire_times_out_without_tokens():
+    limiter = RateLimiter(rate=0.01, burst=1)
+    limiter.acquire()
+
+    with pytest.raises(RateLimitTimeoutError):
+        limiter.acquire(timeout=0.05)
@@ -0,0 +1,63 @@
+import pytest
+from requests.exceptions import RequestException
+
+from accuweather_client.http import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    Transport,
+)
+
+
+def test_retries_after_rate_limited_response(server, make_client):
+    server.rate, server.burst = 50.0, 1
+    transport = Transport(
+        retry=RetryPolicy(max_retries=3, backoff_base=0.01), trust_env=False
+    )
+    client = make_client(transport=transport)
+
+    client.get_current_conditions()
+    client.get_current_conditions()
+
+    assert server.stats["rate_limited"] >= 1
+    assert transport.stats["retries"] == server.stats["rate_limited"]
+
+
+def test_gives_up_after_max_retries(server, make_client):
+    server.error_rate = 1.0
+    transport = Transport(
+        retry=RetryPolicy(max_retries=2, backoff_base=0.0), trust_env=False
+    )
+    client = make_client(transport=transport)
+
+    with pytest.raises(RequestException):
+        client.get_current_conditions()
+
+    assert server.stats["errors"] == 3
+    assert transport.stats["retries"] == 2
+
+
+def test_circuit_opens_and_recovers(server, make_client):
+    server.error_rate = 1.0
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60.0)
+    transport = Transport(
+        retry=RetryPolicy(max_retries=0),
+        circuit_breaker=breaker,
+        trust_env=False,
+    )
+    client = make_client(transport=transport)
+
+    for _ in range(2):
+        with pytest.raises(RequestException):
+            client.get_current_conditions()
+    assert breaker.state == "open"
+    with pytest.raises(RequestException) as error:
+        client.get_current_conditions()
+    assert isinstance(error.value.__cause__, CircuitOpenError)
+    assert server.stats["errors"] == 2
+
+    server.error_rate = 0.0
+    breaker.recovery_timeout = 0.0
+    assert breaker.state == "half-open"
+    client.get_current_conditions()
+    assert breaker.state == "closed"
@@ -0,0 +1,70 @@
+from accuweather_client.cache import ResponseCache, SQLiteResponseBackend
+
+
+def test_fresh_entry_is_served_without_a_request(server, make_client):
+    server.max_age = 60
+    cache = ResponseCache()
+    client = make_client(response_cache=cache)
+
+    first = client.get_5day_forecast()
+    second = client.get_5day_forecast()
+
+    assert first == second
+    assert server.stats["daily"] == 1
+    assert cache.stats["misses"] == 1
+    assert cache.stats["hits"] == 1
+
+
+def test_parameters_are_part_of_the_key(server, make_client):
+    server.max_age = 60
+    cache = ResponseCache()
+    client = make_client(response_cache=cache)
+
+    client.get_5day_forecast(metric=True)
+    client.get_5day_forecast(metric=False)
+
+    assert server.stats["daily"] == 2
+    assert cache.stats["misses"] == 2
+
+
+def test_stale_entry_is_revalidated(server, make_client):
+    cache = ResponseCache()
+    client = make_client(response_cache=cache)
+
+    first = client.get_current_conditions()
+    second = client.get_current_conditions()
+
+    assert first == second
+    assert server.stats["current"] == 2
+    assert cache.stats["revalidated"] == 1
+
+
+def test_revalidated_entry_keeps_the_original_max_age(server, make_client):
+    # The 304 responses of the mock server carry no Cache-Control, the
+    # max-age=0 of the first response still applies after revalidating
+    cache = ResponseCache()
+    client = make_client(response_cache=cache)
+
+    for _ in range(3):
+        client.get_current_conditions()
+
+    assert server.stats["current"] == 3
+    assert cache.stats["misses"] == 1
+    assert cache.stats["revalidated"] == 2
+    assert cache.stats["hits"] == 0
+
+
+def test_sqlite_backend_keeps_the_freshness_headers(tmp_path, make_client):
+    cache = ResponseCache(backend=SQLiteResponseBackend(tmp_path / "r.db"))
+    client = make_client(response_cache=cache)
+
+    for _ in range(3):
+        client.get_current_conditions()
+
+    assert cache.stats["revalidated"] == 2
+    key = ResponseCache.make_key(
+        "currentconditions/v1/",
+        client.location_key,
+        client.request_params(),
+    )
+    assert cache.backend.get(key).cache_control == "max-age=0"
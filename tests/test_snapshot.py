@@ -0,0 +1,34 @@
+import os
+
+import pytest
+
+from accuweather_client.export import SnapshotStore
+
+
+def _open_files():
+    return len(os.listdir("/proc/self/fd"))
+
+
+@pytest.mark.skipif(
+    not os.path.isdir("/proc/self/fd"), reason="counts open files in /proc"
+)
+def test_query_more_locations_than_the_mapping_cache(make_client, tmp_path):
+    forecast = make_client().get_hourly_forecast_12h()
+    store = SnapshotStore(str(tmp_path), max_maps=8)
+    keys = [str(key) for key in range(100)]
+    for key in keys:
+        store.append("hourly", key, forecast, issued=1)
+
+    before = _open_files()
+    for key in keys:
+        records = store.query("hourly", key)
+        assert len(records) == len(forecast.output)
+        del records
+
+    assert len(store._maps) == 8
+    assert list(store._maps) == [
+        store.path("hourly", key) for key in keys[-8:]
+    ]
+    assert _open_files() <= before + 8
+    # Evicted files are mapped again on demand
+    assert len(store.query("hourly", keys[0])) == len(forecast.output)
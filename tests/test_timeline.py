@@ -0,0 +1,31 @@
+def test_refresh_merges_new_rows(server, make_client):
+    client = make_client()
+
+    update = client.refresh_hourly_forecast(12)
+
+    timeline = client.timelines.get(client.location_key, "hourly")
+    assert len(update.added) == 12
+    assert len(timeline) == 12
+    assert update.epochs == [row.epoch_date_time for row in timeline.rows()]
+
+
+def test_unchanged_response_is_not_parsed(server, make_client):
+    client = make_client()
+
+    client.refresh_daily_forecast(5)
+    update = client.refresh_daily_forecast(5)
+
+    assert update.not_modified
+    assert not update.has_changes
+
+
+def test_longer_horizon_extends_the_timeline(server, make_client):
+    client = make_client()
+
+    client.refresh_hourly_forecast(12)
+    update = client.refresh_hourly_forecast(24)
+
+    timeline = client.timelines.get(client.location_key, "hourly")
+    assert len(update.added) == 12
+    assert update.unchanged == 12
+    assert len(timeline) == 24